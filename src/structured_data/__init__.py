@@ -1,3 +1,16 @@
 """Utilities for creating and destructuring data using algebraic data types."""
 
 __version__ = "0.13.0"
+
+__all__ = ["warmup"]
+
+
+def __getattr__(name: str):
+    # Importing warmup imports all of the dispatch machinery, so put it off
+    # until it's asked for.
+    if name == "warmup":
+        from ._warmup import warmup  # pylint: disable=import-outside-toplevel
+
+        globals()[name] = warmup
+        return warmup
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
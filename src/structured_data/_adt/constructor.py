@@ -60,6 +60,15 @@ class ADTConstructor:
     __ne__ = object.__ne__
     __hash__ = object.__hash__
 
+    def __reduce__(self) -> typing.Tuple[typing.Callable, typing.Tuple]:
+        # Pickle by the class reference and the field values, bypassing any
+        # validation in __new__.
+        return _unpickle, (self.__class__, tuple.__getitem__(self, slice(None)))
+
+
+def _unpickle(cls: typing.Type[_T], values: tuple) -> _T:
+    return tuple.__new__(cls, values)  # type: ignore
+
 
 SHADOWED_ATTRIBUTES = {
     "__add__",
@@ -123,6 +132,7 @@ def make_constructor(
     ADT_BASES[Constructor] = _cls
 
     Constructor.__name__ = name
+    Constructor.__module__ = _cls.__module__
     Constructor.__qualname__ = "{qualname}.{name}".format(
         qualname=_cls.__qualname__, name=name
     )
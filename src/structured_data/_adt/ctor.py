@@ -9,6 +9,8 @@ import weakref
 
 import astor  # type: ignore
 
+from . import metadata_cache
+
 _CTOR_CACHE: typing.Dict[typing.Tuple, "Ctor"] = {}
 
 
@@ -92,44 +94,52 @@ def _checked_eval(
         return None
 
 
-NO_VALUE = object()
+# How to interpret a string annotation, which doesn't depend on the module's
+# globals, so it can be cached: the code for the subscripted name, or None if
+# the annotation isn't a subscript; what the subscript holds; and the code for
+# the whole annotation. All three are None if the annotation doesn't parse.
+Plan = typing.Tuple[
+    typing.Optional[types.CodeType], typing.Any, typing.Optional[types.CodeType]
+]
 
+INVALID: Plan = (None, None, None)
 
-def _extract_tuple_ast(
-    constructor: str, global_ns: typing.Dict[str, typing.Any]
-) -> typing.Optional[typing.Tuple]:
-    ctor_ast = _parse_constructor(constructor)
-    value = index = NO_VALUE
-    if isinstance(ctor_ast.body, ast.Subscript) and isinstance(
-        ctor_ast.body.slice, ast.Index
-    ):
-        index = ctor_ast.body.slice.value
-        ctor_ast.body = ctor_ast.body.value
-        value = _checked_eval(compile(ctor_ast, "<annotation>", "eval"), global_ns)
-    if value is Ctor:
-        # If value is Ctor, then value was set, which is only possible if the
-        # previous block executed, which will set "index" to an AST.
-        return _get_args_from_index(typing.cast(ast.AST, index))
-    if value is None:
-        return None
-    return _interpret_args_from_non_string(_checked_eval(constructor, global_ns))
 
-
-def _str_is_classvar(annotation: str, global_ns: typing.Dict[str, typing.Any]) -> bool:
-    annotation_ast = _parse_constructor(annotation)
-    value = NO_VALUE
+def _subscript_plan(
+    annotation: str, read_index: typing.Callable[[ast.AST], typing.Any]
+) -> Plan:
+    try:
+        annotation_ast = _parse_constructor(annotation)
+    except ValueError:
+        return INVALID
+    head = index = None
     if isinstance(annotation_ast.body, ast.Subscript) and isinstance(
         annotation_ast.body.slice, ast.Index
     ):
+        index = read_index(annotation_ast.body.slice.value)
         annotation_ast.body = annotation_ast.body.value
-        value = _checked_eval(
-            compile(annotation_ast, "<annotation>", "eval"), global_ns
-        )
-    if value is typing.ClassVar:
-        return True
-    if value is None:
-        return False
-    return _interpret_classvar_from_non_string(_checked_eval(annotation, global_ns))
+        head = compile(annotation_ast, "<annotation>", "eval")
+    return (head, index, compile(annotation, "<annotation>", "eval"))
+
+
+def _args_plan(constructor: str) -> Plan:
+    return _subscript_plan(constructor, _get_args_from_index)
+
+
+def _classvar_plan(annotation: str) -> Plan:
+    return _subscript_plan(annotation, lambda index: None)
+
+
+def _get_plan(
+    kind: str, annotation: str, global_ns: typing.Dict[str, typing.Any]
+) -> Plan:
+    store = metadata_cache.store_for(global_ns)
+    plan = None if store is None else store.get(kind, annotation)
+    if plan is None:
+        plan = (_args_plan if kind == "args" else _classvar_plan)(annotation)
+        if store is not None:
+            store.put(kind, annotation, plan)
+    return plan
 
 
 def get_args(
@@ -143,10 +153,16 @@ def get_args(
     if not, it returns ``None``.
     """
     if isinstance(constructor, str):
-        try:
-            return _extract_tuple_ast(constructor, global_ns)
-        except ValueError:
+        head, args, whole = _get_plan("args", constructor, global_ns)
+        if whole is None:
             return None
+        if head is not None:
+            value = _checked_eval(head, global_ns)
+            if value is Ctor:
+                return args
+            if value is None:
+                return None
+        return _interpret_args_from_non_string(_checked_eval(whole, global_ns))
     return _interpret_args_from_non_string(constructor)
 
 
@@ -161,8 +177,14 @@ def annotation_is_classvar(
     If not, it returns ``False``.
     """
     if isinstance(annotation, str):
-        try:
-            return _str_is_classvar(annotation, global_ns)
-        except ValueError:
+        head, _, whole = _get_plan("classvar", annotation, global_ns)
+        if whole is None:
             return False
+        if head is not None:
+            value = _checked_eval(head, global_ns)
+            if value is typing.ClassVar:
+                return True
+            if value is None:
+                return False
+        return _interpret_classvar_from_non_string(_checked_eval(whole, global_ns))
     return _interpret_classvar_from_non_string(annotation)
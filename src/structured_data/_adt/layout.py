@@ -0,0 +1,113 @@
+"""Helpers for inspecting the field layout of ADT classes."""
+
+import sys
+import typing
+
+from . import constructor
+from . import prewritten_methods
+from . import product_type
+
+
+def is_sum_base(cls: type) -> bool:
+    """Return whether the class is a processed ``Sum`` subclass."""
+    return cls in prewritten_methods.SUBCLASS_ORDER
+
+
+def is_constructor(cls: type) -> bool:
+    """Return whether the class is a constructor of some ``Sum`` subclass."""
+    return cls in constructor.ADT_BASES
+
+
+def is_product(cls: type) -> bool:
+    """Return whether the class is a concrete ``Product`` subclass."""
+    return (
+        isinstance(cls, type)
+        and issubclass(cls, product_type.Product)
+        and cls is not product_type.Product
+    )
+
+
+def constructors(cls: type) -> typing.Tuple[type, ...]:
+    """Return the constructors of a ``Sum`` subclass, in definition order."""
+    try:
+        return prewritten_methods.SUBCLASS_ORDER[cls]
+    except KeyError:
+        raise TypeError(f"{cls!r} is not a Sum subclass")
+
+
+def field_names(cls: type) -> typing.Tuple[str, ...]:
+    """Return the field names of a constructor or ``Product`` subclass.
+
+    Constructor fields are named positionally, the same way as in the
+    constructor's signature: ``_0``, ``_1``, and so on.
+    """
+    if is_constructor(cls):
+        return tuple(name for name in cls.__new__.__annotations__ if name != "return")
+    if is_product(cls):
+        return tuple(vars(cls).get("_Product__fields", ()))
+    raise TypeError(f"{cls!r} is not an ADT constructor or Product subclass")
+
+
+def field_annotations(cls: type) -> typing.Tuple[typing.Any, ...]:
+    """Return the field annotations of a constructor or ``Product`` subclass.
+
+    String annotations are returned unevaluated; see ``resolve``.
+    """
+    if is_constructor(cls):
+        return tuple(
+            annotation
+            for (name, annotation) in cls.__new__.__annotations__.items()
+            if name != "return"
+        )
+    if is_product(cls):
+        signature = vars(cls)["_Product__signature"]
+        return tuple(
+            parameter.annotation
+            for parameter in signature.parameters.values()
+            if parameter.name in vars(cls)["_Product__fields"]
+        )
+    raise TypeError(f"{cls!r} is not an ADT constructor or Product subclass")
+
+
+def resolve(annotation: typing.Any, cls: type) -> typing.Any:
+    """Evaluate a string annotation from ``cls``'s fields, if possible.
+
+    Annotations are evaluated in the namespace of the module that defined the
+    ADT, with the ADT's own name bound, so self-referential annotations
+    resolve. If evaluation fails, return ``typing.Any``.
+    """
+    if isinstance(annotation, typing.ForwardRef):
+        annotation = annotation.__forward_arg__
+    if not isinstance(annotation, str):
+        return annotation
+    try:
+        owner = constructor.ADT_BASES.get(cls, cls)
+        module = sys.modules.get(owner.__module__)
+        global_ns = vars(module) if module is not None else {}
+        # The annotation was written by the ADT's author.
+        return eval(  # pylint: disable=eval-used
+            annotation, global_ns, {owner.__name__: owner}
+        )
+    except Exception:  # pylint: disable=broad-except
+        return typing.Any
+
+
+def rebuild(cls: typing.Type[tuple], values: typing.Iterable) -> typing.Any:
+    """Create an instance of an ADT class directly from its field values.
+
+    This bypasses ``__new__``, so it is only suitable for values that came out
+    of an instance that was already constructed normally.
+    """
+    return tuple.__new__(cls, values)
+
+
+__all__ = [
+    "constructors",
+    "field_annotations",
+    "field_names",
+    "is_constructor",
+    "is_product",
+    "is_sum_base",
+    "rebuild",
+    "resolve",
+]
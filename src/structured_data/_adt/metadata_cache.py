@@ -0,0 +1,135 @@
+"""An optional on-disk cache of how ADT annotations are interpreted.
+
+Interpreting a string annotation means parsing and compiling it. When the
+cache is enabled, the outcome for each module is stored alongside its
+bytecode, and reused when the module is next imported, as long as its source,
+the Python implementation, and this library's version are unchanged.
+"""
+
+import atexit
+import importlib.util
+import marshal
+import os
+import sys
+import typing
+
+from .. import __version__
+
+_SUFFIX = ".sdmeta"
+
+Key = typing.Tuple[str, str, int]
+
+
+class Store:
+    """The cached interpretations of one module's annotations."""
+
+    def __init__(self, path: str, key: Key) -> None:
+        self.path = path
+        self.key = key
+        self.entries: typing.Dict[typing.Tuple[str, str], typing.Any] = {}
+        self.dirty = False
+        try:
+            with open(path, "rb") as file:
+                data = marshal.load(file)
+        except (OSError, EOFError, ValueError, TypeError):
+            return
+        if isinstance(data, tuple) and len(data) == 2 and data[0] == key:
+            self.entries = data[1]
+
+    def get(self, kind: str, annotation: str) -> typing.Any:
+        """Return the stored entry, or ``None``."""
+        return self.entries.get((kind, annotation))
+
+    def put(self, kind: str, annotation: str, entry: typing.Any) -> None:
+        """Store an entry, to be written out by ``save``."""
+        self.entries[(kind, annotation)] = entry
+        self.dirty = True
+
+    def save(self) -> None:
+        """Write the entries to disk, if they changed. Failure is ignored."""
+        if not self.dirty:
+            return
+        temporary = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(temporary, "wb") as file:
+                marshal.dump((self.key, self.entries), file)
+            os.replace(temporary, self.path)
+        except OSError:
+            return
+        self.dirty = False
+
+
+_directory: typing.Optional[str] = None
+_enabled = False
+_registered = False
+# None for modules that can't be cached.
+_STORES: typing.Dict[str, typing.Optional[Store]] = {}
+
+
+def enable(directory: typing.Optional[str] = None) -> None:
+    """Start caching, for ADTs defined in modules imported from now on.
+
+    By default, each module's cache is written to the ``__pycache__``
+    directory that holds its bytecode. If ``directory`` is given, all of the
+    caches are written there instead. Caches are written when the interpreter
+    exits, or when ``disable`` is called.
+    """
+    global _directory, _enabled, _registered  # pylint: disable=global-statement
+    if _enabled and directory != _directory:
+        disable()
+    _directory = directory
+    _enabled = True
+    if not _registered:
+        atexit.register(save)
+        _registered = True
+
+
+def disable() -> None:
+    """Write out any changes, and stop caching."""
+    global _enabled  # pylint: disable=global-statement
+    save()
+    _STORES.clear()
+    _enabled = False
+
+
+def save() -> None:
+    """Write out every cache that changed."""
+    for store in list(_STORES.values()):
+        if store is not None:
+            store.save()
+
+
+def _path(name: str, filename: str) -> str:
+    if _directory is None:
+        return os.path.splitext(importlib.util.cache_from_source(filename))[0] + _SUFFIX
+    return os.path.join(_directory, f"{name}.{sys.implementation.cache_tag}{_SUFFIX}")
+
+
+def _make_store(name: str, filename: typing.Optional[str]) -> typing.Optional[Store]:
+    if filename is None or sys.implementation.cache_tag is None:
+        return None
+    try:
+        with open(filename, "rb") as file:
+            source = file.read()
+    except OSError:
+        return None
+    key = (
+        __version__,
+        sys.implementation.cache_tag,
+        int.from_bytes(importlib.util.source_hash(source), "little"),
+    )
+    return Store(_path(name, filename), key)
+
+
+def store_for(global_ns: typing.Dict[str, typing.Any]) -> typing.Optional[Store]:
+    """Return the store for the module with the given namespace, if caching."""
+    if not _enabled:
+        return None
+    name = global_ns.get("__name__")
+    if name is None:
+        return None
+    try:
+        return _STORES[name]
+    except KeyError:
+        return _STORES.setdefault(name, _make_store(name, global_ns.get("__file__")))
@@ -0,0 +1,66 @@
+"""Copying ADT instances with some fields changed."""
+
+import typing
+import weakref
+
+from .._unpack import unpack
+from . import layout
+
+_T = typing.TypeVar("_T")
+
+_FIELD_INDEXES: typing.MutableMapping[
+    type, typing.Dict[str, int]
+] = weakref.WeakKeyDictionary()
+
+
+def field_indexes(cls: type) -> typing.Dict[str, int]:
+    """Return a mapping from a class's field names to their positions."""
+    try:
+        return _FIELD_INDEXES[cls]
+    except KeyError:
+        pass
+    indexes = {name: index for (index, name) in enumerate(layout.field_names(cls))}
+    return _FIELD_INDEXES.setdefault(cls, indexes)
+
+
+def _index(cls: type, name: str) -> int:
+    try:
+        return field_indexes(cls)[name]
+    except KeyError:
+        raise TypeError(f"{cls.__qualname__} has no field {name!r}") from None
+
+
+def replace(instance: _T, /, **changes: typing.Any) -> _T:  # noqa: E225
+    """Return a copy of an ADT instance, with the given fields changed.
+
+    Fields are named as in the class's signature: Product fields by their
+    annotated names, and Sum constructor fields positionally, as ``_0``,
+    ``_1``, and so on. The copy is built directly from the instance's fields,
+    so it isn't passed through the class's ``__new__``, and nothing is
+    revalidated.
+    """
+    cls = type(instance)
+    values = list(unpack(typing.cast(tuple, instance)))
+    for name, value in changes.items():
+        values[_index(cls, name)] = value
+    return layout.rebuild(cls, values)
+
+
+def replace_in(instance: _T, path: str, value: typing.Any) -> _T:
+    """Return a copy of an ADT instance, with a nested field changed.
+
+    ``path`` is a dotted sequence of field names, as for ``replace``. Only the
+    instances along the path are copied; everything else is shared.
+    """
+    names = path.split(".")
+    spine: typing.List[typing.Tuple[tuple, int]] = []
+    node = typing.cast(tuple, instance)
+    for name in names:
+        index = _index(type(node), name)
+        spine.append((node, index))
+        node = unpack(node)[index]
+    for node, index in reversed(spine):
+        values = list(unpack(node))
+        values[index] = value
+        value = layout.rebuild(type(node), values)
+    return value
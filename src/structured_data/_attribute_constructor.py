@@ -20,7 +20,9 @@ class AttributeConstructor(typing.Generic[T]):
         ATTRIBUTE_CACHE[self] = {}
 
     def __getattribute__(self, name: str) -> T:
-        name = sys.intern(name)
-        return ATTRIBUTE_CACHE[self].setdefault(
-            name, ATTRIBUTE_CONSTRUCTORS[self](name)
-        )
+        cache = ATTRIBUTE_CACHE[self]
+        try:
+            return cache[name]
+        except KeyError:
+            name = sys.intern(name)
+            return cache.setdefault(name, ATTRIBUTE_CONSTRUCTORS[self](name))
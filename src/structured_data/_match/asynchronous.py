@@ -0,0 +1,52 @@
+"""Running dispatch functions that return coroutines."""
+
+import asyncio
+import typing
+
+T = typing.TypeVar("T")
+R = typing.TypeVar("R")
+
+
+async def _gather(awaitables: typing.Iterable[typing.Awaitable]) -> typing.List:
+    """Run the awaitables as tasks, cancelling the rest if any raises."""
+    tasks = [asyncio.ensure_future(awaitable) for awaitable in awaitables]
+    try:
+        return list(await asyncio.gather(*tasks))
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def gather_dispatch(
+    func: typing.Callable[[T], typing.Awaitable[R]],
+    items: typing.Iterable[T],
+    *,
+    limit: typing.Optional[int] = None,
+) -> typing.List[R]:
+    """Await ``func(item)`` for each item, and return the results in order.
+
+    ``func`` is typically a ``match.function`` that decorates an
+    ``async def``. Calling it picks the implementation without awaiting
+    anything, so only the chosen coroutine is scheduled.
+
+    If ``limit`` is given, at most that many coroutines run at once, and the
+    items are consumed as earlier coroutines finish. If any coroutine raises,
+    the rest are cancelled, and the exception propagates.
+    """
+    if limit is None:
+        return await _gather(map(func, items))
+    if limit < 1:
+        raise ValueError(limit)
+    results: typing.Dict[int, R] = {}
+    pending = enumerate(items)
+
+    async def worker() -> None:
+        # The workers share the iterator, so each item is taken exactly once.
+        for index, item in pending:
+            results[index] = await func(item)
+
+    await _gather(worker() for _ in range(limit))
+    return [results[index] for index in range(len(results))]
+
+
+__all__ = ["gather_dispatch"]
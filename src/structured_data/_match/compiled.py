@@ -0,0 +1,211 @@
+"""Matchers compiled from targets ahead of time.
+
+``match_dict.match`` interprets a target every time it's used, finding a
+destructurer for each part of it. Compiling a target does that once, and
+produces a function that checks a value against it, and records the bindings.
+"""
+
+import typing
+
+from .._adt.constructor import ADTConstructor
+from .._unpack import unpack
+from . import destructure
+from . import match_dict
+from .match_failure import MatchFailure
+from .patterns.basic_patterns import DISCARD
+from .patterns.basic_patterns import AsPattern
+from .patterns.basic_patterns import Pattern
+from .patterns.bind import Bind
+from .patterns.compound_match import CompoundMatch
+from .patterns.mapping_match import AttrPattern
+from .patterns.mapping_match import DictPattern
+from .patterns.type_match import InstanceOf
+
+Bindings = typing.Dict[str, typing.Any]
+# Returns whether the value matched, adding any bindings to the dict.
+Matcher = typing.Callable[[typing.Any, Bindings], bool]
+
+
+def _discard(value: typing.Any, bindings: Bindings) -> bool:
+    del value, bindings
+    return True
+
+
+def _bind(name: str) -> Matcher:
+    def match(value: typing.Any, bindings: Bindings) -> bool:
+        bindings[name] = value
+        return True
+
+    return match
+
+
+def _as_pattern(target: AsPattern) -> Matcher:
+    name = target.pattern.name
+    structure = _compile(target.structure)
+
+    def match(value: typing.Any, bindings: Bindings) -> bool:
+        bindings[name] = value
+        return structure(value, bindings)
+
+    return match
+
+
+def _bind_pattern(target: Bind) -> Matcher:
+    structure = _compile(target.structure)
+    extra = target.bindings
+
+    def match(value: typing.Any, bindings: Bindings) -> bool:
+        if not structure(value, bindings):
+            return False
+        bindings.update(extra)
+        return True
+
+    return match
+
+
+def _attr_pattern(target: AttrPattern) -> Matcher:
+    attributes = [(name, _compile(structure)) for (name, structure) in target[0]]
+    generic = _generic(target)
+
+    def match(value: typing.Any, bindings: Bindings) -> bool:
+        if isinstance(value, AttrPattern):
+            return generic(value, bindings)
+        for name, structure in attributes:
+            try:
+                attribute = getattr(value, name)
+            except AttributeError:
+                return False
+            if not structure(attribute, bindings):
+                return False
+        return True
+
+    return match
+
+
+def _dict_pattern(target: DictPattern) -> Matcher:
+    keys = [(key, _compile(structure)) for (key, structure) in target.match_dict]
+    exhaustive = target.exhaustive
+    length = len(keys)
+    generic = _generic(target)
+
+    def match(value: typing.Any, bindings: Bindings) -> bool:
+        if isinstance(value, DictPattern):
+            return generic(value, bindings)
+        if exhaustive and len(value) != length:
+            return False
+        for key, structure in keys:
+            try:
+                item = value[key]
+            except KeyError:
+                return False
+            if not structure(item, bindings):
+                return False
+        return True
+
+    return match
+
+
+def _instance_of(target: InstanceOf) -> Matcher:
+    type_ = target.type
+    structure = _compile(target.structure)
+
+    def match(value: typing.Any, bindings: Bindings) -> bool:
+        if not issubclass(type(value), type_):
+            return False
+        return structure(value, bindings)
+
+    return match
+
+
+def _adt(target: tuple) -> Matcher:
+    cls = target.__class__
+    fields = [
+        (index, _compile(field))
+        for (index, field) in enumerate(unpack(target))
+        if field is not DISCARD
+    ]
+
+    def match(value: typing.Any, bindings: Bindings) -> bool:
+        if value.__class__ is not cls:
+            return False
+        values = unpack(value)
+        for index, field in fields:
+            if not field(values[index], bindings):
+                return False
+        return True
+
+    return match
+
+
+def _tuple(target: tuple) -> Matcher:
+    cls = target.__class__
+    length = len(target)
+    items = [(index, _compile(item)) for (index, item) in enumerate(target)]
+
+    def match(value: typing.Any, bindings: Bindings) -> bool:
+        if isinstance(value, ADTConstructor) or not isinstance(value, cls):
+            return False
+        if len(value) != length:
+            return False
+        for index, item in items:
+            if not item(value[index], bindings):
+                return False
+        return True
+
+    return match
+
+
+def _literal(target: typing.Any) -> Matcher:
+    def match(value: typing.Any, bindings: Bindings) -> bool:
+        del bindings
+        if target != value:
+            return False
+        return True
+
+    return match
+
+
+def _generic(target: typing.Any) -> Matcher:
+    def match(value: typing.Any, bindings: Bindings) -> bool:
+        try:
+            bindings.update(match_dict.match(target, value).data)
+        except MatchFailure:
+            return False
+        return True
+
+    return match
+
+
+_COMPOUND: typing.Dict[type, typing.Callable[[typing.Any], Matcher]] = {
+    AsPattern: _as_pattern,
+    Bind: _bind_pattern,
+    AttrPattern: _attr_pattern,
+    DictPattern: _dict_pattern,
+    InstanceOf: _instance_of,
+}
+
+
+def _compile(target: typing.Any) -> Matcher:
+    if target is DISCARD:
+        return _discard
+    if isinstance(target, Pattern):
+        return _bind(target.name)
+    if isinstance(target, CompoundMatch):
+        return _COMPOUND.get(target.__class__, _generic)(target)
+    if isinstance(target, ADTConstructor):
+        return _adt(target)
+    destructurer = destructure.DESTRUCTURERS.get_destructurer(target)
+    if isinstance(destructurer, destructure.TupleDestructurer):
+        return _tuple(target)
+    if destructurer is not None:
+        return _generic(target)
+    return _literal(target)
+
+
+def compile_target(target: typing.Any) -> Matcher:
+    """Return a function that matches values against the target.
+
+    Raise ``ValueError`` if the target binds a name more than once.
+    """
+    destructure.names(target)
+    return _compile(target)
@@ -0,0 +1,213 @@
+"""Bounded caches for dispatch results."""
+
+import collections
+import threading
+import typing
+
+from ..._adt import constructor
+
+CacheInfo = collections.namedtuple(
+    "CacheInfo", ["hits", "misses", "maxsize", "currsize"]
+)
+
+MISSING = object()
+
+
+class Policy:
+    """Base class for caches with a maximum size and hit and miss counts."""
+
+    def __init__(self, maxsize: int = 128) -> None:
+        if maxsize < 1:
+            raise ValueError(maxsize)
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.maxsize!r})"
+
+    def get(self, key: typing.Hashable) -> typing.Any:
+        """Return the value for the key, or ``MISSING``."""
+        with self._lock:
+            value = self._lookup(key)
+            if value is MISSING:
+                self._misses += 1
+            else:
+                self._hits += 1
+            return value
+
+    def put(self, key: typing.Hashable, value: typing.Any) -> None:
+        """Store a value, evicting another entry if the cache is full."""
+        with self._lock:
+            self._store(key, value)
+
+    def info(self) -> CacheInfo:
+        """Return the hit and miss counts, and the maximum and current sizes."""
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self.maxsize, self._size())
+
+    def clear(self) -> None:
+        """Remove every entry, and reset the counts."""
+        with self._lock:
+            self._reset()
+            self._hits = 0
+            self._misses = 0
+
+    def _lookup(self, key: typing.Hashable) -> typing.Any:
+        raise NotImplementedError
+
+    def _store(self, key: typing.Hashable, value: typing.Any) -> None:
+        raise NotImplementedError
+
+    def _size(self) -> int:
+        raise NotImplementedError
+
+    def _reset(self) -> None:
+        raise NotImplementedError
+
+
+class LRU(Policy):
+    """A cache that evicts the least recently used entry when it's full."""
+
+    def __init__(self, maxsize: int = 128) -> None:
+        super().__init__(maxsize)
+        self._entries: typing.MutableMapping[
+            typing.Hashable, typing.Any
+        ] = collections.OrderedDict()
+
+    def _lookup(self, key: typing.Hashable) -> typing.Any:
+        value = self._entries.get(key, MISSING)
+        if value is not MISSING:
+            self._entries.move_to_end(key)  # type: ignore
+        return value
+
+    def _store(self, key: typing.Hashable, value: typing.Any) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)  # type: ignore
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)  # type: ignore
+
+    def _size(self) -> int:
+        return len(self._entries)
+
+    def _reset(self) -> None:
+        self._entries.clear()
+
+
+class LFU(Policy):
+    """A cache that evicts the least frequently used entry when it's full.
+
+    Among entries used equally often, the least recently used is evicted.
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        super().__init__(maxsize)
+        # Each entry is [value, uses]
+        self._entries: typing.Dict[typing.Hashable, typing.List] = {}
+        # The keys with each number of uses, least recently used first
+        self._uses: typing.Dict[int, typing.MutableMapping] = {}
+        self._fewest = 0
+
+    def _touch(self, key: typing.Hashable, entry: typing.List) -> None:
+        uses = entry[1]
+        keys = self._uses[uses]
+        del keys[key]
+        if not keys:
+            del self._uses[uses]
+            if self._fewest == uses:
+                self._fewest = uses + 1
+        entry[1] = uses + 1
+        self._uses.setdefault(uses + 1, collections.OrderedDict())[key] = None
+
+    def _lookup(self, key: typing.Hashable) -> typing.Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return MISSING
+        self._touch(key, entry)
+        return entry[0]
+
+    def _store(self, key: typing.Hashable, value: typing.Any) -> None:
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry[0] = value
+            self._touch(key, entry)
+            return
+        if len(self._entries) >= self.maxsize:
+            keys = self._uses[self._fewest]
+            evicted, _ = keys.popitem(last=False)  # type: ignore
+            if not keys:
+                del self._uses[self._fewest]
+            del self._entries[evicted]
+        self._entries[key] = [value, 1]
+        self._uses.setdefault(1, collections.OrderedDict())[key] = None
+        self._fewest = 1
+
+    def _size(self) -> int:
+        return len(self._entries)
+
+    def _reset(self) -> None:
+        self._entries.clear()
+        self._uses.clear()
+        self._fewest = 0
+
+
+class _Identity:
+    """A key part that compares an ADT instance by identity."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: typing.Any) -> None:
+        self.value = value
+
+    def __hash__(self) -> int:
+        return id(self.value)
+
+    def __eq__(self, other: object) -> bool:
+        return other.__class__ is _Identity and other.value is self.value  # type: ignore
+
+
+_KWARGS = object()
+
+
+def _part(arg: typing.Any) -> typing.Any:
+    if isinstance(arg, constructor.ADTConstructor):
+        return _Identity(arg)
+    return arg
+
+
+def make_key(
+    args: typing.Tuple, kwargs: typing.Dict[str, typing.Any]
+) -> typing.Optional[typing.Hashable]:
+    """Return a cache key for the arguments, or ``None`` if they're unhashable.
+
+    ADT instances are compared by identity: they're immutable, and hashing
+    one takes time proportional to its size, which would defeat the point of
+    caching recursive functions over them. The key holds a reference to each
+    instance, so their ids aren't reused while the key is in a cache.
+    """
+    key: typing.Tuple = tuple(map(_part, args))
+    if kwargs:
+        key += (_KWARGS,) + tuple((name, _part(arg)) for (name, arg) in kwargs.items())
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def memoized(
+    memo: Policy,
+    func: typing.Callable,
+    args: typing.Tuple,
+    kwargs: typing.Dict[str, typing.Any],
+) -> typing.Any:
+    """Return ``func(*args, **kwargs)``, using and updating ``memo``."""
+    key = make_key(args, kwargs)
+    if key is None:
+        return func(*args, **kwargs)
+    result = memo.get(key)
+    if result is MISSING:
+        result = func(*args, **kwargs)
+        memo.put(key, result)
+    return result
@@ -0,0 +1,159 @@
+"""Precomputed argument handling for dispatch functions.
+
+Dispatching needs to bind each call to the wrapped function's signature, and
+then pass the resulting bindings to the chosen implementation. Doing that with
+``inspect`` on every call is slow, so the relevant parts of each signature are
+extracted once, into plans.
+"""
+
+import inspect
+import typing
+import weakref
+
+Kwargs = typing.Dict[str, typing.Any]
+
+_EMPTY = inspect.Parameter.empty
+_POSITIONAL_ONLY = inspect.Parameter.POSITIONAL_ONLY
+_VAR_POSITIONAL = inspect.Parameter.VAR_POSITIONAL
+_KEYWORD_ONLY = inspect.Parameter.KEYWORD_ONLY
+_VAR_KEYWORD = inspect.Parameter.VAR_KEYWORD
+
+
+def _missing(name: str) -> TypeError:
+    return TypeError(f"missing a required argument: {name!r}")
+
+
+class CallPlan:
+    """How to bind calls to a dispatch function.
+
+    Binding gives the same result as ``Signature.bind`` followed by
+    ``BoundArguments.apply_defaults``, split into the extra positional
+    arguments, the extra keyword arguments, and the named arguments.
+    """
+
+    __slots__ = (
+        "wrapped",
+        "positional",
+        "keyword_only",
+        "var_positional",
+        "var_keyword",
+    )
+
+    def __init__(self, wrapped: typing.Callable) -> None:
+        self.wrapped = wrapped
+        self.positional: typing.List[typing.Tuple[str, typing.Any, bool]] = []
+        self.keyword_only: typing.List[typing.Tuple[str, typing.Any]] = []
+        self.var_positional = False
+        self.var_keyword = False
+        for parameter in inspect.signature(wrapped).parameters.values():
+            kind = parameter.kind
+            if kind is _VAR_POSITIONAL:
+                self.var_positional = True
+            elif kind is _VAR_KEYWORD:
+                self.var_keyword = True
+            elif kind is _KEYWORD_ONLY:
+                self.keyword_only.append((parameter.name, parameter.default))
+            else:
+                self.positional.append(
+                    (parameter.name, parameter.default, kind is _POSITIONAL_ONLY)
+                )
+
+    def bind(
+        self, args: typing.Tuple, kwargs: Kwargs
+    ) -> typing.Tuple[typing.Tuple, Kwargs, Kwargs]:
+        """Bind a call, and return the extra args, extra kwargs, and values."""
+        positional = self.positional
+        count = len(args)
+        arity = len(positional)
+        if count > arity and not self.var_positional:
+            raise TypeError("too many positional arguments")
+        extra = dict(kwargs)
+        values: Kwargs = {}
+        for index, (name, default, positional_only) in enumerate(positional):
+            if index < count:
+                if name in extra and not positional_only:
+                    raise TypeError(f"multiple values for argument {name!r}")
+                values[name] = args[index]
+            elif name in extra and not positional_only:
+                values[name] = extra.pop(name)
+            elif default is _EMPTY:
+                raise _missing(name)
+            else:
+                values[name] = default
+        for name, default in self.keyword_only:
+            if name in extra:
+                values[name] = extra.pop(name)
+            elif default is _EMPTY:
+                raise _missing(name)
+            else:
+                values[name] = default
+        if extra and not self.var_keyword:
+            raise TypeError(f"got an unexpected keyword argument {next(iter(extra))!r}")
+        return args[arity:], extra, values
+
+
+def descriptor_plan(descriptor: typing.Any) -> CallPlan:
+    """Return the plan for a descriptor's ``__wrapped__`` function.
+
+    The plan is cached on the descriptor, and rebuilt if ``__wrapped__`` is
+    replaced.
+    """
+    plan = vars(descriptor).get("_call_plan")
+    wrapped = descriptor.__wrapped__
+    if plan is None or plan.wrapped is not wrapped:
+        plan = vars(descriptor)["_call_plan"] = CallPlan(wrapped)
+    return plan
+
+
+class ImplementationPlan:
+    """How to call an implementation with the bindings from a match."""
+
+    __slots__ = ("func", "leading")
+
+    def __init__(self, func: typing.Callable) -> None:
+        self.func = func
+        # Implementations are called by keyword, unless they take *args. Then,
+        # the parameters before *args have to be passed by position.
+        self.leading: typing.Optional[typing.List[typing.Tuple[str, typing.Any]]]
+        self.leading = None
+        leading = []
+        for parameter in inspect.signature(func).parameters.values():
+            if parameter.kind is _VAR_POSITIONAL:
+                self.leading = leading
+                break
+            leading.append((parameter.name, parameter.default))
+
+    def call(
+        self, matches: typing.Mapping, bound_args: typing.Tuple, bound_kwargs: Kwargs
+    ) -> typing.Any:
+        """Call the implementation with the matches and extra arguments."""
+        if not bound_kwargs.keys().isdisjoint(matches):
+            raise TypeError
+        bound_kwargs.update(matches)
+        if self.leading is None:
+            return self.func(**bound_kwargs)
+        args = []
+        for name, default in self.leading:
+            if name in bound_kwargs:
+                args.append(bound_kwargs.pop(name))
+            elif default is _EMPTY:
+                raise _missing(name)
+            else:
+                args.append(default)
+        return self.func(*args, *bound_args, **bound_kwargs)
+
+
+_IMPLEMENTATION_PLANS: typing.MutableMapping[
+    typing.Callable, ImplementationPlan
+] = weakref.WeakKeyDictionary()
+
+
+def implementation_plan(func: typing.Callable) -> ImplementationPlan:
+    """Return the plan for calling an implementation."""
+    try:
+        return _IMPLEMENTATION_PLANS[func]
+    except KeyError:
+        return _IMPLEMENTATION_PLANS.setdefault(func, ImplementationPlan(func))
+    except TypeError:
+        # Not weakly referenceable, so it can't be cached.
+        return ImplementationPlan(func)
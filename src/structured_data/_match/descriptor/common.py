@@ -3,11 +3,19 @@
 from __future__ import annotations
 
 import functools
+import importlib
+import inspect
+import pickle
+import threading
 import typing
+import weakref
 
 from ... import _class_placeholder
 from ..._adt import prewritten_methods
 from .. import destructure
+from . import cache
+from . import call_plan
+from . import literal_dispatch
 
 T = typing.TypeVar("T")  # pylint: disable=invalid-name
 
@@ -25,43 +33,79 @@ def _apply(structure: Matcher[T], base: typing.Optional[type]) -> T:
     return non_placeholder
 
 
+Matchers = typing.Tuple[typing.Tuple[T, typing.Callable], ...]
+Compiled = typing.Tuple[Matchers[T], typing.Optional[literal_dispatch.LiteralTable]]
+
+
+def _compile(matchers: Matchers[T]) -> Compiled[T]:
+    return matchers, literal_dispatch.build(matchers)
+
+
 class MatchTemplate(typing.Generic[T]):
-    """The core data type for managing dynamic matching functions."""
+    """The core data type for managing dynamic matching functions.
+
+    Matching reads an immutable snapshot of the matchers for a base, so it
+    needs no lock. Adding a structure, or compiling the matchers for a new
+    base, builds a new table under a lock and replaces the old one.
+
+    When enough of the matchers have a literal at the same position, they're
+    also indexed by it, and only those that can match are tried.
+    """
 
     def __init__(self) -> None:
-        self._templates: typing.List[typing.Tuple[Matcher[T], typing.Callable]] = []
+        self._templates: typing.Tuple[
+            typing.Tuple[Matcher[T], typing.Callable], ...
+        ] = ()
         self._abstract = False
-        self._cache: typing.Dict[
-            typing.Optional[type], typing.List[typing.Tuple[T, typing.Callable]]
-        ] = {}
+        self._cache: typing.Dict[typing.Optional[type], Compiled[T]] = {}
+        self._lock = threading.Lock()
 
     def copy_into(self, other: MatchTemplate[T]) -> None:
         """Given another template, copy this one's contents into it."""
         for structure, func in self._templates:
             other.add_structure(structure, func)
 
-    # @property
-    # def abstract(self):
-    #     return self._abstract
+    @property
+    def abstract(self) -> bool:
+        """Return whether any structure needs a base to be applied to."""
+        return self._abstract
 
     def add_structure(self, structure: Matcher[T], func: typing.Callable) -> None:
         """Add the given structure and function to the match template."""
-        self._templates.append((structure, func))
-        if isinstance(structure, _class_placeholder.Placeholder):
-            self._abstract = True
-            self._cache.pop(None, None)
-        for base, structures in self._cache.items():
-            structures.append((_apply(structure, base), func))
-
-    def _get_matchers(
-        self, base: type
-    ) -> typing.List[typing.Tuple[T, typing.Callable]]:
-        if base in self._cache:
-            return self._cache[base]
-        return self._cache.setdefault(
-            base,
-            [(_apply(structure, base), func) for (structure, func) in self._templates],
-        )
+        abstract = isinstance(structure, _class_placeholder.Placeholder)
+        with self._lock:
+            cache = {
+                base: _compile(structures + ((_apply(structure, base), func),))
+                for (base, (structures, _)) in self._cache.items()
+                if not (abstract and base is None)
+            }
+            self._templates += ((structure, func),)
+            self._abstract = self._abstract or abstract
+            self._cache = cache
+
+    def _get_matchers(self, base: typing.Optional[type]) -> Compiled[T]:
+        compiled = self._cache.get(base)
+        if compiled is not None:
+            return compiled
+        with self._lock:
+            compiled = self._cache.get(base)
+            if compiled is None:
+                compiled = _compile(
+                    tuple(
+                        (_apply(structure, base), func)
+                        for (structure, func) in self._templates
+                    )
+                )
+                self._cache = {**self._cache, base: compiled}
+        return compiled
+
+    def prepare(self, base: typing.Optional[type]) -> None:
+        """Compile the matchers for base ahead of time, and plan their calls."""
+        if base is None and self._abstract:
+            return
+        matchers, _ = self._get_matchers(base)
+        for _, func in matchers:
+            call_plan.implementation_plan(func)
 
     def match_instance(self, matchable, instance) -> typing.Iterator[typing.Callable]:
         """Get the base associated with instance, if any, and match with it."""
@@ -72,7 +116,10 @@ class MatchTemplate(typing.Generic[T]):
         """If there is a match in the context of base, yield implementation."""
         if base is None and self._abstract:
             raise ValueError
-        for structure, func in self._get_matchers(base):
+        matchers, table = self._get_matchers(base)
+        if table is not None:
+            matchers = table.candidates(matchable.value, matchers)
+        for structure, func in matchers:
             if matchable(structure):
                 break
         else:
@@ -85,11 +132,28 @@ def _check_structure(structure) -> None:
     destructure.names(structure)  # Raise ValueError if there are duplicates
 
 
-def decorate(matchers: MatchTemplate[T], structure: Matcher[T]):
-    """Create a function decorator using the given structure, MatchTemplate."""
+def decorate(
+    matchers: MatchTemplate[T],
+    structure: Matcher[T],
+    wrapped: typing.Optional[typing.Callable] = None,
+    clear: typing.Optional[typing.Callable[[], None]] = None,
+):
+    """Create a function decorator using the given structure, MatchTemplate.
+
+    If ``wrapped`` is a coroutine function, the decorated function must be one,
+    too, so that calling the dispatcher always returns an awaitable.
+
+    If ``clear`` is given, it's called after the function is added, to discard
+    results that were cached before.
+    """
+    coroutine = inspect.iscoroutinefunction(wrapped)
 
     def decorator(func: typing.Callable) -> typing.Callable:
+        if coroutine and not inspect.iscoroutinefunction(func):
+            raise TypeError(f"{func!r} is not a coroutine function")
         matchers.add_structure(structure, func)
+        if clear is not None:
+            clear()
         return func
 
     return decorator
@@ -100,10 +164,13 @@ class Descriptor:
 
     __wrapped__: typing.Optional[typing.Callable] = None
     __name__: typing.Optional[str] = None
+    _proxies: typing.MutableMapping[type, typing.Any]
+    memo: typing.Optional[cache.Policy] = None
 
     def __new__(cls, func: typing.Optional[typing.Callable]) -> Descriptor:
         new = super().__new__(cls)
         new.__doc__ = None
+        new._proxies = weakref.WeakKeyDictionary()
         if func is None:
             return new
         return typing.cast(Descriptor, functools.wraps(func)(new))
@@ -111,13 +178,71 @@ class Descriptor:
     def __set_name__(self, owner: type, name: str) -> None:
         vars(self).setdefault("__name__", name)
 
+    def cache_info(self) -> cache.CacheInfo:
+        """Return the hit and miss counts, and the sizes, of the memo cache."""
+        if self.memo is None:
+            raise ValueError(self)
+        return self.memo.info()
+
+    def cache_clear(self) -> None:
+        """Forget all memoized results."""
+        if self.memo is not None:
+            self.memo.clear()
+
 
 SENTINEL = object()
 
 
+def cached_proxy(
+    descriptor: Descriptor,
+    owner: type,
+    factory: typing.Callable[[typing.Any, type], typing.Any],
+) -> typing.Any:
+    """Return ``factory(descriptor, owner)``, calling it once per owner.
+
+    The results are stored on the descriptor, weakly keyed by owner. Whether
+    the owner owns the descriptor is decided when the factory is called, so
+    the factory should be the thing that calls ``owns``.
+    """
+    proxies = descriptor._proxies  # pylint: disable=protected-access
+    try:
+        return proxies[owner]
+    except KeyError:
+        return proxies.setdefault(owner, factory(descriptor, owner))
+
+
 def owns(descriptor: Descriptor, owner: type) -> bool:
     """Return whether the given class owns the given descriptor."""
     name = descriptor.__name__
     if name is None:
         return False
     return vars(owner).get(name, SENTINEL) is descriptor
+
+
+def lookup(module: str, qualname: str) -> typing.Any:
+    """Import a module, and return the object at the given qualified name."""
+    value: typing.Any = importlib.import_module(module)
+    for name in qualname.split("."):
+        value = getattr(value, name)
+    return value
+
+
+def reduce_by_name(
+    descriptor: Descriptor, check: typing.Callable[[typing.Any], bool]
+) -> typing.Tuple[typing.Callable, typing.Tuple[str, str]]:
+    """Pickle the result of looking up a descriptor's qualified name.
+
+    ``check`` is given the result of the lookup, and returns whether it is
+    equivalent to the object being pickled.
+    """
+    module = descriptor.__module__
+    qualname = typing.cast(str, getattr(descriptor, "__qualname__", None))
+    try:
+        found = lookup(module, qualname)
+    except (AttributeError, ImportError, TypeError):
+        found = SENTINEL
+    if found is SENTINEL or not check(found):
+        raise pickle.PicklingError(
+            f"Can't pickle {descriptor!r}: it's not found as {module}.{qualname}"
+        )
+    return lookup, (module, qualname)
@@ -2,25 +2,25 @@
 
 from __future__ import annotations
 
-import functools
 import inspect
+import types
 import typing
 
 from ... import _class_placeholder
 from ... import _doc_wrapper
 from .. import matchable
 from ..patterns import mapping_match
+from . import cache
+from . import call_plan
 from . import common
+from . import trampoline
 
 T = typing.TypeVar("T")
 
 Kwargs = typing.Dict[str, typing.Any]
 
-
-def _varargs(signature: inspect.Signature) -> typing.Iterator[inspect.Parameter]:
-    for parameter in signature.parameters.values():
-        if parameter.kind is inspect.Parameter.VAR_POSITIONAL:
-            yield parameter
+# Added in Python 3.12; lets inspect.iscoroutinefunction recognize Functions.
+_markcoroutinefunction = getattr(inspect, "markcoroutinefunction", None)
 
 
 def _dispatch(
@@ -29,36 +29,7 @@ def _dispatch(
     bound_args: typing.Tuple,
     bound_kwargs: Kwargs,
 ) -> typing.Any:
-    for key, value in matches.items():
-        if key in bound_kwargs:
-            raise TypeError
-        bound_kwargs[key] = value
-    function_sig = inspect.signature(func)
-    function_args = function_sig.bind(**bound_kwargs)
-    for parameter in _varargs(function_sig):
-        function_args.arguments[parameter.name] = bound_args
-    function_args.apply_defaults()
-    return func(*function_args.args, **function_args.kwargs)
-
-
-def _bound_and_values(
-    signature: inspect.Signature, args: typing.Tuple, kwargs: Kwargs,
-) -> typing.Tuple[typing.Tuple, Kwargs, Kwargs]:
-    # The signature lets us regularize the call and apply any defaults
-    bound_arguments = signature.bind(*args, **kwargs)
-    bound_arguments.apply_defaults()
-
-    # Extract the *args and **kwargs, if any.
-    # These are never used in the matching, just passed to the underlying function
-    bound_args = ()
-    bound_kwargs: Kwargs = {}
-    values = bound_arguments.arguments.copy()
-    for parameter in signature.parameters.values():
-        if parameter.kind is inspect.Parameter.VAR_POSITIONAL:
-            bound_args = values.pop(parameter.name)
-        if parameter.kind is inspect.Parameter.VAR_KEYWORD:
-            bound_kwargs = values.pop(parameter.name)
-    return bound_args, bound_kwargs, values
+    return call_plan.implementation_plan(func).call(matches, bound_args, bound_kwargs)
 
 
 class ClassMethod(common.Descriptor):
@@ -74,15 +45,16 @@ class ClassMethod(common.Descriptor):
         self.matchers: common.MatchTemplate[typing.Any] = common.MatchTemplate()
 
     def __get__(self, instance, owner):
-        if instance is None and common.owns(self, owner):
-            return ClassMethodWhen(self, owner)
-        return ClassMethodCall(self, owner)
+        when, call = common.cached_proxy(self, owner, _class_method_proxies)
+        return when if instance is None else call
 
     def when(
         self, /, **kwargs: typing.Any  # noqa: E225
     ) -> typing.Callable[[typing.Callable], typing.Callable]:
         """Add a binding for this function."""
-        return common.decorate(self.matchers, _placeholder_kwargs(kwargs))
+        return common.decorate(
+            self.matchers, _placeholder_kwargs(kwargs), self.__wrapped__
+        )
 
 
 @_doc_wrapper.ProxyWrapper.wrap_class("class_method")
@@ -96,11 +68,9 @@ class ClassMethodCall:
     def __call__(
         self, /, *args: typing.Any, **kwargs: typing.Any  # noqa: E225
     ) -> typing.Any:
-        bound_args, bound_kwargs, values = _bound_and_values(
-            inspect.signature(self.class_method.__wrapped__),
-            (self.owner,) + args,
-            kwargs,
-        )
+        bound_args, bound_kwargs, values = call_plan.descriptor_plan(
+            self.class_method
+        ).bind((self.owner,) + args, kwargs)
 
         matchable_ = matchable.Matchable(values)
         for func in self.class_method.matchers.match(matchable_, self.owner):
@@ -123,6 +93,15 @@ class ClassMethodWhen(ClassMethodCall):
         return self.class_method.when(**kwargs)
 
 
+def _class_method_proxies(
+    class_method: ClassMethod, owner: type
+) -> typing.Tuple[ClassMethodCall, ClassMethodCall]:
+    call = ClassMethodCall(class_method, owner)
+    if common.owns(class_method, owner):
+        return ClassMethodWhen(class_method, owner), call
+    return call, call
+
+
 class StaticMethod(common.Descriptor):
     """Decorator with value-based dispatch. Acts as a classmethod."""
 
@@ -136,15 +115,19 @@ class StaticMethod(common.Descriptor):
         self.matchers: common.MatchTemplate[typing.Any] = common.MatchTemplate()
 
     def __get__(self, instance, owner):
-        if instance is None and common.owns(self, owner):
-            return StaticMethodWhen(self)
-        return StaticMethodCall(self)
+        when, call = common.cached_proxy(self, owner, _static_method_proxies)
+        return when if instance is None else call
 
     def when(
         self, /, **kwargs  # noqa: E225
     ) -> typing.Callable[[typing.Callable], typing.Callable]:
         """Add a binding for this function."""
-        return common.decorate(self.matchers, _no_placeholder_kwargs(kwargs))
+        return common.decorate(
+            self.matchers,
+            _no_placeholder_kwargs(kwargs),
+            self.__wrapped__,
+            self.cache_clear,
+        )
 
 
 @_doc_wrapper.ProxyWrapper.wrap_class("static_method")
@@ -157,9 +140,17 @@ class StaticMethodCall:
     def __call__(
         self, /, *args: typing.Any, **kwargs: typing.Any  # noqa: E225
     ) -> typing.Any:
-        bound_args, bound_kwargs, values = _bound_and_values(
-            inspect.signature(self.static_method.__wrapped__), args, kwargs,
-        )
+        memo = self.static_method.memo
+        if memo is None:
+            return self._call(*args, **kwargs)
+        return cache.memoized(memo, self._call, args, kwargs)
+
+    def _call(
+        self, /, *args: typing.Any, **kwargs: typing.Any  # noqa: E225
+    ) -> typing.Any:
+        bound_args, bound_kwargs, values = call_plan.descriptor_plan(
+            self.static_method
+        ).bind(args, kwargs)
 
         matchable_ = matchable.Matchable(values)
         for func in self.static_method.matchers.match(matchable_, None):
@@ -171,6 +162,20 @@ class StaticMethodCall:
             )
         return self.static_method.__wrapped__(*args, **kwargs)
 
+    def cache_info(self) -> cache.CacheInfo:
+        """Return the statistics for the wrapped method's memo cache."""
+        return self.static_method.cache_info()
+
+    def cache_clear(self) -> None:
+        """Clear the wrapped method's memo cache."""
+        self.static_method.cache_clear()
+
+    def __reduce__(self) -> typing.Tuple[typing.Callable, typing.Tuple[str, str]]:
+        return common.reduce_by_name(
+            self.static_method,
+            lambda found: getattr(found, "static_method", None) is self.static_method,
+        )
+
 
 class StaticMethodWhen(StaticMethodCall):
     """Wrapper class that exposes the ``when()`` decorators."""
@@ -182,10 +187,20 @@ class StaticMethodWhen(StaticMethodCall):
         return self.static_method.when(**kwargs)
 
 
+def _static_method_proxies(
+    static_method: StaticMethod, owner: type
+) -> typing.Tuple[StaticMethodCall, StaticMethodCall]:
+    call = StaticMethodCall(static_method)
+    if common.owns(static_method, owner):
+        return StaticMethodWhen(static_method), call
+    return call, call
+
+
 class Function(common.Descriptor):
     """Decorator with value-based dispatch. Acts as a function."""
 
     __wrapped__: typing.Callable
+    trampolined = False
 
     def __init__(self, func: typing.Callable) -> None:
         del func
@@ -193,14 +208,25 @@ class Function(common.Descriptor):
         # A more specific annotation would be good, but that's waiting on
         # further development.
         self.matchers: common.MatchTemplate[typing.Any] = common.MatchTemplate()
+        if _markcoroutinefunction and inspect.iscoroutinefunction(self.__wrapped__):
+            _markcoroutinefunction(self)
 
     def __call__(
         self, /, *args: typing.Any, **kwargs: typing.Any  # noqa: E225
+    ) -> typing.Any:
+        if self.trampolined:
+            return trampoline.run(self._call(*args, **kwargs))
+        if self.memo is None:
+            return self._call(*args, **kwargs)
+        return cache.memoized(self.memo, self._call, args, kwargs)
+
+    def _call(
+        self, /, *args: typing.Any, **kwargs: typing.Any  # noqa: E225
     ) -> typing.Any:
         # Okay, so, this is a convoluted mess.
 
-        bound_args, bound_kwargs, values = _bound_and_values(
-            inspect.signature(self), args, kwargs
+        bound_args, bound_kwargs, values = call_plan.descriptor_plan(self).bind(
+            args, kwargs
         )
 
         instance = args[0] if args else None
@@ -216,18 +242,24 @@ class Function(common.Descriptor):
         # Hey, we can just fall back now.
         return self.__wrapped__(*args, **kwargs)
 
+    def __reduce__(self) -> typing.Tuple[typing.Callable, typing.Tuple[str, str]]:
+        return common.reduce_by_name(self, lambda found: found is self)
+
     def __get__(self, instance: typing.Optional[T], owner: typing.Type[T]):
         if instance is None:
-            if common.owns(self, owner):
-                return self
-            return MethodProxy(self)
-        return functools.partial(self, instance)
+            return common.cached_proxy(self, owner, _function_proxy)
+        return types.MethodType(self, instance)
 
     def when(
         self, /, **kwargs: typing.Any  # noqa: E225
     ) -> typing.Callable[[typing.Callable], typing.Callable]:
         """Add a binding for this function."""
-        return common.decorate(self.matchers, _placeholder_kwargs(kwargs))
+        return common.decorate(
+            self.matchers,
+            _placeholder_kwargs(kwargs),
+            self.__wrapped__,
+            self.cache_clear,
+        )
 
 
 @_doc_wrapper.ProxyWrapper.wrap_class("func")
@@ -245,6 +277,22 @@ class MethodProxy:
     def __get__(self, instance, owner):
         return self.func.__get__(instance, owner)
 
+    def cache_info(self) -> cache.CacheInfo:
+        """Return the statistics for the wrapped function's memo cache."""
+        return self.func.cache_info()
+
+    def cache_clear(self) -> None:
+        """Clear the wrapped function's memo cache."""
+        self.func.cache_clear()
+
+
+def _function_proxy(
+    function: Function, owner: type
+) -> typing.Union[Function, MethodProxy]:
+    if common.owns(function, owner):
+        return function
+    return MethodProxy(function)
+
 
 def _kwarg_structure(kwargs: dict) -> mapping_match.DictPattern:
     return mapping_match.DictPattern(kwargs, exhaustive=True)
@@ -0,0 +1,158 @@
+"""Narrowing down the clauses to try by looking up a value in a table.
+
+A dispatch function whose clauses mostly differ by a literal value at the
+same position, such as an opcode or a command name, or by the type required
+there, would otherwise try each clause in turn. Instead, the clauses are
+indexed by that position, so that each call only tries the clauses that can
+match, in their original order.
+"""
+
+import abc
+import collections
+import typing
+import weakref
+
+from .. import destructure
+from ..patterns.basic_patterns import DISCARD
+from ..patterns.basic_patterns import Pattern
+from ..patterns.mapping_match import DictPattern
+from ..patterns.type_match import InstanceOf
+
+Clause = typing.Tuple[typing.Any, typing.Callable]
+Clauses = typing.Tuple[Clause, ...]
+Table = typing.Dict[typing.Any, Clauses]
+
+_NO_TEST = object()
+
+# Tables are only worth building when they can rule out enough clauses.
+MIN_TESTS = 2
+
+
+def _leaves(structure: typing.Any) -> typing.Iterable[typing.Tuple[typing.Any, ...]]:
+    """Yield the positions in a structure, and what's found there."""
+    if isinstance(structure, DictPattern):
+        for key, leaf in structure.match_dict:
+            yield (DictPattern, key), leaf
+    elif type(structure) is tuple:  # pylint: disable=unidiomatic-typecheck
+        for index, leaf in enumerate(structure):
+            yield (tuple, index), leaf
+
+
+def _test(leaf: typing.Any) -> typing.Any:
+    """Return an ``InstanceOf``, or a hashable literal, or ``_NO_TEST``."""
+    if isinstance(leaf, InstanceOf):
+        return leaf
+    if leaf is DISCARD or isinstance(leaf, Pattern):
+        return _NO_TEST
+    if destructure.DESTRUCTURERS.get_destructurer(leaf) is not None:
+        return _NO_TEST
+    try:
+        hash(leaf)
+    except TypeError:
+        return _NO_TEST
+    return leaf
+
+
+class LiteralTable:
+    """The clauses that can match, for each value at one position.
+
+    Clauses that require a type there are filtered out per type of value,
+    like ``functools.singledispatch``, and the result is cached.
+    """
+
+    __slots__ = ("key", "table", "default", "type_tests", "_by_type", "_token")
+
+    def __init__(
+        self,
+        key: typing.Any,
+        table: Table,
+        default: Clauses,
+        type_tests: typing.Tuple[typing.Tuple[Clause, InstanceOf], ...],
+    ) -> None:
+        self.key = key
+        self.table = table
+        self.default = default
+        self.type_tests = type_tests
+        self._by_type: typing.MutableMapping[
+            type, typing.Tuple[Table, Clauses]
+        ] = weakref.WeakKeyDictionary()
+        self._token = abc.get_cache_token()
+
+    def _for_type(self, cls: type) -> typing.Tuple[Table, Clauses]:
+        token = abc.get_cache_token()
+        if token != self._token:
+            # An ABC gained a virtual subclass, so start over.
+            self._by_type = weakref.WeakKeyDictionary()
+            self._token = token
+        try:
+            return self._by_type[cls]
+        except KeyError:
+            pass
+        excluded = {
+            id(clause)
+            for (clause, test) in self.type_tests
+            if not issubclass(cls, test.type)
+        }
+        table = {
+            literal: tuple(clause for clause in clauses if id(clause) not in excluded)
+            for (literal, clauses) in self.table.items()
+        }
+        default = tuple(clause for clause in self.default if id(clause) not in excluded)
+        return self._by_type.setdefault(cls, (table, default))
+
+    def candidates(self, value: typing.Any, clauses: Clauses) -> Clauses:
+        """Return the clauses that can match the value, in order.
+
+        If the value can't be looked up, that's every clause.
+        """
+        try:
+            item = value[self.key]
+        except (LookupError, TypeError):
+            return clauses
+        if self.type_tests:
+            table, default = self._for_type(type(item))
+        else:
+            table, default = self.table, self.default
+        if not table:
+            return default
+        try:
+            return table.get(item, default)
+        except TypeError:
+            return clauses
+
+
+def build(clauses: Clauses) -> typing.Optional[LiteralTable]:
+    """Return a table for the position with the most tests, if any."""
+    tests: typing.List[typing.Dict[typing.Any, typing.Any]] = []
+    counts: typing.Counter = collections.Counter()
+    for structure, _ in clauses:
+        found = {}
+        for position, leaf in _leaves(structure):
+            test = _test(leaf)
+            if test is not _NO_TEST:
+                found[position] = test
+                counts[position] += 1
+        tests.append(found)
+    if not counts:
+        return None
+    position, count = counts.most_common(1)[0]
+    if count < MIN_TESTS:
+        return None
+    others: typing.List[int] = []
+    groups: typing.Dict[typing.Any, typing.List[int]] = {}
+    type_tests = []
+    for index, found in enumerate(tests):
+        test = found.get(position, _NO_TEST)
+        if isinstance(test, InstanceOf):
+            type_tests.append((clauses[index], test))
+            others.append(index)
+        elif test is not _NO_TEST:
+            groups.setdefault(test, []).append(index)
+        else:
+            others.append(index)
+    table = {
+        literal: tuple(clauses[index] for index in sorted(group + others))
+        for (literal, group) in groups.items()
+    }
+    default = tuple(clauses[index] for index in others)
+    return LiteralTable(position[1], table, default, tuple(type_tests))
@@ -7,6 +7,7 @@ import typing
 from ... import _class_placeholder
 from ... import _doc_wrapper
 from .. import matchable
+from . import cache
 from . import common
 
 OptionalSetter = typing.Optional[typing.Callable[[typing.Any, typing.Any], None]]
@@ -15,6 +16,9 @@ OptionalDeleter = typing.Optional[typing.Callable[[typing.Any], None]]
 T = typing.TypeVar("T")
 U = typing.TypeVar("U")
 
+# The number of instances whose getter results a cached Property keeps.
+CACHE_SIZE = 1024
+
 
 @_doc_wrapper.ProxyWrapper.wrap_class("prop")
 class PropertyProxy:
@@ -44,6 +48,14 @@ class PropertyProxy:
     def __delete__(self, instance):
         self.prop.__delete__(instance)
 
+    def cache_info(self) -> cache.CacheInfo:
+        """Return the statistics for the wrapped property's getter cache."""
+        return self.prop.cache_info()
+
+    def cache_clear(self) -> None:
+        """Clear the wrapped property's getter cache."""
+        self.prop.cache_clear()
+
 
 @_doc_wrapper.DocWrapper.wrap_class
 class Property(common.Descriptor):
@@ -51,6 +63,7 @@ class Property(common.Descriptor):
 
     fset: OptionalSetter = None
     fdel: OptionalDeleter = None
+    getter_cache: typing.Optional[cache.LRU] = None
 
     protected = False
 
@@ -60,8 +73,9 @@ class Property(common.Descriptor):
         fset: typing.Optional[typing.Callable] = None,
         fdel: typing.Optional[typing.Callable] = None,
         doc: typing.Optional[str] = None,
+        cached: bool = False,
     ):
-        del fset, fdel, doc
+        del fset, fdel, doc, cached
         return super().__new__(cls, func)
 
     def __init__(
@@ -70,11 +84,14 @@ class Property(common.Descriptor):
         fset: typing.Optional[typing.Callable] = None,
         fdel: typing.Optional[typing.Callable] = None,
         doc: typing.Optional[str] = None,
+        cached: bool = False,
     ) -> None:
         del func
         super().__init__()
         self.fset = fset
         self.fdel = fdel
+        if cached:
+            self.getter_cache = cache.LRU(CACHE_SIZE)
         if doc is not None:
             self.__doc__ = doc
         # A more specific annotation would be good, but that's waiting on
@@ -96,7 +113,7 @@ class Property(common.Descriptor):
 
     def getter(self, getter) -> Property:
         """Return a copy of self with the getter replaced."""
-        new = Property(getter, self.fset, self.fdel, self.__doc__)
+        new = Property(getter, self.fset, self.fdel, self.__doc__, self.cached)
         self.get_matchers.copy_into(new.get_matchers)
         self.set_matchers.copy_into(new.set_matchers)
         self.delete_matchers.copy_into(new.delete_matchers)
@@ -104,7 +121,7 @@ class Property(common.Descriptor):
 
     def setter(self, setter) -> Property:
         """Return a copy of self with the setter replaced."""
-        new = Property(self.__wrapped__, setter, self.fdel, self.__doc__)
+        new = Property(self.__wrapped__, setter, self.fdel, self.__doc__, self.cached)
         self.get_matchers.copy_into(new.get_matchers)
         self.set_matchers.copy_into(new.set_matchers)
         self.delete_matchers.copy_into(new.delete_matchers)
@@ -112,17 +129,43 @@ class Property(common.Descriptor):
 
     def deleter(self, deleter) -> Property:
         """Return a copy of self with the deleter replaced."""
-        new = Property(self.__wrapped__, self.fset, deleter, self.__doc__)
+        new = Property(self.__wrapped__, self.fset, deleter, self.__doc__, self.cached)
         self.get_matchers.copy_into(new.get_matchers)
         self.set_matchers.copy_into(new.set_matchers)
         self.delete_matchers.copy_into(new.delete_matchers)
         return new
 
+    @property
+    def cached(self) -> bool:
+        """Whether getter results are cached."""
+        return self.getter_cache is not None
+
+    def cache_info(self) -> cache.CacheInfo:
+        """Return the hit and miss counts, and the sizes, of the getter cache."""
+        if self.getter_cache is None:
+            raise ValueError(self)
+        return self.getter_cache.info()
+
+    def cache_clear(self) -> None:
+        """Forget all cached getter results."""
+        if self.getter_cache is not None:
+            self.getter_cache.clear()
+
     def __get__(self, instance, owner):
         if instance is None:
-            if common.owns(self, owner):
-                return self
-            return PropertyProxy(self)
+            return common.cached_proxy(self, owner, _property_proxy)
+        if self.getter_cache is None:
+            return self._get(instance)
+        # ADT instances can't be weakly referenced, so entries are keyed by
+        # identity, and hold the instance to keep its id from being reused.
+        entry = self.getter_cache.get(id(instance))
+        if entry is not cache.MISSING:
+            return entry[1]
+        value = self._get(instance)
+        self.getter_cache.put(id(instance), (instance, value))
+        return value
+
+    def _get(self, instance):
         matchable_ = matchable.Matchable(instance)
         for func in self.get_matchers.match_instance(matchable_, instance):
             return func(**typing.cast(typing.Mapping, matchable_.matches))
@@ -151,7 +194,7 @@ class Property(common.Descriptor):
 
     def get_when(self, instance):
         """Add a binding to the getter."""
-        return common.decorate(self.get_matchers, instance)
+        return common.decorate(self.get_matchers, instance, clear=self.cache_clear)
 
     def set_when(self, instance, value):
         """Add a binding to the setter."""
@@ -162,6 +205,14 @@ class Property(common.Descriptor):
         return common.decorate(self.delete_matchers, instance)
 
 
+def _property_proxy(
+    prop: Property, owner: type
+) -> typing.Union[Property, PropertyProxy]:
+    if common.owns(prop, owner):
+        return prop
+    return PropertyProxy(prop)
+
+
 def _fst_placeholder(
     fst: _class_placeholder.Placeholder[T], snd: U
 ) -> _class_placeholder.Placeholder[typing.Tuple[T, U]]:
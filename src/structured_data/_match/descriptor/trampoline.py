@@ -0,0 +1,88 @@
+"""Iterative evaluation of recursive dispatch functions.
+
+The implementations of a trampolined function don't call other trampolined
+functions directly. Instead, they return a ``TailCall`` to have the driver
+make the call in their place, or they're generators that yield a
+``TailCall`` for each result they need, and receive the result back from the
+``yield`` expression. Either way, the Python stack stays the same depth, no
+matter how deeply the calls nest.
+"""
+
+import types
+import typing
+
+
+class TailCall:
+    """A request for the driver to call a function."""
+
+    __slots__ = ("func", "args", "kwargs")
+
+    def __init__(
+        self,
+        func: typing.Callable,
+        args: typing.Tuple,
+        kwargs: typing.Dict[str, typing.Any],
+    ) -> None:
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+
+    def __repr__(self) -> str:
+        return f"tailcall({self.func!r}, *{self.args!r}, **{self.kwargs!r})"
+
+    def step(self) -> typing.Any:
+        """Make the call, without driving any trampolined function."""
+        func = self.func
+        args = self.args
+        if isinstance(func, types.MethodType):
+            args = (func.__self__,) + args
+            func = func.__func__
+        if getattr(func, "trampolined", False):
+            return func._call(*args, **self.kwargs)  # pylint: disable=protected-access
+        return func(*args, **self.kwargs)
+
+
+def tailcall(
+    func: typing.Callable, /, *args: typing.Any, **kwargs: typing.Any  # noqa: E225
+) -> TailCall:
+    """Return a request for a trampolined function's driver to call ``func``."""
+    return TailCall(func, args, kwargs)
+
+
+def run(value: typing.Any) -> typing.Any:
+    """Drive a trampolined implementation's result to a final value."""
+    stack: typing.List[typing.Generator] = []
+    error: typing.Optional[BaseException] = None
+    while True:
+        if error is None:
+            if isinstance(value, TailCall):
+                try:
+                    value = value.step()
+                except Exception as exc:  # pylint: disable=broad-except
+                    error = exc
+                continue
+            if isinstance(value, types.GeneratorType):
+                stack.append(value)
+                value = None
+            elif not stack:
+                return value
+        elif not stack:
+            raise error
+        generator = stack[-1]
+        try:
+            if error is None:
+                value = generator.send(value)
+            else:
+                thrown, error = error, None
+                value = generator.throw(thrown)
+        except StopIteration as stop:
+            stack.pop()
+            value = stop.value
+        except Exception as exc:  # pylint: disable=broad-except
+            stack.pop()
+            error = exc
+        else:
+            if not isinstance(value, TailCall):
+                error = TypeError(
+                    f"Trampolined generators must yield tailcalls: {value!r}"
+                )
@@ -0,0 +1,86 @@
+"""Iterative folds over recursive Sum types."""
+
+import typing
+import weakref
+
+from .. import _stack_iter
+from .._adt import constructor
+from .._adt import layout
+from .._unpack import unpack
+
+_RECURSIVE_FIELDS: typing.MutableMapping[
+    type, typing.Tuple[int, ...]
+] = weakref.WeakKeyDictionary()
+
+
+def recursive_fields(cls: type) -> typing.Tuple[int, ...]:
+    """Return the indices of a constructor's fields annotated with its Sum."""
+    try:
+        return _RECURSIVE_FIELDS[cls]
+    except KeyError:
+        pass
+    base = constructor.ADT_BASES[cls]
+    fields = tuple(
+        index
+        for (index, annotation) in enumerate(layout.field_annotations(cls))
+        if _resolve(annotation, cls) is base
+    )
+    return _RECURSIVE_FIELDS.setdefault(cls, fields)
+
+
+def _resolve(annotation: typing.Any, cls: type) -> typing.Any:
+    resolved = layout.resolve(annotation, cls)
+    # Under postponed evaluation, a quoted argument to Ctor can come back as
+    # the source of a string literal.
+    if isinstance(resolved, str):
+        return layout.resolve(resolved, cls)
+    return resolved
+
+
+Algebra = typing.Mapping[type, typing.Callable[..., typing.Any]]
+
+
+def fold(value: typing.Any, algebra: Algebra) -> typing.Any:
+    """Collapse an instance of a recursive Sum type into a single value.
+
+    ``algebra`` maps each constructor to a function that takes the
+    instance's fields, with each field annotated as the Sum type replaced by
+    the result of folding it. The fold uses an explicit stack, so it isn't
+    limited by the recursion limit, and subterms that appear more than once
+    are only folded once.
+    """
+    if type(value) not in constructor.ADT_BASES:
+        raise TypeError(f"{value!r} is not a Sum instance")
+    base = constructor.ADT_BASES[type(value)]
+    # Keyed by id. The instances stay alive because the root holds them.
+    results: typing.Dict[int, typing.Any] = {}
+
+    def process(
+        item: typing.Tuple[typing.Any, bool]
+    ) -> typing.Optional[_stack_iter.Action]:
+        node, children_done = item
+        if id(node) in results:
+            return None
+        fields = recursive_fields(type(node))
+        if not children_done:
+            children = [
+                (child, False)
+                for child in map(unpack(node).__getitem__, reversed(fields))
+                if isinstance(child, base) and id(child) not in results
+            ]
+            return _stack_iter.Extend([(node, True)] + children)
+        args = list(unpack(node))
+        for index in fields:
+            if isinstance(args[index], base):
+                args[index] = results[id(args[index])]
+        try:
+            func = algebra[type(node)]
+        except KeyError:
+            raise ValueError(f"No algebra for {type(node).__qualname__}")
+        result = results[id(node)] = func(*args)
+        if node is value:
+            return _stack_iter.Yield(result)
+        return None
+
+    # The only output is the root's result, which comes last.
+    return next(_stack_iter.stack_iter((value, False), process))
@@ -0,0 +1,77 @@
+"""Mapping dispatch functions over iterables in worker processes."""
+
+import collections
+import concurrent.futures
+import itertools
+import os
+import typing
+
+T = typing.TypeVar("T")
+R = typing.TypeVar("R")
+
+
+def _apply(func: typing.Callable[[T], R], chunk: typing.List[T]) -> typing.List[R]:
+    return [func(item) for item in chunk]
+
+
+def _chunks(
+    iterable: typing.Iterable[T], chunksize: int
+) -> typing.Iterator[typing.List[T]]:
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+def parallel_map(
+    func: typing.Callable[[T], R],
+    iterable: typing.Iterable[T],
+    *,
+    workers: typing.Optional[int] = None,
+    chunksize: int = 1024,
+    ordered: bool = True,
+) -> typing.Iterator[R]:
+    """Yield ``func(item)`` for each item, computed in worker processes.
+
+    ``func`` is typically a module-level ``match.function``, or a static method
+    made with one, and is pickled by name. The items are sent to the workers
+    in lists of ``chunksize``, and at most two chunks per worker are pending at
+    once, so the iterable is consumed as the results are consumed.
+
+    If ``ordered`` is false, the results of each chunk are yielded as soon as
+    the chunk is done, rather than in the order of the items.
+    """
+    if chunksize < 1:
+        raise ValueError(chunksize)
+    workers = workers or os.cpu_count() or 1
+    chunks = _chunks(iterable, chunksize)
+    with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+        pending: typing.Deque[concurrent.futures.Future] = collections.deque(
+            executor.submit(_apply, func, chunk)
+            for chunk in itertools.islice(chunks, 2 * workers)
+        )
+        try:
+            while pending:
+                if ordered:
+                    done = [pending.popleft()]
+                else:
+                    finished, _ = concurrent.futures.wait(
+                        pending, return_when=concurrent.futures.FIRST_COMPLETED
+                    )
+                    done = [future for future in pending if future in finished]
+                    for future in done:
+                        pending.remove(future)
+                for future in done:
+                    for chunk in itertools.islice(chunks, 1):
+                        pending.append(executor.submit(_apply, func, chunk))
+                    yield from future.result()
+
+        finally:
+            # Don't wait for chunks whose results won't be used.
+            for future in pending:
+                future.cancel()
+
+
+__all__ = ["parallel_map"]
@@ -26,42 +26,35 @@ class AttrPattern(CompoundMatch, tuple):
     __slots__ = ()
 
     def __new__(cls, /, **kwargs) -> "AttrPattern":  # noqa: E225
-        return super().__new__(
-            cls, (tuple(kwargs.items()),)  # type: ignore
-        )
+        return super().__new__(cls, (tuple(kwargs.items()),))  # type: ignore
 
     @property
     def match_dict(self):
         """Return the dict of matches to check."""
         return self[0]
 
-    def destructure(
-        self, value
-    ) -> typing.Union[typing.Tuple[()], typing.Tuple[typing.Any, typing.Any]]:
-        """Return a tuple of sub-values to check.
-
-        If self is empty, return no values from self or the target.
+    def destructure(self, value) -> typing.Tuple[typing.Any, ...]:
+        """Return a tuple of sub-values to check, in reverse order.
 
         Special-case matching against another AttrPattern as follows:
         Confirm that the target isn't smaller than self, then
-        Extract the first match from the target's match_dict, and
-        Return the smaller value, and the first match's value.
-        (This works as desired when value is self, but all other cases
+        Return the matchers of as many of the target's attributes as self
+        has. (This works as desired when value is self, but all other cases
         where ``isinstance(value, AttrPattern)`` are unspecified.)
 
-        By default, it takes the first match from the match_dict, and
-        returns the original value, and the result of calling ``getattr`` with
-        the target and the match's key.
+        By default, it returns the result of calling ``getattr`` with the
+        target and each attribute name.
         """
-        if not self.match_dict:
-            return ()
         if isinstance(value, AttrPattern):
             value_cant_be_smaller(self.match_dict, value.match_dict)
-            first_match, *remainder = value.match_dict
-            return (AttrPattern(**dict(remainder)), first_match[1])
-        first_match = self.match_dict[0]
+            return tuple(
+                structure
+                for (_, structure) in reversed(value.match_dict[: len(self.match_dict)])
+            )
         try:
-            return (value, getattr(value, first_match[0]))
+            return tuple(
+                getattr(value, name) for (name, _) in reversed(self.match_dict)
+            )
         except AttributeError:
             raise MatchFailure
 
@@ -113,38 +106,30 @@ class DictPattern(CompoundMatch, tuple):
         if self.exhaustive and dict_pattern_length(value) != dict_pattern_length(self):
             raise MatchFailure
 
-    def destructure(
-        self, value
-    ) -> typing.Union[typing.Tuple[()], typing.Tuple[typing.Any, typing.Any]]:
-        """Return a tuple of sub-values to check.
+    def destructure(self, value) -> typing.Tuple[typing.Any, ...]:
+        """Return a tuple of sub-values to check, in reverse order.
 
         If self is exhaustive and the lengths don't match, fail.
 
-        If self is empty, return no values from self or the target.
-
         Special-case matching against another DictPattern as follows:
         Confirm that the target isn't smaller than self, then
-        Extract the first match from the target's match_dict, and
-        Return the smaller value, and the first match's value.
-        Note that the returned DictPattern is never exhaustive; the
-        exhaustiveness check is accomplished by asserting that the lengths
-        start out the same, and that every key in self is present in value.
+        Return the matchers of as many of the target's keys as self has.
+        The exhaustiveness check is accomplished by asserting that the lengths
+        are the same, and that every key in self is present in value.
         (This works as desired when value is self, but all other cases
         where ``isinstance(value, DictPattern)`` are unspecified.)
 
-        By default, it takes the first match from the match_dict, and
-        returns the original value, and the result of indexing the target with
-        the match's key.
+        By default, it returns the result of indexing the target with each
+        key.
         """
         self.exhaustive_length_must_match(value)
-        if not self.match_dict:
-            return ()
         if isinstance(value, DictPattern):
             value_cant_be_smaller(self.match_dict, value.match_dict)
-            first_match, *remainder = value.match_dict
-            return (DictPattern(dict(remainder)), first_match[1])
-        first_match = self.match_dict[0]
+            return tuple(
+                structure
+                for (_, structure) in reversed(value.match_dict[: len(self.match_dict)])
+            )
         try:
-            return (value, value[first_match[0]])
+            return tuple(value[key] for (key, _) in reversed(self.match_dict))
         except KeyError:
             raise MatchFailure
@@ -0,0 +1,164 @@
+"""Patterns that match sequences, with an optional rest capture."""
+
+from __future__ import annotations
+
+import collections.abc
+import typing
+
+from ..._adt.constructor import ADTConstructor
+from ..match_failure import MatchFailure
+from .basic_patterns import DISCARD
+from .compound_match import CompoundMatch
+
+
+class SequenceView(collections.abc.Sequence):
+    """A read-only view of part of a sequence, which doesn't copy it.
+
+    Slicing a view returns another view of the same underlying sequence.
+    """
+
+    __slots__ = ("_sequence", "_start", "_stop")
+
+    def __init__(self, sequence: typing.Sequence, start: int, stop: int) -> None:
+        if isinstance(sequence, SequenceView):
+            start += sequence._start
+            stop += sequence._start
+            sequence = sequence._sequence
+        self._sequence = sequence
+        self._start = start
+        self._stop = stop
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            return SequenceView(self, start, max(start, stop))
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return self._sequence[self._start + index]
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, (SequenceView, type(self._sequence))):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            mine == theirs for (mine, theirs) in zip(self, other)
+        )
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self)!r})"
+
+
+def _view(value: typing.Sequence, start: int, stop: int) -> typing.Sequence:
+    if isinstance(value, memoryview):
+        return value[start:stop]
+    if isinstance(value, (bytes, bytearray)):
+        return memoryview(value)[start:stop]
+    if isinstance(value, range):
+        return value[start:stop]
+    return SequenceView(value, start, stop)
+
+
+class Rest(tuple):
+    """A marker for the part of a ``Seq`` that matches the remaining items.
+
+    ``Rest`` takes the matcher for the remaining items, which is usually a
+    ``Pattern``. If it's omitted, the items are matched but not bound.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, structure=DISCARD):
+        return super().__new__(cls, (structure,))  # type: ignore
+
+    @property
+    def structure(self):
+        """Return the matcher for the remaining items."""
+        return self[0]
+
+
+class Seq(CompoundMatch, tuple):
+    """A matcher that destructures sequences.
+
+    The ``Seq`` constructor takes a matcher for each item. At most one of the
+    matchers may be wrapped in ``Rest``, in which case it matches all of the
+    items that the other matchers don't, and the sequence may be as short as
+    the other matchers allow. Otherwise, the lengths must be equal.
+
+    Any sequence except a string or an ADT instance can match. The remaining
+    items are matched without being copied: byte strings and memoryviews give
+    a ``memoryview``, ranges give a ``range``, and other sequences give a
+    ``SequenceView``.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, *structures):
+        rest_indexes = [
+            index
+            for (index, structure) in enumerate(structures)
+            if isinstance(structure, Rest)
+        ]
+        if len(rest_indexes) > 1:
+            raise ValueError("A Seq can only contain one Rest")
+        rest_index = rest_indexes[0] if rest_indexes else None
+        if rest_index is not None:
+            items = list(structures)
+            items[rest_index] = items[rest_index].structure
+            structures = tuple(items)
+        return super().__new__(cls, (structures, rest_index))  # type: ignore
+
+    @property
+    def structures(self) -> typing.Tuple[typing.Any, ...]:
+        """Return the matchers, with the one for ``Rest`` unwrapped."""
+        return self[0]
+
+    @property
+    def rest_index(self) -> typing.Optional[int]:
+        """Return the position of the ``Rest`` matcher, if any."""
+        return self[1]
+
+    def destructure(self, value) -> typing.Tuple[typing.Any, ...]:
+        """Return a tuple of sub-values to check, in reverse order.
+
+        If ``isinstance(value, Seq)`` and it has the same shape as self, return
+        its matchers.
+
+        Otherwise, return the items before the rest, a view of the rest, and
+        the items after it.
+        """
+        structures = self.structures
+        rest_index = self.rest_index
+        if isinstance(value, Seq):
+            if value.rest_index != rest_index or len(value.structures) != len(
+                structures
+            ):
+                raise MatchFailure
+            return tuple(reversed(value.structures))
+        if (
+            isinstance(value, (str, ADTConstructor))
+            or not isinstance(value, collections.abc.Sequence)
+            or (isinstance(value, memoryview) and value.ndim != 1)
+        ):
+            raise MatchFailure
+        length = len(value)
+        if rest_index is None:
+            if length != len(structures):
+                raise MatchFailure
+            return tuple(value[index] for index in reversed(range(length)))
+        after = len(structures) - rest_index - 1
+        if length < rest_index + after:
+            raise MatchFailure
+        stop = length - after
+        return (
+            tuple(value[index] for index in reversed(range(stop, length)))
+            + (_view(value, rest_index, stop),)
+            + tuple(value[index] for index in reversed(range(rest_index)))
+        )
@@ -0,0 +1,123 @@
+"""A pattern that matches binary data laid out as a C struct."""
+
+from __future__ import annotations
+
+import re
+import struct
+import typing
+
+from ..match_failure import MatchFailure
+from .basic_patterns import DISCARD
+from .basic_patterns import Pattern
+from .compound_match import CompoundMatch
+
+_BYTE_ORDERS = "@=<>!"
+_FIELD = re.compile(r"(\d*)([xcbB?hHiIlLqQnNefdspP])")
+
+Field = typing.Tuple[struct.Struct, int]
+
+
+def _fields(format_: str) -> typing.List[Field]:
+    """Return a struct and an offset for each value the format unpacks."""
+    if format_[:1] and format_[0] in _BYTE_ORDERS:
+        order, body = format_[0], format_[1:]
+    else:
+        order, body = "@", format_
+    prefix = ""
+    fields = []
+    for count, code in _FIELD.findall(body):
+        if code == "x":
+            prefix += count + code
+            continue
+        if code in "sp":
+            units = [count + code]
+        else:
+            units = [code] * int(count or 1)
+        for unit in units:
+            prefix += unit
+            field = struct.Struct(order + unit)
+            # With native alignment, the padding before the field is included.
+            fields.append((field, struct.calcsize(order + prefix) - field.size))
+    return fields
+
+
+def _is_literal(structure) -> bool:
+    return not (
+        structure is DISCARD or isinstance(structure, (Pattern, CompoundMatch, tuple))
+    )
+
+
+class Struct(CompoundMatch, tuple):
+    """A matcher that unpacks binary data with a ``struct`` format.
+
+    The ``Struct`` constructor takes a format string, as for ``struct.Struct``,
+    and a matcher for each value the format unpacks. It matches any object
+    that supports the buffer protocol and is at least as long as the format,
+    such as ``bytes``, ``bytearray``, and ``memoryview``; any bytes beyond the
+    end of the format are ignored.
+
+    Fields are unpacked directly from the buffer, without copying it. Fields
+    matched against literal values, such as magic numbers and tags, are
+    unpacked and checked first, and the rest of the fields are only unpacked
+    if they all match.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, format_: str, /, *structures):  # noqa: E225
+        whole = struct.Struct(format_)
+        fields = _fields(format_)
+        if len(fields) != len(structures):
+            raise ValueError(
+                f"{format_!r} has {len(fields)} fields, "
+                f"but {len(structures)} matchers were given"
+            )
+        literals = tuple(
+            (field, offset, structure)
+            for ((field, offset), structure) in zip(fields, structures)
+            if _is_literal(structure)
+        )
+        rest = tuple(
+            (index, structure)
+            for (index, structure) in enumerate(structures)
+            if structure is not DISCARD and not _is_literal(structure)
+        )
+        return super().__new__(
+            cls, (format_, structures, whole, literals, rest)  # type: ignore
+        )
+
+    @property
+    def format(self) -> str:
+        """Return the format string."""
+        return self[0]
+
+    @property
+    def structures(self) -> typing.Tuple[typing.Any, ...]:
+        """Return the matchers for the fields."""
+        return self[1]
+
+    def destructure(self, value) -> typing.Tuple[typing.Any, ...]:
+        """Return a tuple of sub-values to check, in reverse order.
+
+        If ``value is self``, return the matchers that aren't literals.
+
+        Otherwise, check the literal fields, then return the values of the
+        fields that other matchers apply to.
+        """
+        _, _, whole, literals, rest = self
+        if value is self:
+            return tuple(structure for (_, structure) in reversed(rest))
+        if isinstance(value, Struct):
+            raise MatchFailure
+        try:
+            for field, offset, expected in literals:
+                if field.unpack_from(value, offset)[0] != expected:
+                    raise MatchFailure
+            if not rest:
+                # Only the length is left to check.
+                whole.unpack_from(value)
+                return ()
+            values = whole.unpack_from(value)
+        except (struct.error, TypeError):
+            raise MatchFailure
+        return tuple(values[index] for (index, _) in reversed(rest))
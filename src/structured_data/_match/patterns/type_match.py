@@ -0,0 +1,50 @@
+"""A pattern that checks the type of a value."""
+
+import typing
+
+from ..match_failure import MatchFailure
+from .basic_patterns import DISCARD
+from .compound_match import CompoundMatch
+
+
+class InstanceOf(CompoundMatch, tuple):
+    """A matcher that requires a value to be an instance of a class.
+
+    The ``InstanceOf`` constructor takes a class, or a tuple of classes as for
+    ``isinstance``, and optionally a matcher, which a value must also match.
+    The check is made on ``type(value)``, so objects that report a different
+    ``__class__`` are judged by their actual type.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, type_, structure=DISCARD, /):  # noqa: E225
+        if not isinstance(type_, type) and not (
+            isinstance(type_, tuple) and all(isinstance(item, type) for item in type_)
+        ):
+            raise TypeError(f"{type_!r} is not a class or a tuple of classes")
+        return super().__new__(cls, (type_, structure))  # type: ignore
+
+    @property
+    def type(self) -> typing.Union[type, typing.Tuple[type, ...]]:
+        """Return the class or classes to check against."""
+        return self[0]
+
+    @property
+    def structure(self):
+        """Return the matcher for the value."""
+        return self[1]
+
+    def destructure(self, value):
+        """Return a tuple of sub-values to check.
+
+        If ``value is self``, return the matcher.
+
+        Otherwise, if the value's type is a subclass of the class, return the
+        value.
+        """
+        if value is self:
+            return (self.structure,)
+        if isinstance(value, InstanceOf) or not issubclass(type(value), self.type):
+            raise MatchFailure
+        return (value,)
@@ -0,0 +1,57 @@
+"""Multi-way matching with precompiled targets."""
+
+import typing
+
+from .._adt.constructor import ADTConstructor
+from . import compiled
+from .patterns.basic_patterns import AsPattern
+
+Case = typing.Tuple[compiled.Matcher, typing.Callable[..., typing.Any]]
+
+
+def _dispatch_class(target: typing.Any) -> typing.Optional[type]:
+    """Return the only class of value the target can match, if there is one."""
+    while isinstance(target, AsPattern):
+        target = target.structure
+    if isinstance(target, ADTConstructor):
+        return target.__class__
+    return None
+
+
+class Switch:
+    """Dispatch a value to the handler for the first target it matches.
+
+    ``Switch`` takes a sequence of ``(target, handler)`` pairs. Calling it with
+    a value calls the handler for the first target that matches, with the
+    target's bindings as keyword arguments, and returns the result. If no
+    target matches, it raises ``ValueError``.
+
+    The targets are compiled when the ``Switch`` is created, and only the
+    targets that can match a value's class are tried.
+    """
+
+    __slots__ = ("cases", "_by_class", "_default")
+
+    def __init__(
+        self, cases: typing.Iterable[typing.Tuple[typing.Any, typing.Callable]]
+    ) -> None:
+        self.cases = tuple(cases)
+        compiled_cases = [
+            (_dispatch_class(target), (compiled.compile_target(target), handler))
+            for (target, handler) in self.cases
+        ]
+        classes = {cls for (cls, _) in compiled_cases if cls is not None}
+        self._by_class: typing.Dict[type, typing.Tuple[Case, ...]] = {
+            cls: tuple(case for (key, case) in compiled_cases if key in (cls, None))
+            for cls in classes
+        }
+        self._default: typing.Tuple[Case, ...] = tuple(
+            case for (key, case) in compiled_cases if key is None
+        )
+
+    def __call__(self, value: typing.Any) -> typing.Any:
+        for matcher, handler in self._by_class.get(value.__class__, self._default):
+            bindings: compiled.Bindings = {}
+            if matcher(value, bindings):
+                return handler(**bindings)
+        raise ValueError(value)
@@ -0,0 +1,68 @@
+"""Building match targets once per call site."""
+
+import threading
+import types
+import typing
+
+T = typing.TypeVar("T")
+
+# The most targets kept at once. When it's reached, the oldest is discarded.
+MAXSIZE = 1024
+
+_TARGETS: typing.Dict[typing.Hashable, typing.Any] = {}
+_LOCK = threading.Lock()
+_NAMES: typing.Dict[types.CodeType, typing.Tuple[str, ...]] = {}
+_MISSING = object()
+
+
+def _names(code: types.CodeType) -> typing.Tuple[str, ...]:
+    """Return the names that code, and any code nested in it, looks up."""
+    try:
+        return _NAMES[code]
+    except KeyError:
+        pass
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names.update(_names(const))
+    return _NAMES.setdefault(code, tuple(sorted(names)))
+
+
+def _key(build: typing.Callable) -> typing.Hashable:
+    code = build.__code__  # type: ignore
+    global_ns = build.__globals__  # type: ignore
+    closure = build.__closure__  # type: ignore
+    kwdefaults = build.__kwdefaults__  # type: ignore
+    return (
+        code,
+        build.__defaults__,  # type: ignore
+        None if kwdefaults is None else tuple(kwdefaults.items()),
+        None if closure is None else tuple(cell.cell_contents for cell in closure),
+        # Some of these are attribute names; it's harmless to include them.
+        tuple(global_ns.get(name, _MISSING) for name in _names(code)),
+    )
+
+
+def target(build: typing.Callable[[], T]) -> T:
+    """Return ``build()``, calling it only once for each place it's written.
+
+    Targets are cached by the code of ``build``, along with the values of any
+    variables it uses from enclosing functions, default arguments, and
+    module globals, so ``matchable(target(lambda: ...))`` only constructs the
+    target the first time it runs. The target has to be immutable, and the
+    values it uses have to be hashable. If they aren't hashable, the target is
+    built every time. At most ``MAXSIZE`` targets are kept.
+    """
+    key = _key(build)
+    try:
+        return _TARGETS[key]
+    except KeyError:
+        pass
+    except TypeError:
+        return build()
+    value = build()
+    with _LOCK:
+        if key not in _TARGETS:
+            while len(_TARGETS) >= MAXSIZE:
+                del _TARGETS[next(iter(_TARGETS))]
+        return _TARGETS.setdefault(key, value)
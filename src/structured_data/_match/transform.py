@@ -0,0 +1,92 @@
+"""Structure-sharing rewrites of ADT trees."""
+
+import typing
+
+from .. import _stack_iter
+from .._adt import layout
+from .._adt.constructor import ADTConstructor
+from .._unpack import unpack
+
+_NOT_DONE = object()
+
+
+def _rebuild(node: typing.Any, results: typing.Dict[int, typing.Tuple]) -> typing.Any:
+    """Return ``node`` with its transformed children, reusing it if none changed."""
+    fields = unpack(node)
+    new_fields = [
+        results[id(field)][1] if isinstance(field, ADTConstructor) else field
+        for field in fields
+    ]
+    for old, new in zip(fields, new_fields):
+        if old is not new:
+            return layout.rebuild(type(node), new_fields)
+    return node
+
+
+def _children(
+    node: typing.Any, results: typing.Dict[int, typing.Tuple]
+) -> typing.List[typing.Any]:
+    return [
+        field
+        for field in reversed(unpack(node))
+        if isinstance(field, ADTConstructor) and id(field) not in results
+    ]
+
+
+def transform(
+    value: typing.Any,
+    func: typing.Callable[[typing.Any], typing.Any],
+    *,
+    top_down: bool = False,
+) -> typing.Any:
+    """Rewrite ``value``, and the ADT instances reachable through its fields.
+
+    Only fields that hold ADT instances are followed: instances inside other
+    containers, such as a list held in a field, are left as they are.
+
+    By default, the rewrite is bottom-up: each instance's fields are
+    transformed, and ``func`` receives the result. With ``top_down``, ``func``
+    receives each original instance, and the fields of its result are
+    transformed instead.
+
+    Instances are only rebuilt if a field changed identity, so unchanged
+    subtrees are shared with the original, and shared subtrees are only
+    transformed once. The traversal uses an explicit stack, so it isn't
+    limited by the recursion limit.
+    """
+    if not isinstance(value, ADTConstructor):
+        raise TypeError(f"{value!r} is not an ADT instance")
+    # Keyed by id. Each entry holds the original, and the root holds the
+    # originals, so the ids can't be reused.
+    results: typing.Dict[int, typing.Tuple] = {}
+    # The results of ``func`` in top-down mode, kept alive for the same reason.
+    replaced: typing.List[typing.Any] = []
+
+    def process(
+        item: typing.Tuple[typing.Any, typing.Any]
+    ) -> typing.Optional[_stack_iter.Action]:
+        node, replacement = item
+        if id(node) in results:
+            return None
+        if replacement is _NOT_DONE:
+            if top_down:
+                replacement = func(node)
+                if not isinstance(replacement, ADTConstructor):
+                    results[id(node)] = (node, replacement)
+                    return None
+                replaced.append(replacement)
+            else:
+                replacement = node
+            return _stack_iter.Extend(
+                [(node, replacement)]
+                + [(child, _NOT_DONE) for child in _children(replacement, results)]
+            )
+        result = _rebuild(replacement, results)
+        if not top_down:
+            result = func(result)
+        results[id(node)] = (node, result)
+        return None
+
+    for _ in _stack_iter.stack_iter((value, _NOT_DONE), process):
+        pass
+    return results[id(value)][1]
@@ -0,0 +1,108 @@
+"""Eagerly doing the work that dispatch functions otherwise do lazily."""
+
+import gc
+import importlib
+import types
+import typing
+
+from ._adt import layout
+from ._adt import replace
+from ._match import fold
+from ._match.descriptor import call_plan
+from ._match.descriptor import common
+from ._match.descriptor import function
+from ._match.descriptor import property_
+
+
+Bases = typing.Sequence[type]
+
+
+def _prepare_template(
+    template: common.MatchTemplate, base: typing.Optional[type], sum_bases: Bases
+) -> None:
+    if base is None and template.abstract:
+        # There's no telling which Sum the arguments will come from.
+        for sum_base in sum_bases:
+            template.prepare(sum_base)
+    else:
+        template.prepare(base)
+
+
+def _prepare_descriptor(
+    descriptor: common.Descriptor, owner: typing.Optional[type], sum_bases: Bases
+) -> None:
+    # The base that each kind of descriptor dispatches in the context of.
+    sum_base = owner if owner is not None and layout.is_sum_base(owner) else None
+    if isinstance(descriptor, function.Function):
+        _prepare_template(descriptor.matchers, sum_base, sum_bases)
+        call_plan.descriptor_plan(descriptor)
+    elif isinstance(descriptor, function.ClassMethod):
+        descriptor.matchers.prepare(owner)
+        call_plan.descriptor_plan(descriptor)
+    elif isinstance(descriptor, function.StaticMethod):
+        descriptor.matchers.prepare(None)
+        call_plan.descriptor_plan(descriptor)
+    elif isinstance(descriptor, property_.Property):
+        _prepare_template(descriptor.get_matchers, sum_base, sum_bases)
+        _prepare_template(descriptor.set_matchers, sum_base, sum_bases)
+        _prepare_template(descriptor.delete_matchers, sum_base, sum_bases)
+    if owner is not None and descriptor.__name__ is not None:
+        # Build the class-level proxy.
+        getattr(owner, descriptor.__name__, None)
+
+
+def _prepare_class(cls: type, sum_bases: Bases) -> None:
+    if layout.is_sum_base(cls):
+        for constructor in layout.constructors(cls):
+            replace.field_indexes(constructor)
+            fold.recursive_fields(constructor)
+    elif layout.is_product(cls):
+        replace.field_indexes(cls)
+    for klass in cls.__mro__:
+        for value in list(vars(klass).values()):
+            if isinstance(value, common.Descriptor):
+                _prepare_descriptor(value, cls, sum_bases)
+
+
+def warmup(
+    *,
+    modules: typing.Iterable[typing.Union[str, types.ModuleType]] = (),
+    classes: typing.Iterable[type] = (),
+    freeze: bool = False,
+) -> None:
+    """Do the work that dispatch functions would otherwise do on first use.
+
+    ``modules`` are module objects or names to import. Dispatch functions
+    defined at module level in them, and in the classes they define, are
+    prepared, along with those in ``classes``. That means resolving each
+    function's patterns, for each Sum it dispatches on, and planning how to
+    call it and its implementations. Patterns made with ``Placeholder``
+    outside of a Sum are resolved for every Sum in ``classes`` and
+    ``modules``. ADT classes found along the way have their field lookups
+    cached.
+
+    If ``freeze`` is true, finish by collecting garbage and calling
+    ``gc.freeze()``, so that processes forked afterwards share the prepared
+    data with the parent instead of copying it.
+    """
+    to_prepare = list(classes)
+    descriptors = []
+    for module in modules:
+        if isinstance(module, str):
+            module = importlib.import_module(module)
+        for value in list(vars(module).values()):
+            if isinstance(value, common.Descriptor):
+                descriptors.append(value)
+            elif (
+                isinstance(value, type)
+                and getattr(value, "__module__", None) == module.__name__
+            ):
+                to_prepare.append(value)
+    sum_bases = [cls for cls in to_prepare if layout.is_sum_base(cls)]
+    for descriptor in descriptors:
+        _prepare_descriptor(descriptor, None, sum_bases)
+    for cls in to_prepare:
+        _prepare_class(cls, sum_bases)
+    if freeze:
+        gc.collect()
+        gc.freeze()
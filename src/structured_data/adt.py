@@ -44,7 +44,11 @@ Putting it together:
 import typing
 
 from ._adt.constructor import SumBase
+from ._adt.metadata_cache import disable as disable_metadata_cache
+from ._adt.metadata_cache import enable as enable_metadata_cache
 from ._adt.product_type import Product
+from ._adt.replace import replace
+from ._adt.replace import replace_in
 from ._adt.sum_type import Sum
 
 if typing.TYPE_CHECKING:  # pragma: nocover
@@ -67,4 +71,13 @@ else:
     from ._adt.ctor import Ctor
 
 
-__all__ = ["Ctor", "Product", "Sum", "SumBase"]
+__all__ = [
+    "Ctor",
+    "Product",
+    "Sum",
+    "SumBase",
+    "disable_metadata_cache",
+    "enable_metadata_cache",
+    "replace",
+    "replace_in",
+]
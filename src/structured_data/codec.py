@@ -0,0 +1,434 @@
+"""A compact binary serialization format for ADT values.
+
+Unlike pickle, which stores a qualified name for every instance, a ``Codec``
+is constructed with the ADT classes it has to handle, and refers to each
+constructor by a small integer. Both sides of a connection must construct
+their ``Codec`` from the same classes in the same order, and this is checked
+using a fingerprint of the class definitions.
+
+>>> from structured_data import adt
+>>> class Shape(adt.Sum):
+...     Circle: adt.Ctor[float]
+...     Rectangle: adt.Ctor[float, float]
+>>> shapes = Codec(Shape)
+>>> data = shapes.dumps([Shape.Circle(1.0), Shape.Rectangle(2.0, 3.0)])
+>>> shapes.loads(data)
+[Shape.Circle(1.0), Shape.Rectangle(2.0, 3.0)]
+
+Format
+------
+
+A serialized value starts with a header: the bytes ``b"SDC"``, a format
+version byte, and the eight-byte schema fingerprint. The header is followed by
+a single encoded value. Streams written by ``Codec.dump_iter`` have one header,
+followed by any number of records, each of which is a varint byte length
+followed by an encoded value.
+
+Every encoded value starts with a tag byte:
+
+- ``0x00``, ``0x01``, ``0x02``: ``None``, ``False``, ``True``.
+- ``0x03``: an ``int``, as a zigzag varint.
+- ``0x04``: a ``float``, as a little-endian double.
+- ``0x05``: a ``str``, as a varint byte length and UTF-8 data.
+- ``0x06``: ``bytes``, as a varint length and the raw data.
+- ``0x07``, ``0x08``: a ``tuple`` or ``list``, as a varint length followed by
+  the items.
+- ``0x09``: a ``dict``, as a varint length followed by alternating keys and
+  values.
+- ``0x0A``: an ADT instance, as a varint type id followed by the fields.
+- ``0x0B``: a reference to an earlier ADT instance, as a varint index.
+- ``0x10`` through ``0xFF``: an ADT instance with type id ``tag - 0x10``,
+  followed by the fields.
+
+Type ids are assigned in the order the classes were given to the ``Codec``:
+each ``Sum`` subclass takes one id per constructor, in definition order, and
+each ``Product`` subclass takes one id. Fields are written in constructor
+order, so a type id determines how many values follow it.
+
+When values are dumped with ``share=True``, every ADT instance that appears
+more than once in the value is written once, and later occurrences are written
+as references. Instances are numbered in the order that their encodings end.
+"""
+
+import hashlib
+import struct
+import typing
+
+from ._adt import layout
+from ._unpack import unpack
+
+MAGIC = b"SDC"
+VERSION = 1
+
+_HEADER = struct.Struct("<3sB8s")
+_DOUBLE = struct.Struct("<d")
+
+_NONE = 0x00
+_FALSE = 0x01
+_TRUE = 0x02
+_INT = 0x03
+_FLOAT = 0x04
+_STR = 0x05
+_BYTES = 0x06
+_TUPLE = 0x07
+_LIST = 0x08
+_DICT = 0x09
+_ADT = 0x0A
+_REF = 0x0B
+_SMALL_ADT = 0x10
+
+Stack = typing.List[typing.Any]
+Memo = typing.Optional[typing.Dict[int, int]]
+Writer = typing.Callable[[typing.Any, bytearray, Stack, Memo], None]
+
+
+def _write_varint(out: bytearray, number: int) -> None:
+    while number > 0x7F:
+        out.append((number & 0x7F) | 0x80)
+        number >>= 7
+    out.append(number)
+
+
+def _read_varint(view: memoryview, pos: int) -> typing.Tuple[int, int]:
+    number = 0
+    shift = 0
+    while True:
+        byte = view[pos]
+        pos += 1
+        number |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return number, pos
+        shift += 7
+
+
+def _zigzag(number: int) -> int:
+    return number << 1 if number >= 0 else ((-number) << 1) - 1
+
+
+def _unzigzag(number: int) -> int:
+    return -((number + 1) >> 1) if number & 1 else number >> 1
+
+
+def _write_none(value: None, out: bytearray, stack: Stack, memo: Memo) -> None:
+    out.append(_NONE)
+
+
+def _write_bool(value: bool, out: bytearray, stack: Stack, memo: Memo) -> None:
+    out.append(_TRUE if value else _FALSE)
+
+
+def _write_int(value: int, out: bytearray, stack: Stack, memo: Memo) -> None:
+    out.append(_INT)
+    _write_varint(out, _zigzag(value))
+
+
+def _write_float(value: float, out: bytearray, stack: Stack, memo: Memo) -> None:
+    out.append(_FLOAT)
+    out += _DOUBLE.pack(value)
+
+
+def _write_str(value: str, out: bytearray, stack: Stack, memo: Memo) -> None:
+    data = value.encode("utf-8")
+    out.append(_STR)
+    _write_varint(out, len(data))
+    out += data
+
+
+def _write_bytes(value: bytes, out: bytearray, stack: Stack, memo: Memo) -> None:
+    out.append(_BYTES)
+    _write_varint(out, len(value))
+    out += value
+
+
+def _write_memoryview(
+    value: memoryview, out: bytearray, stack: Stack, memo: Memo
+) -> None:
+    # The length has to count bytes, not items of the view's format.
+    data = value.cast("B") if value.c_contiguous else value.tobytes()
+    _write_bytes(data, out, stack, memo)
+
+
+def _sequence_writer(tag: int) -> Writer:
+    def write(value: typing.Sequence, out: bytearray, stack: Stack, memo: Memo) -> None:
+        out.append(tag)
+        _write_varint(out, len(value))
+        stack.extend(reversed(value))
+
+    return write
+
+
+def _write_dict(value: typing.Dict, out: bytearray, stack: Stack, memo: Memo) -> None:
+    out.append(_DICT)
+    _write_varint(out, len(value))
+    for item in reversed(value.items()):
+        stack.extend(reversed(item))
+
+
+class _Assign:
+    """Stack marker: the encoding of ``value`` just ended."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: typing.Any) -> None:
+        self.value = value
+
+
+def _adt_writer(type_id: int) -> Writer:
+    header = bytearray()
+    if _SMALL_ADT + type_id <= 0xFF:
+        header.append(_SMALL_ADT + type_id)
+    else:
+        header.append(_ADT)
+        _write_varint(header, type_id)
+    header_bytes = bytes(header)
+
+    def write(value: tuple, out: bytearray, stack: Stack, memo: Memo) -> None:
+        if memo is not None:
+            index = memo.get(id(value))
+            if index is not None:
+                out.append(_REF)
+                _write_varint(out, index)
+                return
+            stack.append(_Assign(value))
+        out += header_bytes
+        stack.extend(reversed(unpack(value)))
+
+    return write
+
+
+_PRIMITIVE_WRITERS: typing.Dict[type, Writer] = {
+    type(None): _write_none,
+    bool: _write_bool,
+    int: _write_int,
+    float: _write_float,
+    str: _write_str,
+    bytes: _write_bytes,
+    bytearray: _write_bytes,
+    memoryview: _write_memoryview,
+    tuple: _sequence_writer(_TUPLE),
+    list: _sequence_writer(_LIST),
+    dict: _write_dict,
+}
+
+
+_CONTAINERS: typing.Dict[int, type] = {_TUPLE: tuple, _LIST: list, _DICT: dict}
+
+
+def _schema(classes: typing.Iterable[type]) -> typing.Iterator[typing.Tuple]:
+    for cls in classes:
+        if layout.is_sum_base(cls):
+            for constructor in layout.constructors(cls):
+                yield (
+                    cls.__qualname__,
+                    constructor.__name__,
+                    layout.field_names(constructor),
+                )
+        elif layout.is_product(cls):
+            yield (cls.__qualname__, None, layout.field_names(cls))
+        else:
+            raise TypeError(f"{cls!r} is not a Sum or Product subclass")
+
+
+class Codec:
+    """Encoder and decoder for the values of a fixed collection of ADT classes.
+
+    Values may be ADT instances of the given classes, ``None``, ``bool``,
+    ``int``, ``float``, ``str``, bytes-like objects, and tuples, lists, and
+    dicts of supported values. Subclasses of the builtin types are not
+    supported.
+    """
+
+    def __init__(self, *classes: type) -> None:
+        self.classes = classes
+        schema = tuple(_schema(classes))
+        self.fingerprint = hashlib.blake2b(
+            repr(schema).encode("utf-8"), digest_size=8
+        ).digest()
+        self._header = _HEADER.pack(MAGIC, VERSION, self.fingerprint)
+        self._writers: typing.Dict[type, Writer] = dict(_PRIMITIVE_WRITERS)
+        self._readers: typing.List[typing.Tuple[type, int]] = []
+        adt_classes = [
+            constructor
+            for cls in classes
+            for constructor in (
+                layout.constructors(cls) if layout.is_sum_base(cls) else (cls,)
+            )
+        ]
+        for type_id, cls in enumerate(adt_classes):
+            self._writers[cls] = _adt_writer(type_id)
+            self._readers.append((cls, len(layout.field_names(cls))))
+
+    def _encode(self, value: typing.Any, out: bytearray, share: bool) -> None:
+        memo: Memo = {} if share else None
+        writers = self._writers
+        stack = [value]
+        while stack:
+            item = stack.pop()
+            if item.__class__ is _Assign:
+                # The cast is safe because the marker is only pushed when sharing.
+                typing.cast(dict, memo)[id(item.value)] = len(typing.cast(dict, memo))
+                continue
+            try:
+                writer = writers[item.__class__]
+            except KeyError:
+                raise TypeError(f"Cannot encode value of type {type(item)!r}")
+            writer(item, out, stack, memo)
+
+    def _check_header(self, header: typing.Union[bytes, memoryview]) -> None:
+        try:
+            magic, version, fingerprint = _HEADER.unpack(header)
+        except struct.error:
+            raise ValueError("Truncated header")
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Not a structured_data codec stream")
+        if fingerprint != self.fingerprint:
+            raise ValueError("Schema fingerprint does not match this codec")
+
+    def _decode(  # noqa: C901
+        self, view: memoryview, pos: int, zero_copy: bool
+    ) -> typing.Tuple[typing.Any, int]:
+        # pylint: disable=too-many-branches,too-many-statements
+        readers = self._readers
+        table: typing.List[typing.Any] = []
+        # Each frame is [container type or ADT class, field count, items]
+        stack: typing.List[typing.List[typing.Any]] = []
+        while True:
+            tag = view[pos]
+            pos += 1
+            if tag >= _SMALL_ADT or tag == _ADT:
+                if tag == _ADT:
+                    type_id, pos = _read_varint(view, pos)
+                else:
+                    type_id = tag - _SMALL_ADT
+                cls, arity = readers[type_id]
+                if arity:
+                    stack.append([cls, arity, []])
+                    continue
+                value = layout.rebuild(cls, ())
+                table.append(value)
+            elif tag == _NONE:
+                value = None
+            elif tag == _FALSE:
+                value = False
+            elif tag == _TRUE:
+                value = True
+            elif tag == _INT:
+                number, pos = _read_varint(view, pos)
+                value = _unzigzag(number)
+            elif tag == _FLOAT:
+                (value,) = _DOUBLE.unpack_from(view, pos)
+                pos += _DOUBLE.size
+            elif tag in (_STR, _BYTES):
+                length, start = _read_varint(view, pos)
+                pos = start + length
+                data = view[start:pos]
+                if tag == _STR:
+                    value = str(data, "utf-8")
+                else:
+                    value = data if zero_copy else bytes(data)
+            elif tag in (_TUPLE, _LIST, _DICT):
+                length, pos = _read_varint(view, pos)
+                container = _CONTAINERS[tag]
+                if length:
+                    stack.append(
+                        [container, 2 * length if tag == _DICT else length, []]
+                    )
+                    continue
+                value = container()
+            elif tag == _REF:
+                index, pos = _read_varint(view, pos)
+                value = table[index]
+            else:
+                raise ValueError(f"Unknown tag {tag:#04x}")
+            while stack:
+                frame = stack[-1]
+                items = frame[2]
+                items.append(value)
+                if len(items) < frame[1]:
+                    break
+                stack.pop()
+                kind = frame[0]
+                if kind is tuple or kind is list:
+                    value = kind(items)
+                elif kind is dict:
+                    value = dict(zip(items[::2], items[1::2]))
+                else:
+                    value = layout.rebuild(kind, items)
+                    table.append(value)
+            else:
+                return value, pos
+
+    def _decode_all(self, view: memoryview, pos: int, zero_copy: bool) -> typing.Any:
+        """Decode a value that should end exactly at the end of ``view``."""
+        try:
+            value, pos = self._decode(view, pos, zero_copy)
+        except (IndexError, TypeError, struct.error) as error:
+            # Reading past the end, or a bad type id or reference.
+            raise ValueError(f"Truncated or corrupt data: {error}") from error
+        if pos != len(view):
+            raise ValueError("Trailing data after value")
+        return value
+
+    def dumps(self, value: typing.Any, *, share: bool = False) -> bytes:
+        """Return the serialized form of ``value``, including the header.
+
+        If ``share`` is true, repeated ADT instances are only written once.
+        """
+        out = bytearray(self._header)
+        self._encode(value, out, share)
+        return bytes(out)
+
+    def loads(self, data: typing.Any, *, zero_copy: bool = False) -> typing.Any:
+        """Return the value serialized in the bytes-like object ``data``.
+
+        The data is read through a ``memoryview``, so it is never copied as a
+        whole. If ``zero_copy`` is true, ``bytes`` values are returned as
+        ``memoryview`` slices of ``data``, instead of being copied out.
+        """
+        view = memoryview(data).cast("B")
+        self._check_header(view[: _HEADER.size])
+        return self._decode_all(view, _HEADER.size, zero_copy)
+
+    def dump_iter(
+        self,
+        values: typing.Iterable[typing.Any],
+        file: typing.BinaryIO,
+        *,
+        share: bool = False,
+    ) -> None:
+        """Write a header, then each value in ``values`` as a record to ``file``."""
+        file.write(self._header)
+        length = bytearray()
+        for value in values:
+            out = bytearray()
+            self._encode(value, out, share)
+            length.clear()
+            _write_varint(length, len(out))
+            file.write(length)
+            file.write(out)
+
+    def load_iter(
+        self, file: typing.BinaryIO, *, zero_copy: bool = False
+    ) -> typing.Iterator[typing.Any]:
+        """Read a stream written by ``dump_iter``, and yield each value in turn."""
+        self._check_header(file.read(_HEADER.size))
+        while True:
+            length = 0
+            shift = 0
+            while True:
+                byte = file.read(1)
+                if not byte:
+                    if shift:
+                        raise ValueError("Truncated record length")
+                    return
+                length |= (byte[0] & 0x7F) << shift
+                if byte[0] < 0x80:
+                    break
+                shift += 7
+            data = file.read(length)
+            if len(data) != length:
+                raise ValueError("Truncated record")
+            yield self._decode_all(memoryview(data), 0, zero_copy)
+
+
+__all__ = ["Codec"]
@@ -0,0 +1,470 @@
+"""Column-oriented containers for large collections of ADT values.
+
+A ``ProductArray`` holds instances of a single ``Product`` subclass. Instead
+of one tuple per instance, it keeps one column per field. Fields annotated as
+``int`` or ``float`` are stored in ``array.array`` columns, and other fields in
+lists.
+
+>>> from structured_data import adt
+>>> class Point(adt.Product):
+...     x: int
+...     y: int
+>>> points = ProductArray[Point].from_iterable(Point(x, -x) for x in range(5))
+>>> points.column("y")
+array('q', [0, -1, -2, -3, -4])
+>>> points[3].x
+3
+>>> points.filter(lambda x: x % 2, "x").sort("y").materialize()
+[Point(3, -3), Point(1, -1)]
+
+A ``SumVector`` holds instances of a ``Sum`` subclass. It stores a compact
+array of constructor tags, and separate columns for each constructor's fields.
+
+>>> from structured_data import match
+>>> class Event(adt.Sum):
+...     Click: adt.Ctor[int, int]
+...     Key: adt.Ctor[str]
+>>> events = SumVector[Event]([Event.Click(0, 0), Event.Key("a"), Event.Click(1, 0)])
+>>> counts = events.count_by_constructor()
+>>> counts[Event.Click], counts[Event.Key]
+(2, 1)
+>>> events.where(Event.Click(match.pat._, 0)).materialize()
+[Event.Click(0, 0), Event.Click(1, 0)]
+"""
+
+import array
+import typing
+import weakref
+
+from ._adt import layout
+from ._match.patterns import basic_patterns
+from ._match.patterns import compound_match
+from ._unpack import unpack
+
+_TYPECODES = {int: "q", float: "d"}
+
+
+class _Columns:
+    """Field-per-column storage for the instances of one ADT class."""
+
+    __slots__ = ("cls", "names", "types", "columns", "length")
+
+    def __init__(self, cls: type) -> None:
+        self.cls = cls
+        self.names = layout.field_names(cls)
+        self.types = tuple(
+            layout.resolve(annotation, cls)
+            for annotation in layout.field_annotations(cls)
+        )
+        self.columns: typing.List[typing.MutableSequence] = [
+            array.array(_TYPECODES[type_]) if type_ in _TYPECODES else []
+            for type_ in self.types
+        ]
+        self.length = 0
+
+    def empty(self) -> "_Columns":
+        """Return empty storage with the same column types."""
+        new = _Columns.__new__(_Columns)
+        new.cls = self.cls
+        new.names = self.names
+        new.types = self.types
+        new.columns = [column[:0] for column in self.columns]
+        new.length = 0
+        return new
+
+    def append(self, fields: typing.Sequence) -> None:
+        """Add a row of field values.
+
+        If a value doesn't have exactly the type of an array column, or is too
+        large for it, the column is converted to a list, so values always
+        round-trip unchanged, and no value can fail to be added.
+        """
+        for index, field in enumerate(fields):
+            column = self.columns[index]
+            if isinstance(column, array.array):
+                if field.__class__ is self.types[index]:
+                    try:
+                        column.append(field)
+                        continue
+                    except OverflowError:
+                        pass
+                column = self.columns[index] = list(column)
+            column.append(field)
+        self.length += 1
+
+    def row(self, index: int) -> typing.Tuple:
+        """Return the field values of a row."""
+        return tuple(column[index] for column in self.columns)
+
+    def build(self, index: int) -> typing.Any:
+        """Return an instance made from the values of a row."""
+        return layout.rebuild(self.cls, [column[index] for column in self.columns])
+
+    def take(self, indices: typing.Iterable[int]) -> "_Columns":
+        """Return new storage containing the given rows, in the given order."""
+        new = self.empty()
+        indices = list(indices)
+        new.columns = [
+            array.array(column.typecode, [column[index] for index in indices])
+            if isinstance(column, array.array)
+            else [column[index] for index in indices]
+            for column in self.columns
+        ]
+        new.length = len(indices)
+        return new
+
+    def column(self, name: str) -> typing.MutableSequence:
+        """Return the column for the given field name."""
+        try:
+            return self.columns[self.names.index(name)]
+        except ValueError:
+            raise AttributeError(name)
+
+
+class Row:
+    """A lazy view of one row of a ``ProductArray``.
+
+    Field values are read from the array's columns when they are accessed.
+    """
+
+    __slots__ = ("_array", "_index")
+
+    def __init__(self, array_: "ProductArray", index: int) -> None:
+        self._array = array_
+        self._index = index
+
+    def __getattr__(self, name: str) -> typing.Any:
+        # pylint: disable=protected-access
+        return self._array._columns.column(name)[self._index]
+
+    def materialize(self) -> typing.Any:
+        """Return the ``Product`` instance this row represents."""
+        # pylint: disable=protected-access
+        return self._array._columns.build(self._index)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Row):
+            other = other.materialize()
+        return self.materialize() == other
+
+    def __ne__(self, other: object) -> bool:
+        return not self == other
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        return f"<Row {self._index} of {self.materialize()!r}>"
+
+
+_SPECIALIZATIONS: typing.MutableMapping[type, type] = weakref.WeakKeyDictionary()
+
+T = typing.TypeVar("T", bound="ProductArray")
+
+
+class ProductArray:
+    """A container for instances of one ``Product`` subclass, stored by column.
+
+    Index the class with a ``Product`` subclass to get a container type for
+    it: ``ProductArray[Point]``.
+    """
+
+    __slots__ = ("_columns",)
+
+    product: typing.ClassVar[type]
+
+    def __class_getitem__(cls, product: type) -> type:
+        if not layout.is_product(product):
+            raise TypeError(f"{product!r} is not a Product subclass")
+        specialized = _SPECIALIZATIONS.get(product)
+        if specialized is None:
+            specialized = _SPECIALIZATIONS.setdefault(
+                product,
+                type(
+                    f"{cls.__name__}[{product.__qualname__}]",
+                    (cls,),
+                    {"__slots__": (), "product": product},
+                ),
+            )
+        return specialized
+
+    def __init__(self, iterable: typing.Iterable = ()) -> None:
+        try:
+            product = self.product
+        except AttributeError:
+            raise TypeError("Index ProductArray with a Product subclass first.")
+        self._columns = _Columns(product)
+        self.extend(iterable)
+
+    @classmethod
+    def from_iterable(cls: typing.Type[T], iterable: typing.Iterable) -> T:
+        """Return a new array containing the instances from ``iterable``."""
+        return cls(iterable)
+
+    def _from_columns(self: T, columns: _Columns) -> T:
+        new = self.__class__.__new__(self.__class__)
+        new._columns = columns
+        return new
+
+    def append(self, value: typing.Any) -> None:
+        """Add an instance to the end of the array."""
+        if value.__class__ is not self.product:
+            raise TypeError(value)
+        self._columns.append(unpack(value))
+
+    def extend(self, iterable: typing.Iterable) -> None:
+        """Add every instance from ``iterable`` to the end of the array."""
+        for value in iterable:
+            self.append(value)
+
+    def __len__(self) -> int:
+        return self._columns.length
+
+    def __getitem__(self, index: typing.Any) -> typing.Any:
+        if isinstance(index, slice):
+            return self.take(range(*index.indices(len(self))))
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError(index)
+        return Row(self, index)
+
+    def __iter__(self) -> typing.Iterator[Row]:
+        for index in range(len(self)):
+            yield Row(self, index)
+
+    def column(self, name: str) -> typing.Sequence:
+        """Return the column for a field. It should not be modified."""
+        return self._columns.column(name)
+
+    def as_numpy(self, name: str) -> typing.Any:
+        """Return a field's column as a NumPy array.
+
+        Numeric columns are wrapped without copying. This requires NumPy.
+        """
+        import numpy  # pylint: disable=import-outside-toplevel
+
+        column = self._columns.column(name)
+        if isinstance(column, array.array):
+            return numpy.frombuffer(column, dtype=column.typecode)
+        return numpy.array(column)
+
+    def take(self: T, indices: typing.Iterable[int]) -> T:
+        """Return a new array containing the rows at the given indices."""
+        return self._from_columns(self._columns.take(indices))
+
+    def filter(self: T, predicate: typing.Callable[..., bool], *names: str) -> T:
+        """Return the rows where ``predicate`` is true.
+
+        The predicate is called with the values of the named fields.
+        """
+        columns = [self._columns.column(name) for name in names]
+        return self.take(
+            index for (index, values) in enumerate(zip(*columns)) if predicate(*values)
+        )
+
+    def sort(self: T, *names: str, reverse: bool = False) -> T:
+        """Return the rows, sorted by the values of the named fields."""
+        if not names:
+            names = self._columns.names
+        columns = [self._columns.column(name) for name in names]
+        if len(columns) == 1:
+            key = columns[0].__getitem__
+        else:
+            keys = list(zip(*columns))
+            key = keys.__getitem__
+        return self.take(sorted(range(len(self)), key=key, reverse=reverse))
+
+    def materialize(self) -> typing.List[typing.Any]:
+        """Return a list of ``Product`` instances."""
+        build = self._columns.build
+        return [build(index) for index in range(len(self))]
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.materialize()!r})"
+
+
+_VECTOR_SPECIALIZATIONS: typing.MutableMapping[type, type] = weakref.WeakKeyDictionary()
+
+V = typing.TypeVar("V", bound="SumVector")
+
+
+def _field_condition(
+    field: typing.Any,
+) -> typing.Optional[typing.Tuple[typing.Any]]:
+    if field is basic_patterns.DISCARD or isinstance(field, basic_patterns.Pattern):
+        return None
+    if isinstance(field, (tuple, compound_match.CompoundMatch)):
+        raise ValueError("Only literals and names can be matched by column.")
+    return (field,)
+
+
+class SumVector:
+    """A container for instances of one ``Sum`` subclass, stored by column.
+
+    The constructor of each element is stored as a tag in a compact array, and
+    the fields of each constructor are stored in their own columns. Elements
+    are only converted back to instances when they are accessed.
+
+    Index the class with a ``Sum`` subclass to get a container type for it:
+    ``SumVector[Event]``.
+    """
+
+    __slots__ = ("_tags", "_positions", "_stores", "_indices")
+
+    base: typing.ClassVar[type]
+    constructors: typing.ClassVar[typing.Tuple[type, ...]]
+    _tag_of: typing.ClassVar[typing.Dict[type, int]]
+    _typecode: typing.ClassVar[str]
+
+    def __class_getitem__(cls, base: type) -> type:
+        if not layout.is_sum_base(base):
+            raise TypeError(f"{base!r} is not a Sum subclass")
+        specialized = _VECTOR_SPECIALIZATIONS.get(base)
+        if specialized is None:
+            constructors = layout.constructors(base)
+            specialized = _VECTOR_SPECIALIZATIONS.setdefault(
+                base,
+                type(
+                    f"{cls.__name__}[{base.__qualname__}]",
+                    (cls,),
+                    {
+                        "__slots__": (),
+                        "base": base,
+                        "constructors": constructors,
+                        "_tag_of": {
+                            constructor: tag
+                            for (tag, constructor) in enumerate(constructors)
+                        },
+                        "_typecode": "B" if len(constructors) <= 0x100 else "H",
+                    },
+                ),
+            )
+        return specialized
+
+    def __init__(self, iterable: typing.Iterable = ()) -> None:
+        try:
+            constructors = self.constructors
+        except AttributeError:
+            raise TypeError("Index SumVector with a Sum subclass first.")
+        self._tags = array.array(self._typecode)
+        self._positions = array.array("q")
+        self._stores = [_Columns(constructor) for constructor in constructors]
+        self._indices = [array.array("q") for _ in constructors]
+        self.extend(iterable)
+
+    @classmethod
+    def from_iterable(cls: typing.Type[V], iterable: typing.Iterable) -> V:
+        """Return a new vector containing the instances from ``iterable``."""
+        return cls(iterable)
+
+    def append(self, value: typing.Any) -> None:
+        """Add an instance to the end of the vector."""
+        try:
+            tag = self._tag_of[value.__class__]
+        except KeyError:
+            raise TypeError(value)
+        store = self._stores[tag]
+        position = store.length
+        store.append(unpack(value))
+        self._indices[tag].append(len(self._tags))
+        self._tags.append(tag)
+        self._positions.append(position)
+
+    def extend(self, iterable: typing.Iterable) -> None:
+        """Add every instance from ``iterable`` to the end of the vector."""
+        for value in iterable:
+            self.append(value)
+
+    def __len__(self) -> int:
+        return len(self._tags)
+
+    def __getitem__(self, index: typing.Any) -> typing.Any:
+        if isinstance(index, slice):
+            return self.take(range(*index.indices(len(self))))
+        return self._stores[self._tags[index]].build(self._positions[index])
+
+    def __iter__(self) -> typing.Iterator[typing.Any]:
+        stores = self._stores
+        for tag, position in zip(self._tags, self._positions):
+            yield stores[tag].build(position)
+
+    def _tag(self, constructor: type) -> int:
+        try:
+            return self._tag_of[constructor]
+        except KeyError:
+            raise TypeError(constructor)
+
+    def take(self: V, indices: typing.Iterable[int]) -> V:
+        """Return a new vector containing the elements at the given indices."""
+        new = self.__class__()
+        new._stores = [store.empty() for store in self._stores]
+        stores = self._stores
+        for index in indices:
+            tag = self._tags[index]
+            new_store = new._stores[tag]
+            position = new_store.length
+            new_store.append(stores[tag].row(self._positions[index]))
+            new._indices[tag].append(len(new._tags))
+            new._tags.append(tag)
+            new._positions.append(position)
+        return new
+
+    def count_by_constructor(self) -> typing.Dict[type, int]:
+        """Return the number of elements made with each constructor."""
+        return {
+            constructor: len(indices)
+            for (constructor, indices) in zip(self.constructors, self._indices)
+        }
+
+    def select(self: V, constructor: type) -> V:
+        """Return the elements made with the given constructor."""
+        return self.take(self._indices[self._tag(constructor)])
+
+    def partition(self: V) -> typing.Dict[type, V]:
+        """Split the vector into one vector per constructor."""
+        return {
+            constructor: self.take(indices)
+            for (constructor, indices) in zip(self.constructors, self._indices)
+        }
+
+    def column(self, constructor: type, index: int) -> typing.Sequence:
+        """Return the column for one field of one constructor.
+
+        The column holds the field's value for every element made with the
+        constructor, in order. It should not be modified.
+        """
+        return self._stores[self._tag(constructor)].columns[index]
+
+    def where(self: V, target: typing.Any) -> V:
+        """Return the elements that match a simple target.
+
+        The target must be a constructor called with literals and names, such
+        as ``Event.Click(match.pat._, 3)``. Names match anything. Literals are
+        compared against the field's column, without building instances.
+        """
+        tag = self._tag(target.__class__)
+        store = self._stores[tag]
+        conditions = [
+            (column, condition[0])
+            for (column, condition) in zip(
+                store.columns, map(_field_condition, unpack(target))
+            )
+            if condition is not None
+        ]
+        indices = self._indices[tag]
+        return self.take(
+            indices[position]
+            for position in range(store.length)
+            if all(literal == column[position] for (column, literal) in conditions)
+        )
+
+    def materialize(self) -> typing.List[typing.Any]:
+        """Return a list of ``Sum`` instances."""
+        return list(self)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.materialize()!r})"
+
+
+__all__ = ["ProductArray", "Row", "SumVector"]
@@ -0,0 +1,372 @@
+"""Conversion between ADT values and JSON-compatible data.
+
+``to_json`` converts a value into dicts, lists, and primitives that the
+standard ``json`` module can serialize. ``from_json`` converts such data back,
+guided by the type it is expected to have.
+
+A ``Sum`` instance becomes a single-key dict, mapping the constructor name to a
+list of the constructor's fields. A ``Product`` instance becomes a dict of its
+fields.
+
+>>> from structured_data import adt
+>>> class Tree(adt.Sum):
+...     Leaf: adt.Ctor[int]
+...     Node: adt.Ctor["Tree", "Tree"]
+>>> to_json(Tree.Node(Tree.Leaf(1), Tree.Leaf(2)))
+{'Node': [{'Leaf': [1]}, {'Leaf': [2]}]}
+>>> from_json({'Node': [{'Leaf': [1]}, {'Leaf': [2]}]}, Tree)
+Tree.Node(Tree.Leaf(1), Tree.Leaf(2))
+
+The conversions are driven by per-class converters generated from the field
+annotations, and use an explicit stack, so deeply nested values do not hit the
+recursion limit. Fields annotated as ADT classes, ``Optional``, ``List``,
+``Sequence``, ``Tuple``, or ``Dict`` types of those are converted, and other
+fields are passed through unchanged.
+"""
+
+import collections.abc
+import json
+import typing
+import weakref
+
+from ._adt import layout
+from ._unpack import unpack
+
+JSON = typing.Any
+
+
+class _Shape:
+    """The expected type of a piece of JSON data."""
+
+    __slots__ = ()
+
+    def children(
+        self, data: JSON
+    ) -> typing.Optional[typing.Tuple[typing.List, typing.Callable]]:
+        """Return the child shapes and data, and a finishing function.
+
+        Return ``None`` if the data can be returned as-is.
+        """
+        raise NotImplementedError
+
+
+class _Leaf(_Shape):
+    """Data that is passed through unchanged."""
+
+    __slots__ = ()
+
+    def children(self, data: JSON) -> None:
+        """Pass through the data."""
+        return None
+
+
+_LEAF = _Leaf()
+
+
+class _Optional(_Shape):
+    __slots__ = ("shape",)
+
+    def __init__(self, shape: _Shape) -> None:
+        self.shape = shape
+
+    def children(self, data: JSON) -> typing.Optional[typing.Tuple]:
+        """Pass through ``None``, and otherwise convert the data."""
+        if data is None:
+            return None
+        return [(self.shape, data)], _first
+
+
+class _Sequence(_Shape):
+    __slots__ = ("shape", "factory")
+
+    def __init__(self, shape: _Shape, factory: type) -> None:
+        self.shape = shape
+        self.factory = factory
+
+    def children(self, data: JSON) -> typing.Tuple:
+        """Convert each item."""
+        if not isinstance(data, list):
+            raise ValueError(data)
+        return [(self.shape, item) for item in data], self.factory
+
+
+class _FixedTuple(_Shape):
+    __slots__ = ("shapes",)
+
+    def __init__(self, shapes: typing.Tuple[_Shape, ...]) -> None:
+        self.shapes = shapes
+
+    def children(self, data: JSON) -> typing.Tuple:
+        """Convert each item using its own shape."""
+        if not isinstance(data, list) or len(data) != len(self.shapes):
+            raise ValueError(data)
+        return list(zip(self.shapes, data)), tuple
+
+
+class _Dict(_Shape):
+    __slots__ = ("shape",)
+
+    def __init__(self, shape: _Shape) -> None:
+        self.shape = shape
+
+    def children(self, data: JSON) -> typing.Tuple:
+        """Convert each value."""
+        if not isinstance(data, dict):
+            raise ValueError(data)
+        keys = list(data)
+
+        def finish(values: typing.List) -> typing.Dict:
+            return dict(zip(keys, values))
+
+        return [(self.shape, data[key]) for key in keys], finish
+
+
+class _SumShape(_Shape):
+    __slots__ = ("cls",)
+
+    def __init__(self, cls: type) -> None:
+        self.cls = cls
+
+    def children(self, data: JSON) -> typing.Tuple:
+        """Look up the constructor, and convert each field."""
+        if not isinstance(data, dict) or len(data) != 1:
+            raise ValueError(data)
+        ((name, fields),) = data.items()
+        try:
+            constructor, shapes = _sum_decoders(self.cls)[name]
+        except KeyError:
+            raise ValueError(name)
+        if not isinstance(fields, list) or len(fields) != len(shapes):
+            raise ValueError(fields)
+
+        def finish(values: typing.List) -> typing.Any:
+            return constructor(*values)
+
+        return list(zip(shapes, fields)), finish
+
+
+class _ProductShape(_Shape):
+    __slots__ = ("cls",)
+
+    def __init__(self, cls: type) -> None:
+        self.cls = cls
+
+    def children(self, data: JSON) -> typing.Tuple:
+        """Convert each field that is present; the rest take their defaults."""
+        if not isinstance(data, dict):
+            raise ValueError(data)
+        shapes = _product_decoders(self.cls)
+        keys = list(data)
+        cls = self.cls
+
+        def finish(values: typing.List) -> typing.Any:
+            return cls(**dict(zip(keys, values)))
+
+        return [(shapes.get(key, _LEAF), data[key]) for key in keys], finish
+
+
+def _first(values: typing.List) -> typing.Any:
+    return values[0]
+
+
+_SEQUENCE_ORIGINS = {
+    list: list,
+    collections.abc.Sequence: list,
+    collections.abc.MutableSequence: list,
+    frozenset: frozenset,
+    set: set,
+}
+
+
+def _shape(annotation: typing.Any, cls: type) -> _Shape:
+    # pylint: disable=too-many-return-statements
+    annotation = layout.resolve(annotation, cls)
+    if isinstance(annotation, type):
+        if layout.is_sum_base(annotation):
+            return _SumShape(annotation)
+        if layout.is_product(annotation):
+            return _ProductShape(annotation)
+        return _LEAF
+    origin = getattr(annotation, "__origin__", None)
+    args = getattr(annotation, "__args__", ())
+    if origin is typing.Union:
+        options = [arg for arg in args if arg is not type(None)]
+        if len(options) == 1 and len(args) == 2:
+            return _Optional(_shape(options[0], cls))
+        return _LEAF
+    if origin in _SEQUENCE_ORIGINS and len(args) == 1:
+        return _Sequence(_shape(args[0], cls), _SEQUENCE_ORIGINS[origin])
+    if origin is tuple:
+        if len(args) == 2 and args[1] is Ellipsis:
+            return _Sequence(_shape(args[0], cls), tuple)
+        return _FixedTuple(tuple(_shape(arg, cls) for arg in args))
+    if origin in (dict, collections.abc.Mapping) and len(args) == 2:
+        return _Dict(_shape(args[1], cls))
+    return _LEAF
+
+
+_SUM_DECODERS: typing.MutableMapping[
+    type, typing.Dict[str, typing.Tuple[type, typing.Tuple[_Shape, ...]]]
+] = weakref.WeakKeyDictionary()
+_PRODUCT_DECODERS: typing.MutableMapping[
+    type, typing.Dict[str, _Shape]
+] = weakref.WeakKeyDictionary()
+
+
+def _sum_decoders(
+    cls: type,
+) -> typing.Dict[str, typing.Tuple[type, typing.Tuple[_Shape, ...]]]:
+    decoders = _SUM_DECODERS.get(cls)
+    if decoders is None:
+        decoders = _SUM_DECODERS.setdefault(
+            cls,
+            {
+                constructor.__name__: (
+                    constructor,
+                    tuple(
+                        _shape(annotation, constructor)
+                        for annotation in layout.field_annotations(constructor)
+                    ),
+                )
+                for constructor in layout.constructors(cls)
+            },
+        )
+    return decoders
+
+
+def _product_decoders(cls: type) -> typing.Dict[str, _Shape]:
+    decoders = _PRODUCT_DECODERS.get(cls)
+    if decoders is None:
+        decoders = _PRODUCT_DECODERS.setdefault(
+            cls,
+            {
+                name: _shape(annotation, cls)
+                for (name, annotation) in zip(
+                    layout.field_names(cls), layout.field_annotations(cls)
+                )
+            },
+        )
+    return decoders
+
+
+Encoder = typing.Callable[[typing.Any], typing.Tuple[JSON, typing.Iterable]]
+
+_ENCODERS: typing.MutableMapping[type, Encoder] = weakref.WeakKeyDictionary()
+
+
+def _constructor_encoder(cls: type) -> Encoder:
+    name = cls.__name__
+
+    def encode(value: tuple) -> typing.Tuple[JSON, typing.Iterable]:
+        fields = unpack(value)
+        out: typing.List = [None] * len(fields)
+        return {name: out}, zip([out] * len(fields), range(len(fields)), fields)
+
+    return encode
+
+
+def _product_encoder(cls: type) -> Encoder:
+    names = layout.field_names(cls)
+
+    def encode(value: tuple) -> typing.Tuple[JSON, typing.Iterable]:
+        # The fields are filled in last to first, so set the keys in order.
+        out: typing.Dict[str, JSON] = dict.fromkeys(names)
+        return out, zip([out] * len(names), names, unpack(value))
+
+    return encode
+
+
+def _encode_sequence(value: typing.Sequence) -> typing.Tuple[JSON, typing.Iterable]:
+    out: typing.List = [None] * len(value)
+    return out, zip([out] * len(value), range(len(value)), value)
+
+
+def _encode_dict(value: typing.Mapping) -> typing.Tuple[JSON, typing.Iterable]:
+    out: typing.Dict = dict.fromkeys(value)
+    return out, ((out, key, item) for (key, item) in value.items())
+
+
+_BUILTIN_ENCODERS: typing.Dict[type, Encoder] = {
+    list: _encode_sequence,
+    tuple: _encode_sequence,
+    dict: _encode_dict,
+}
+
+
+def _encoder(cls: type) -> typing.Optional[Encoder]:
+    encoder = _BUILTIN_ENCODERS.get(cls)
+    if encoder is not None:
+        return encoder
+    try:
+        return _ENCODERS[cls]
+    except (KeyError, TypeError):
+        pass
+    if layout.is_constructor(cls):
+        return _ENCODERS.setdefault(cls, _constructor_encoder(cls))
+    if layout.is_product(cls):
+        return _ENCODERS.setdefault(cls, _product_encoder(cls))
+    return None
+
+
+def to_json(value: typing.Any) -> JSON:
+    """Convert a value to data that ``json.dumps`` can serialize."""
+    root: typing.List = [None]
+    stack: typing.List[typing.Tuple[typing.Any, typing.Any, typing.Any]] = [
+        (root, 0, value)
+    ]
+    while stack:
+        parent, key, item = stack.pop()
+        encoder = _encoder(item.__class__)
+        if encoder is None:
+            parent[key] = item
+            continue
+        parent[key], children = encoder(item)
+        stack.extend(children)
+    return root[0]
+
+
+def from_json(data: JSON, cls: type) -> typing.Any:
+    """Convert data produced by ``to_json`` back into an instance of ``cls``.
+
+    ``cls`` can be a ``Sum`` or ``Product`` subclass, or an annotation like
+    ``typing.List[SomeSum]``.
+    """
+    root: typing.List = [None]
+    # Each frame is (parent values, index, shape, data)
+    # A shape of None marks the point where a parent's children are all done.
+    stack: typing.List[typing.Tuple] = [(root, 0, _shape(cls, cls), data)]
+    while stack:
+        parent, index, shape, item = stack.pop()
+        if shape is None:
+            values, finish = item
+            parent[index] = finish(values)
+            continue
+        children = shape.children(item)
+        if children is None:
+            parent[index] = item
+            continue
+        pairs, finish = children
+        values: typing.List = [None] * len(pairs)
+        stack.append((parent, index, None, (values, finish)))
+        stack.extend(
+            (values, child_index, child_shape, child_data)
+            for (child_index, (child_shape, child_data)) in enumerate(pairs)
+        )
+    return root[0]
+
+
+def dump_lines(values: typing.Iterable[typing.Any], file: typing.TextIO) -> None:
+    """Write each value to the text file as a line of JSON."""
+    for value in values:
+        file.write(json.dumps(to_json(value)))
+        file.write("\n")
+
+
+def load_lines(file: typing.TextIO, cls: type) -> typing.Iterator[typing.Any]:
+    """Read a JSON Lines file, converting each non-blank line to ``cls``."""
+    for line in file:
+        if line.strip():
+            yield from_json(json.loads(line), cls)
+
+
+__all__ = ["dump_lines", "from_json", "load_lines", "to_json"]
@@ -14,20 +14,37 @@ Given a value to destructure, called ``value``:
 
 from __future__ import annotations
 
+import functools
+import inspect
 import typing
 
 from . import _attribute_constructor
 from ._class_placeholder import Placeholder
+from ._match.asynchronous import gather_dispatch
+from ._match.descriptor import cache
 from ._match.descriptor import common
 from ._match.descriptor import function as function_
 from ._match.descriptor import property_
+from ._match.descriptor.cache import LFU
+from ._match.descriptor.cache import LRU
+from ._match.descriptor.trampoline import tailcall
 from ._match.destructure import names
+from ._match.fold import fold
 from ._match.match_dict import MatchDict
 from ._match.matchable import Matchable
+from ._match.parallel import parallel_map
 from ._match.patterns.basic_patterns import Pattern
 from ._match.patterns.bind import Bind
 from ._match.patterns.mapping_match import AttrPattern
 from ._match.patterns.mapping_match import DictPattern
+from ._match.patterns.sequence_match import Rest
+from ._match.patterns.sequence_match import Seq
+from ._match.patterns.sequence_match import SequenceView
+from ._match.patterns.struct_match import Struct
+from ._match.patterns.type_match import InstanceOf
+from ._match.switch import Switch
+from ._match.target import target
+from ._match.transform import transform
 
 # In lower-case for aesthetics.
 pat = _attribute_constructor.AttributeConstructor(  # pylint: disable=invalid-name
@@ -36,12 +53,19 @@ pat = _attribute_constructor.AttributeConstructor(  # pylint: disable=invalid-na
 
 
 @typing.overload
-def function(func: typing.Callable) -> function_.Function:
+def function(
+    func: typing.Callable,
+    *,
+    memoize: typing.Optional[cache.Policy] = None,
+    trampoline: bool = False,
+) -> function_.Function:
     """Normal functions and methods go to Functions"""
 
 
 @typing.overload
-def function(func: staticmethod) -> function_.StaticMethod:
+def function(
+    func: staticmethod, *, memoize: typing.Optional[cache.Policy] = None
+) -> function_.StaticMethod:
     """Static methods go to StaticMethods"""
 
 
@@ -51,24 +75,102 @@ def function(func: classmethod) -> function_.ClassMethod:
 
 
 @typing.overload
-def function(func: property) -> property_.Property:
+def function(func: property, *, cached: bool = False) -> property_.Property:
     """And properties go to Properties."""
 
 
-def function(func: typing.Any) -> common.Descriptor:
+@typing.overload
+def function(
+    *,
+    cached: bool = False,
+    memoize: typing.Optional[cache.Policy] = None,
+    trampoline: bool = False,
+) -> typing.Callable[[typing.Any], common.Descriptor]:
+    """Called with only options, return a decorator."""
+
+
+def function(
+    func: typing.Any = None,
+    *,
+    cached: bool = False,
+    memoize: typing.Optional[cache.Policy] = None,
+    trampoline: bool = False,
+) -> typing.Any:
     """Convert a function to dispatch by value.
 
     The original function is not called when the dispatch function is invoked.
+    If ``func`` is omitted, return a decorator that applies the options.
+
+    If ``cached`` is true, ``func`` must be a property. The getter's result
+    for each instance is then cached, for a bounded number of recently used
+    instances. This is only correct if the getter's result depends only on
+    the instance, and the instance is immutable, like ADT instances are. The
+    cache's statistics are available from ``cache_info()``.
+
+    If ``memoize`` is an ``LRU`` or ``LFU`` instance, and ``func`` is a function
+    or static method, results are stored in it, keyed on the arguments, and
+    calls with the same arguments return the stored result without
+    dispatching. ADT instances in the arguments are compared by identity, and
+    calls with unhashable arguments aren't memoized. ``cache_info()`` and
+    ``cache_clear()`` give access to the cache.
+
+    If ``trampoline`` is true, ``func`` must be a function, and the
+    implementations can avoid recursing by returning ``tailcall(fn, *args)``,
+    or by being generators that yield ``tailcall(fn, *args)`` and receive the
+    result. Calls to the function then run in constant stack depth.
     """
+    if func is None:
+        return functools.partial(
+            function, cached=cached, memoize=memoize, trampoline=trampoline
+        )
+    if cached and not isinstance(func, property):
+        raise TypeError("Only properties can be cached")
+    if trampoline:
+        return _trampoline(func, memoize)
+    if memoize is not None:
+        return _memoize(func, memoize)
     if isinstance(func, staticmethod):
         return function_.StaticMethod(func.__func__)
     if isinstance(func, classmethod):
         return function_.ClassMethod(func.__func__)
     if isinstance(func, property):
-        return property_.Property(func.fget, func.fset, func.fdel, func.__doc__)
+        return property_.Property(func.fget, func.fset, func.fdel, func.__doc__, cached)
     return function_.Function(func)
 
 
+def _memoize(
+    func: typing.Any, memoize: cache.Policy
+) -> typing.Union[function_.Function, function_.StaticMethod]:
+    if not isinstance(memoize, cache.Policy):
+        raise TypeError(memoize)
+    descriptor: typing.Union[function_.Function, function_.StaticMethod]
+    if isinstance(func, staticmethod):
+        descriptor = function_.StaticMethod(func.__func__)
+    elif isinstance(func, (classmethod, property)):
+        raise TypeError("Only functions and static methods can be memoized")
+    else:
+        descriptor = function_.Function(func)
+    if inspect.iscoroutinefunction(descriptor.__wrapped__):
+        # A coroutine can only be awaited once.
+        raise TypeError("Coroutine functions can't be memoized")
+    descriptor.memo = memoize
+    return descriptor
+
+
+def _trampoline(
+    func: typing.Any, memoize: typing.Optional[cache.Policy]
+) -> function_.Function:
+    if memoize is not None:
+        raise TypeError("Trampolined functions can't be memoized")
+    if isinstance(func, (staticmethod, classmethod, property)):
+        raise TypeError("Only functions can be trampolined")
+    descriptor = function_.Function(func)
+    if inspect.iscoroutinefunction(descriptor.__wrapped__):
+        raise TypeError("Coroutine functions can't be trampolined")
+    descriptor.trampolined = True
+    return descriptor
+
+
 Deco = typing.Callable[[typing.Callable], typing.Callable]
 
 
@@ -87,12 +189,26 @@ __all__ = [
     "AttrPattern",
     "Bind",
     "DictPattern",
+    "InstanceOf",
+    "LFU",
+    "LRU",
     "MatchDict",
     "Matchable",
     "Pattern",
     "Placeholder",
+    "Rest",
+    "Seq",
+    "SequenceView",
+    "Struct",
+    "Switch",
     "decorate_in_order",
+    "fold",
     "function",
+    "gather_dispatch",
     "names",
+    "parallel_map",
     "pat",
+    "tailcall",
+    "target",
+    "transform",
 ]
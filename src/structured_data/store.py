@@ -0,0 +1,301 @@
+"""An append-only, memory-mapped file of ADT records.
+
+A ``Store`` holds instances of one ``Sum`` or ``Product`` subclass, whose
+fields must be annotated as ``int``, ``float``, ``bool``, ``str``, or
+``bytes``. Records are appended to a data file, and read back through
+``mmap``, so a record is only decoded when it is accessed.
+
+>>> import os, tempfile
+>>> from structured_data import adt
+>>> class Reading(adt.Sum):
+...     Temperature: adt.Ctor[int, float]
+...     Offline: adt.Ctor[int]
+>>> path = os.path.join(tempfile.mkdtemp(), "readings")
+>>> with Store(path, Reading) as store:
+...     store.extend([Reading.Temperature(1, 20.5), Reading.Offline(2)])
+>>> with Store(path, Reading) as store:
+...     list(store.scan(Reading.Offline))
+[Reading.Offline(2)]
+
+Layout
+------
+
+The data file starts with a header: the bytes ``b"SDS"``, a format version
+byte, a layout byte, a four-byte record size, and a fingerprint of the schema, which
+covers the constructors, their field names, and the field types. Each record is a tag byte giving the constructor's
+index, followed by the fixed-size fields packed with ``struct``, in
+little-endian order, followed by each ``str`` or ``bytes`` field, as a
+four-byte length and the data.
+
+If no constructor has ``str`` or ``bytes`` fields, the layout is fixed: every
+record is padded to the same size, so records are found by multiplication.
+Otherwise, the layout is variable, and the offset of each record is appended
+to an index file, whose name is the data file's with ``.idx`` added.
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+import typing
+
+from . import codec
+from ._adt import layout
+from ._unpack import unpack
+
+MAGIC = b"SDS"
+VERSION = 1
+
+_HEADER = struct.Struct("<3sBBI8s")
+_OFFSET = struct.Struct("<Q")
+_LENGTH = struct.Struct("<I")
+_FIXED = 0
+_VARIABLE = 1
+
+_FIXED_CODES = {int: "q", float: "d", bool: "?"}
+_VARIABLE_TYPES = (str, bytes)
+
+
+class _RecordLayout:
+    """Encoder and decoder for the records of one constructor."""
+
+    def __init__(self, cls: type, tag: int) -> None:
+        self.cls = cls
+        self.tag = bytes([tag])
+        types = [
+            layout.resolve(annotation, cls)
+            for annotation in layout.field_annotations(cls)
+        ]
+        for type_ in types:
+            if type_ not in _FIXED_CODES and type_ not in _VARIABLE_TYPES:
+                raise TypeError(f"Cannot store field of type {type_!r} in {cls!r}")
+        self.arity = len(types)
+        self.fixed_indices = [
+            index for (index, type_) in enumerate(types) if type_ in _FIXED_CODES
+        ]
+        self.variable_fields = [
+            (index, type_)
+            for (index, type_) in enumerate(types)
+            if type_ in _VARIABLE_TYPES
+        ]
+        self.fixed = struct.Struct(
+            "<" + "".join(_FIXED_CODES[types[index]] for index in self.fixed_indices)
+        )
+
+    def encode(self, value: tuple) -> bytes:
+        """Return the record for ``value``, including the tag."""
+        fields = unpack(value)
+        try:
+            fixed = self.fixed.pack(*[fields[index] for index in self.fixed_indices])
+        except struct.error:
+            raise TypeError(value)
+        parts = [self.tag, fixed]
+        for index, type_ in self.variable_fields:
+            data = fields[index]
+            if not isinstance(data, type_):
+                raise TypeError(value)
+            if type_ is str:
+                data = data.encode("utf-8")
+            parts.append(_LENGTH.pack(len(data)))
+            parts.append(data)
+        return b"".join(parts)
+
+    def decode(self, buffer: typing.Any, offset: int) -> typing.Any:
+        """Decode the record whose tag is at ``offset``."""
+        offset += 1
+        fields: typing.List[typing.Any] = [None] * self.arity
+        for index, field in zip(
+            self.fixed_indices, self.fixed.unpack_from(buffer, offset)
+        ):
+            fields[index] = field
+        offset += self.fixed.size
+        for index, type_ in self.variable_fields:
+            (length,) = _LENGTH.unpack_from(buffer, offset)
+            start = offset + _LENGTH.size
+            offset = start + length
+            data = buffer[start:offset]
+            fields[index] = str(data, "utf-8") if type_ is str else bytes(data)
+        return layout.rebuild(self.cls, fields)
+
+    def schema(self) -> typing.Tuple[typing.Any, ...]:
+        """Return what a record's encoding depends on, besides the names."""
+        return (
+            self.fixed.format,
+            tuple((index, type_.__name__) for (index, type_) in self.variable_fields),
+        )
+
+
+class Store:
+    """An append-only file of instances of ``cls``.
+
+    The file is created if it doesn't exist. If it does exist, it must have
+    been written for a class with the same definition.
+    """
+
+    def __init__(self, path: typing.Union[str, os.PathLike], cls: type) -> None:
+        self.path = os.fspath(path)
+        self.cls = cls
+        if layout.is_sum_base(cls):
+            constructors = layout.constructors(cls)
+        elif layout.is_product(cls):
+            constructors = (cls,)
+        else:
+            raise TypeError(f"{cls!r} is not a Sum or Product subclass")
+        self._layouts = [
+            _RecordLayout(constructor, tag)
+            for (tag, constructor) in enumerate(constructors)
+        ]
+        self._tags = {
+            constructor: tag for (tag, constructor) in enumerate(constructors)
+        }
+        self._variable = any(record.variable_fields for record in self._layouts)
+        self._record_size = 1 + max(
+            (record.fixed.size for record in self._layouts), default=0
+        )
+        header = _HEADER.pack(
+            MAGIC,
+            VERSION,
+            _VARIABLE if self._variable else _FIXED,
+            self._record_size,
+            self._fingerprint(cls),
+        )
+        self._data = self._open(self.path, header)
+        self._index = self._open(self.path + ".idx", b"") if self._variable else None
+        self._data_map: typing.Optional[mmap.mmap] = None
+        self._index_map: typing.Optional[mmap.mmap] = None
+
+    def _fingerprint(self, cls: type) -> bytes:
+        schema = (
+            codec.Codec(cls).fingerprint,
+            tuple(record.schema() for record in self._layouts),
+        )
+        return hashlib.blake2b(repr(schema).encode("utf-8"), digest_size=8).digest()
+
+    @staticmethod
+    def _open(path: str, header: bytes) -> typing.BinaryIO:
+        try:
+            file = open(path, "xb+")
+        except FileExistsError:
+            file = open(path, "rb+")
+            existing = file.read(len(header))
+            if existing != header:
+                file.close()
+                raise ValueError(f"{path} was not written for this class")
+        else:
+            file.write(header)
+        file.seek(0, os.SEEK_END)
+        return typing.cast(typing.BinaryIO, file)
+
+    def append(self, value: typing.Any) -> None:
+        """Add an instance to the end of the store."""
+        try:
+            record_layout = self._layouts[self._tags[value.__class__]]
+        except KeyError:
+            raise TypeError(value)
+        record = record_layout.encode(value)
+        if self._index is not None:
+            self._index.write(_OFFSET.pack(self._data.tell()))
+        else:
+            record = record.ljust(self._record_size, b"\0")
+        self._data.write(record)
+
+    def extend(self, values: typing.Iterable[typing.Any]) -> None:
+        """Add every instance from ``values`` to the end of the store."""
+        for value in values:
+            self.append(value)
+
+    def flush(self) -> None:
+        """Write any buffered records to disk."""
+        self._data.flush()
+        if self._index is not None:
+            self._index.flush()
+
+    @staticmethod
+    def _remap(
+        file: typing.BinaryIO, current: typing.Optional[mmap.mmap]
+    ) -> typing.Optional[mmap.mmap]:
+        size = os.fstat(file.fileno()).st_size
+        if current is not None and len(current) == size:
+            return current
+        # The old map isn't closed, because a scan may still be reading it.
+        # It's closed when the last reference to it goes away.
+        if not size:
+            return None
+        return mmap.mmap(file.fileno(), size, access=mmap.ACCESS_READ)
+
+    def _maps(self) -> typing.Tuple[mmap.mmap, typing.Optional[mmap.mmap]]:
+        self.flush()
+        self._data_map = self._remap(self._data, self._data_map)
+        if self._index is not None:
+            self._index_map = self._remap(self._index, self._index_map)
+        # The header is always present, so the data map is never empty.
+        return typing.cast(mmap.mmap, self._data_map), self._index_map
+
+    def __len__(self) -> int:
+        data_map, index_map = self._maps()
+        if self._index is not None:
+            return len(index_map) // _OFFSET.size if index_map is not None else 0
+        return (len(data_map) - _HEADER.size) // self._record_size
+
+    def _offsets(
+        self, data_map: mmap.mmap, index_map: typing.Optional[mmap.mmap]
+    ) -> typing.Iterator[int]:
+        if self._index is None:
+            yield from range(_HEADER.size, len(data_map), self._record_size)
+        elif index_map is not None:
+            for (offset,) in _OFFSET.iter_unpack(index_map):
+                yield offset
+
+    def _offset(self, index: int) -> int:
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError(index)
+        if self._index_map is None:
+            return _HEADER.size + index * self._record_size
+        return _OFFSET.unpack_from(self._index_map, index * _OFFSET.size)[0]
+
+    def __getitem__(self, index: int) -> typing.Any:
+        offset = self._offset(index)
+        data_map = typing.cast(mmap.mmap, self._data_map)
+        return self._layouts[data_map[offset]].decode(data_map, offset)
+
+    def __iter__(self) -> typing.Iterator[typing.Any]:
+        return self.scan()
+
+    def scan(self, *constructors: type) -> typing.Iterator[typing.Any]:
+        """Yield the stored instances, in order.
+
+        If any constructors are given, only yield instances made with them.
+        Other records are skipped after reading their tag. Records appended
+        after the scan starts aren't included.
+        """
+        wanted = {self._tags[constructor] for constructor in constructors}
+        layouts = self._layouts
+        # The maps are kept here, so closing the store doesn't affect the scan.
+        data_map, index_map = self._maps()
+        for offset in self._offsets(data_map, index_map):
+            tag = data_map[offset]
+            if not wanted or tag in wanted:
+                yield layouts[tag].decode(data_map, offset)
+
+    def close(self) -> None:
+        """Close the files, and release their mappings.
+
+        As in ``_remap``, the mappings aren't closed directly, because an
+        unfinished scan may still be reading them.
+        """
+        self._data_map = self._index_map = None
+        self._data.close()
+        if self._index is not None:
+            self._index.close()
+
+    def __enter__(self) -> "Store":
+        return self
+
+    def __exit__(self, *exc_info: typing.Any) -> None:
+        self.close()
+
+
+__all__ = ["Store"]
@@ -0,0 +1,16 @@
+from structured_data import adt
+
+
+class Expr(adt.Sum):
+
+    Lit: adt.Ctor[int]
+    Add: adt.Ctor["Expr", "Expr"]  # noqa: F821
+    Neg: adt.Ctor["Expr"]  # noqa: F821
+    Label: adt.Ctor[str, "Expr"]  # noqa: F821
+    Empty: adt.Ctor
+
+
+class Point(adt.Product):
+
+    x: int
+    y: int = 0
@@ -0,0 +1,57 @@
+from structured_data import adt
+from structured_data import match
+
+
+class Expr(adt.Sum):
+
+    Lit: adt.Ctor[int]
+    Add: adt.Ctor["Expr", "Expr"]  # noqa: F821
+    Neg: adt.Ctor["Expr"]  # noqa: F821
+
+
+class Point(adt.Product):
+
+    x: int
+    y: int = 0
+
+
+@match.function
+def evaluate(expr):
+    raise ValueError(expr)
+
+
+@evaluate.when(expr=Expr.Lit(match.pat.value))
+def _evaluate_lit(value):
+    return value
+
+
+@evaluate.when(expr=Expr.Add(match.pat.left, match.pat.right))
+def _evaluate_add(left, right):
+    return evaluate(left) + evaluate(right)
+
+
+@evaluate.when(expr=Expr.Neg(match.pat.inner))
+def _evaluate_neg(inner):
+    return -evaluate(inner)
+
+
+class Evaluator:
+    @match.function
+    @staticmethod
+    def negate(expr):
+        return Expr.Neg(expr)
+
+
+@match.function
+def simplify(expr):
+    return expr
+
+
+@match.Placeholder
+def _double_negation(cls):
+    return cls.Neg(cls.Neg(match.pat.inner))
+
+
+@simplify.when(expr=_double_negation)
+def _simplify_double_negation(inner):
+    return simplify(inner)
@@ -0,0 +1,114 @@
+import importlib
+import sys
+
+import pytest
+
+SOURCE = """\
+from __future__ import annotations
+
+import typing
+
+from structured_data import adt
+
+
+class Shape(adt.Sum):
+    Circle: adt.Ctor[int]
+    Rectangle: adt.Ctor[int, int]
+    label: str
+
+
+class Point(adt.Product):
+    x: int
+    y: int
+    count: typing.ClassVar[int] = 0
+"""
+
+
+@pytest.fixture
+def ctor():
+    from structured_data._adt import ctor
+
+    return ctor
+
+
+@pytest.fixture
+def cached_module(tmp_path, monkeypatch):
+    from structured_data._adt import metadata_cache
+
+    source = tmp_path / "cached_adts.py"
+    source.write_text(SOURCE)
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    def load():
+        sys.modules.pop("cached_adts", None)
+        importlib.invalidate_caches()
+        metadata_cache.enable(str(tmp_path / "cache"))
+        try:
+            return importlib.import_module("cached_adts")
+        finally:
+            metadata_cache.disable()
+            sys.modules.pop("cached_adts", None)
+
+    yield source, load
+
+
+def check(module):
+    assert module.Shape.Rectangle(1, 2) != module.Shape.Circle(1)
+    assert not hasattr(module.Shape, "label")
+    assert module.Point(1, 2) == module.Point(x=1, y=2)
+
+
+def test_reuse(cached_module, monkeypatch, ctor):
+    _, load = cached_module
+    check(load())
+
+    def fail(annotation):
+        raise AssertionError(annotation)
+
+    monkeypatch.setattr(ctor, "_parse_constructor", fail)
+    check(load())
+
+
+def test_invalidate(cached_module, monkeypatch, ctor):
+    source, load = cached_module
+    load()
+    source.write_text(SOURCE + "\n\nclass Empty(adt.Sum):\n    Only: adt.Ctor\n")
+    parsed = []
+    original = ctor._parse_constructor
+
+    def record(annotation):
+        parsed.append(annotation)
+        return original(annotation)
+
+    monkeypatch.setattr(ctor, "_parse_constructor", record)
+    module = load()
+    check(module)
+    assert module.Empty.Only()
+    assert "adt.Ctor[int]" in parsed
+
+
+def test_rebound_globals(tmp_path, ctor, adt):
+    import typing
+
+    from structured_data._adt import metadata_cache
+
+    source = tmp_path / "rebound.py"
+    source.write_text("")
+
+    def interpret(field, marker):
+        namespace = {"__name__": "rebound", "__file__": str(source)}
+        namespace.update(Field=field, Marker=marker)
+        metadata_cache.enable(str(tmp_path / "cache"))
+        try:
+            return (
+                ctor.get_args("Field[int]", namespace),
+                ctor.annotation_is_classvar("Marker[int]", namespace),
+            )
+        finally:
+            metadata_cache.disable()
+
+    args, classvar = interpret(adt.Ctor, typing.ClassVar)
+    assert len(args) == 1 and classvar
+    # The source is unchanged, but the names now refer to something else.
+    assert interpret(typing.List, typing.List) == (None, False)
+    assert interpret(adt.Ctor, typing.ClassVar) == (args, True)
@@ -0,0 +1,55 @@
+import pytest
+
+
+@pytest.fixture
+def classes(adt):
+    class Point(adt.Product):
+        x: int
+        y: int
+
+    class Shape(adt.Sum):
+        Circle: adt.Ctor[Point, int]
+        Polygon: adt.Ctor[tuple]
+
+    class Scene(adt.Product):
+        shape: Shape
+        name: str = "scene"
+
+    return Point, Shape, Scene
+
+
+def test_replace(adt, classes):
+    point, shape, _ = classes
+    original = point(1, 2)
+    assert adt.replace(original, y=3) == point(1, 3)
+    assert adt.replace(original, x=5, y=6) == point(5, 6)
+    assert adt.replace(original) == original
+    assert original == point(1, 2)
+    circle = shape.Circle(original, 4)
+    assert adt.replace(circle, _1=5) == shape.Circle(original, 5)
+    assert type(adt.replace(circle, _1=5)) is shape.Circle
+    with pytest.raises(TypeError):
+        adt.replace(original, z=1)
+    with pytest.raises(TypeError):
+        adt.replace(circle, _2=1)
+    with pytest.raises(TypeError):
+        adt.replace((1, 2), _0=1)
+
+
+def test_replace_in(adt, match, classes):
+    point, shape, scene = classes
+    original = scene(shape.Circle(point(1, 2), 4))
+    updated = adt.replace_in(original, "shape._0.y", 7)
+    assert updated == scene(shape.Circle(point(1, 7), 4))
+    assert original == scene(shape.Circle(point(1, 2), 4))
+    renamed = adt.replace_in(original, "name", "other")
+    assert renamed == scene(shape.Circle(point(1, 2), 4), "other")
+
+    def get_shape(value):
+        return match.Matchable(value)(scene(match.pat.shape, match.pat._))["shape"]
+
+    assert get_shape(renamed) is get_shape(original)
+    with pytest.raises(TypeError):
+        adt.replace_in(original, "shape._0.z", 7)
+    with pytest.raises(TypeError):
+        adt.replace_in(original, "name.length", 7)
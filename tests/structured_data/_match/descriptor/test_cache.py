@@ -0,0 +1,119 @@
+import pytest
+
+
+@pytest.fixture(scope="session")
+def cache():
+    from structured_data._match.descriptor import cache
+
+    return cache
+
+
+def test_lru(cache):
+    lru = cache.LRU(2)
+    lru.put("a", 1)
+    lru.put("b", 2)
+    assert lru.get("a") == 1
+    lru.put("c", 3)
+    assert lru.get("b") is cache.MISSING
+    assert lru.info() == (1, 1, 2, 2)
+    lru.clear()
+    assert lru.info() == (0, 0, 2, 0)
+    with pytest.raises(ValueError):
+        cache.LRU(0)
+
+
+def test_lfu(cache):
+    lfu = cache.LFU(2)
+    lfu.put("a", 1)
+    lfu.put("b", 2)
+    assert lfu.get("a") == 1
+    assert lfu.get("a") == 1
+    assert lfu.get("b") == 2
+    lfu.put("c", 3)
+    assert lfu.get("b") is cache.MISSING
+    lfu.put("d", 4)
+    assert lfu.get("c") is cache.MISSING
+    assert lfu.get("a") == 1
+    lfu.put("a", 5)
+    assert lfu.get("a") == 5
+    assert lfu.info().currsize == 2
+    lfu.clear()
+    lfu.put("e", 6)
+    assert lfu.get("e") == 6
+
+
+def test_make_key(adt, cache):
+    class Box(adt.Sum):
+        Full: adt.Ctor[int]
+
+    box = Box.Full(1)
+    assert cache.make_key((box,), {}) == cache.make_key((box,), {})
+    assert cache.make_key((box,), {}) != cache.make_key((Box.Full(1),), {})
+    assert cache.make_key((1,), {"a": box}) == cache.make_key((1,), {"a": box})
+    assert cache.make_key(([],), {}) is None
+
+
+def test_memoize(expr, match):
+    calls = []
+
+    @match.function(memoize=match.LRU(64))
+    def evaluate(value):
+        calls.append(value)
+
+    @evaluate.when(value=expr.Lit(match.pat.number))
+    def _evaluate_lit(number):
+        return number
+
+    @evaluate.when(value=expr.Add(match.pat.left, match.pat.right))
+    def _evaluate_add(left, right):
+        return evaluate(left) + evaluate(right)
+
+    # A DAG with 2 ** 40 paths, which only memoization makes tractable
+    value = expr.Lit(1)
+    for _ in range(40):
+        value = expr.Add(value, value)
+    assert evaluate(value) == 2**40
+    assert evaluate.cache_info().misses == 41
+    assert evaluate.cache_info().hits == 40
+
+    assert evaluate([]) is None
+    assert evaluate([]) is None
+    assert len(calls) == 2
+
+    @evaluate.when(value=match.pat.other)
+    def _evaluate_other(other):
+        return 0
+
+    assert evaluate.cache_info().currsize == 0
+    assert evaluate([]) == 0
+
+
+def test_memoize_static(match):
+    class Test:
+        @match.function(memoize=match.LFU(8))
+        @staticmethod
+        def double(value):
+            return value * 2
+
+    assert Test.double(2) == 4
+    assert Test().double(2) == 4
+    assert Test.double.cache_info().hits == 1
+    Test().double.cache_clear()
+    assert Test.double.cache_info().currsize == 0
+
+
+def test_memoize_errors(match):
+    with pytest.raises(TypeError):
+        match.function(lambda: None, memoize=128)
+    with pytest.raises(TypeError):
+        match.function(property(), memoize=match.LRU())
+    with pytest.raises(TypeError):
+        match.function(classmethod(lambda cls: None), memoize=match.LRU())
+
+    async def coroutine():
+        pass
+
+    with pytest.raises(TypeError):
+        match.function(coroutine, memoize=match.LRU())
+    with pytest.raises(ValueError):
+        match.function(lambda: None).cache_info()
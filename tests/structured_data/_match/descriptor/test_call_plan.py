@@ -0,0 +1,92 @@
+import inspect
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def call_plan():
+    from structured_data._match.descriptor import call_plan
+
+    return call_plan
+
+
+def _reference(func, args, kwargs):
+    signature = inspect.signature(func)
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    values = dict(bound.arguments)
+    extra_args = ()
+    extra_kwargs = {}
+    for parameter in signature.parameters.values():
+        if parameter.kind is inspect.Parameter.VAR_POSITIONAL:
+            extra_args = values.pop(parameter.name)
+        if parameter.kind is inspect.Parameter.VAR_KEYWORD:
+            extra_kwargs = values.pop(parameter.name)
+    return extra_args, extra_kwargs, values
+
+
+def plain(a, b=2, *, c, d=4):
+    pass
+
+
+def variadic(a, /, b=2, *args, c=3, **kwargs):
+    pass
+
+
+@pytest.mark.parametrize(
+    "func, args, kwargs",
+    [
+        (plain, (1,), {"c": 3}),
+        (plain, (), {"a": 1, "b": 5, "c": 3, "d": 6}),
+        (variadic, (1,), {}),
+        (variadic, (1, 2, 3, 4), {"c": 5, "e": 6}),
+        (variadic, (1,), {"a": 7, "b": 8}),
+    ],
+)
+def test_bind(call_plan, func, args, kwargs):
+    plan = call_plan.CallPlan(func)
+    assert plan.bind(args, kwargs) == _reference(func, args, kwargs)
+
+
+@pytest.mark.parametrize(
+    "func, args, kwargs",
+    [
+        (plain, (1, 2, 3), {"c": 3}),
+        (plain, (1,), {}),
+        (plain, (1,), {"a": 1, "c": 3}),
+        (plain, (1,), {"c": 3, "e": 5}),
+        (variadic, (), {"a": 1}),
+    ],
+)
+def test_bind_errors(call_plan, func, args, kwargs):
+    with pytest.raises(TypeError):
+        _reference(func, args, kwargs)
+    with pytest.raises(TypeError):
+        call_plan.CallPlan(func).bind(args, kwargs)
+
+
+def test_implementation_plan(call_plan):
+    def implementation(a, b=2, *args, c):
+        return a, b, args, c
+
+    plan = call_plan.implementation_plan(implementation)
+    assert plan is call_plan.implementation_plan(implementation)
+    assert plan.call({"a": 1, "c": 3}, (4, 5), {}) == (1, 2, (4, 5), 3)
+    with pytest.raises(TypeError):
+        plan.call({"a": 1}, (), {"a": 2})
+    with pytest.raises(TypeError):
+        plan.call({"c": 3}, (), {})
+
+
+def test_wrapped_replaced(match):
+    @match.function
+    def function(a):
+        return a
+
+    assert function(1) == 1
+
+    def replacement(a, b):
+        return a + b
+
+    function.__wrapped__ = replacement
+    assert function(1, 2) == 3
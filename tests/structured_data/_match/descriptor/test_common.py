@@ -1,3 +1,5 @@
+import threading
+
 import pytest
 
 
@@ -130,3 +132,36 @@ def test_owns(match):
         pass
     Test.prop = prop
     assert not hasattr(Test.prop, "get_when")
+
+
+def test_concurrent_dispatch(match):
+    @match.function
+    def classify(value):
+        return -1
+
+    errors = []
+    start = threading.Barrier(5)
+
+    def register():
+        start.wait()
+        for case in range(200):
+            classify.when(value=case)(lambda case=case: case)
+
+    def call():
+        start.wait()
+        try:
+            for _ in range(200):
+                for case in (0, 100, 199):
+                    assert classify(case) in (case, -1)
+        except AssertionError as error:
+            errors.append(error)
+
+    threads = [threading.Thread(target=register)] + [
+        threading.Thread(target=call) for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+    assert [classify(case) for case in (0, 100, 199, 200)] == [0, 100, 199, -1]
@@ -1,3 +1,5 @@
+import types
+
 import pytest
 
 
@@ -282,3 +284,39 @@ def test_subclass_staticmethod_doc(match):
         pass
 
     assert Test.test_staticmethod.__doc__ == "Staticmethod docstring."
+
+
+def test_cached_proxies(match):
+    class Base:
+        @match.function
+        def method(self):
+            return self
+
+        @match.function
+        @classmethod
+        def class_method(cls):
+            return cls
+
+        @match.function
+        @staticmethod
+        def static_method():
+            return None
+
+        prop = match.function(property(lambda self: 1))
+
+    class Test(Base):
+        pass
+
+    instance = Test()
+    for name in ("method", "class_method", "static_method", "prop"):
+        assert getattr(Base, name) is getattr(Base, name)
+        assert getattr(Test, name) is getattr(Test, name)
+        assert getattr(Test, name) is not getattr(Base, name)
+    assert Base.class_method is not Base().class_method
+    assert Test.class_method is Test().class_method
+    assert hasattr(Base.static_method, "when")
+    assert not hasattr(Base().static_method, "when")
+    assert isinstance(instance.method, types.MethodType)
+    assert instance.method.__self__ is instance
+    assert instance.method() is instance
+    assert instance.class_method() is Test
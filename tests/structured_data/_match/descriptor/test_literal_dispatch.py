@@ -0,0 +1,158 @@
+import collections.abc
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def literal_dispatch():
+    from structured_data._match.descriptor import literal_dispatch
+
+    return literal_dispatch
+
+
+def make_opcodes(match, count):
+    @match.function
+    def run(opcode, argument):
+        raise ValueError(opcode)
+
+    for number in range(count):
+
+        @run.when(opcode=number, argument=match.pat.argument)
+        def _run(argument, number=number):
+            return (number, argument)
+
+    return run
+
+
+def test_many_literals(match):
+    run = make_opcodes(match, 100)
+    assert run(0, "a") == (0, "a")
+    assert run(99, "b") == (99, "b")
+    with pytest.raises(ValueError):
+        run(100, "c")
+
+
+def test_mixed_order(match):
+    @match.function
+    def command(name, argument):
+        raise ValueError(name)
+
+    @command.when(name="stop", argument=match.pat._)
+    def _stop():
+        return "stop"
+
+    @command.when(name=match.pat.name, argument=0)
+    def _zero(name):
+        return f"{name} zero"
+
+    @command.when(name="go", argument=match.pat._)
+    def _go():
+        return "go"
+
+    @command.when(name="start", argument=match.pat._)
+    def _start():
+        return "start"
+
+    assert command("stop", 0) == "stop"
+    assert command("go", 0) == "go zero"
+    assert command("go", 1) == "go"
+    assert command("start", 1) == "start"
+    assert command("other", 0) == "other zero"
+    with pytest.raises(ValueError):
+        command("other", 1)
+    assert command(["unhashable"], 0) == "['unhashable'] zero"
+
+
+def test_equal_literals(match):
+    run = make_opcodes(match, 3)
+    assert run(1.0, "a") == (1, "a")
+    assert run(True, "b") == (1, "b")
+
+
+def test_build(match, literal_dispatch):
+    clauses = (
+        (match.DictPattern(dict(a=1, b=match.pat.b)), "one"),
+        (match.DictPattern(dict(a=match.pat.a, b=2)), "binding"),
+        (match.DictPattern(dict(a=2, b=match.pat.b)), "two"),
+        (match.DictPattern(dict(a=1, b=3)), "one again"),
+    )
+    table = literal_dispatch.build(clauses)
+    assert table.key == "a"
+    assert [func for (_, func) in table.candidates(dict(a=1), clauses)] == [
+        "one",
+        "binding",
+        "one again",
+    ]
+    assert [func for (_, func) in table.candidates(dict(a=3), clauses)] == ["binding"]
+    assert table.candidates(dict(b=1), clauses) is clauses
+    assert table.candidates(dict(a=[]), clauses) is clauses
+
+
+def test_no_table(match, literal_dispatch):
+    clauses = (
+        (match.DictPattern(dict(a=1)), "one"),
+        (match.DictPattern(dict(a=match.pat.a)), "binding"),
+        (match.DictPattern(dict(a=(1, 2))), "tuple"),
+    )
+    assert literal_dispatch.build(clauses) is None
+
+
+def test_tuples(match, literal_dispatch):
+    clauses = (((match.pat.x, "a"), "a"), ((match.pat.x, "b"), "b"))
+    table = literal_dispatch.build(clauses)
+    assert table.key == 1
+    assert table.candidates((0, "b"), clauses) == (clauses[1],)
+
+
+def test_types(match):
+    @match.function
+    def describe(value):
+        raise TypeError(value)
+
+    @describe.when(value=match.InstanceOf(bool))
+    def _describe_bool():
+        return "bool"
+
+    @describe.when(value=0)
+    def _describe_zero():
+        return "zero"
+
+    @describe.when(value=match.InstanceOf(int, match.pat.value))
+    def _describe_int(value):
+        return f"int {value}"
+
+    @describe.when(value=match.InstanceOf(collections.abc.Sequence))
+    def _describe_sequence():
+        return "sequence"
+
+    assert describe(False) == "bool"
+    assert describe(0) == "zero"
+    assert describe(3) == "int 3"
+    assert describe([1]) == "sequence"
+    assert describe("a") == "sequence"
+    with pytest.raises(TypeError):
+        describe(1.5)
+
+    class Registered:
+        pass
+
+    with pytest.raises(TypeError):
+        describe(Registered())
+    collections.abc.Sequence.register(Registered)
+    assert describe(Registered()) == "sequence"
+
+
+def test_type_table(match, literal_dispatch):
+    clauses = (
+        (match.DictPattern(dict(a=match.InstanceOf(str))), "str"),
+        (match.DictPattern(dict(a=1)), "one"),
+        (match.DictPattern(dict(a=match.InstanceOf(int))), "int"),
+    )
+    table = literal_dispatch.build(clauses)
+    assert [func for (_, func) in table.candidates(dict(a=1), clauses)] == [
+        "one",
+        "int",
+    ]
+    assert [func for (_, func) in table.candidates(dict(a=2), clauses)] == ["int"]
+    assert [func for (_, func) in table.candidates(dict(a="x"), clauses)] == ["str"]
+    assert table.candidates(dict(a=1.5), clauses) == ()
@@ -172,3 +172,44 @@ def test_proxy_doc(match):
         pass
 
     assert Test.prop.__doc__ == "Docstring."
+
+
+def test_cached(adt, match):
+    calls = []
+
+    class Tree(adt.Sum):
+        Leaf: adt.Ctor
+        Node: adt.Ctor["Tree", "Tree"]  # noqa: F821
+
+        @match.function(cached=True)
+        @property
+        def size(self):
+            calls.append(self)
+            return 1
+
+    @Tree.size.get_when(Tree.Node(match.pat.left, match.pat.right))
+    def __size_node(left, right):
+        calls.append((left, right))
+        return left.size + right.size + 1
+
+    leaf = Tree.Leaf()
+    tree = Tree.Node(leaf, Tree.Node(leaf, leaf))
+    assert tree.size == 5
+    assert len(calls) == 3
+    assert tree.size == 5
+    assert len(calls) == 3
+    assert Tree.size.cache_info() == (3, 3, Tree.size.getter_cache.maxsize, 3)
+
+    @Tree.size.get_when(Tree.Leaf())
+    def __size_leaf():
+        return 0
+
+    assert Tree.size.cache_info().currsize == 0
+    assert tree.size == 2
+    assert Tree.size.cached
+    assert Tree.size.getter(lambda self: 0).cached
+
+    with pytest.raises(TypeError):
+        match.function(lambda: None, cached=True)
+    with pytest.raises(ValueError):
+        match.function(property()).cache_info()
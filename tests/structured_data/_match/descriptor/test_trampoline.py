@@ -0,0 +1,99 @@
+import sys
+
+import pytest
+
+
+@pytest.fixture
+def evaluate(expr, match):
+    @match.function(trampoline=True)
+    def evaluate(value):
+        raise ValueError(value)
+
+    @evaluate.when(value=expr.Lit(match.pat.number))
+    def _evaluate_lit(number):
+        return number
+
+    @evaluate.when(value=expr.Neg(match.pat.inner))
+    def _evaluate_neg(inner):
+        return -(yield match.tailcall(evaluate, inner))
+
+    @evaluate.when(value=expr.Add(match.pat.left, match.pat.right))
+    def _evaluate_add(left, right):
+        return (yield match.tailcall(evaluate, left)) + (
+            yield match.tailcall(evaluate, right)
+        )
+
+    return evaluate
+
+
+def test_deep_recursion(expr, evaluate):
+    depth = sys.getrecursionlimit() * 10
+    value = expr.Lit(1)
+    for _ in range(depth):
+        value = expr.Add(expr.Neg(expr.Lit(0)), value)
+    assert evaluate(value) == 1
+    for _ in range(depth):
+        value = expr.Add(value, expr.Lit(1))
+    assert evaluate(value) == depth + 1
+
+
+def test_errors_propagate(expr, evaluate, match):
+    with pytest.raises(ValueError):
+        evaluate(expr.Neg(expr.Add(expr.Lit(1), None)))
+
+    @match.function(trampoline=True)
+    def safe(value):
+        try:
+            return (yield match.tailcall(evaluate, value))
+        except ValueError:
+            return None
+
+    assert safe(expr.Neg(None)) is None
+    assert safe(expr.Neg(expr.Lit(2))) == -2
+
+
+def test_tail_calls(match):
+    @match.function(trampoline=True)
+    def count_down(number, total=0):
+        return match.tailcall(count_down, number - 1, total=total + number)
+
+    @count_down.when(number=0, total=match.pat.total)
+    def _count_down_zero(total):
+        return total
+
+    assert count_down(sys.getrecursionlimit() * 10) == sum(
+        range(sys.getrecursionlimit() * 10 + 1)
+    )
+
+
+def test_methods(match):
+    class Counter:
+        @match.function(trampoline=True)
+        def depth(self, value):
+            if isinstance(value, list) and value:
+                return 1 + (yield match.tailcall(self.depth, value[0]))
+            return 0
+
+    value = []
+    for _ in range(sys.getrecursionlimit() * 10):
+        value = [value]
+    assert Counter().depth(value) == sys.getrecursionlimit() * 10
+
+
+def test_trampoline_errors(match):
+    @match.function(trampoline=True)
+    def bad(value):
+        yield value
+
+    with pytest.raises(TypeError):
+        bad(1)
+    with pytest.raises(TypeError):
+        match.function(lambda: None, trampoline=True, memoize=match.LRU())
+    with pytest.raises(TypeError):
+        match.function(staticmethod(lambda: None), trampoline=True)
+
+    async def coroutine():
+        pass
+
+    with pytest.raises(TypeError):
+        match.function(coroutine, trampoline=True)
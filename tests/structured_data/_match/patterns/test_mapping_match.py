@@ -61,3 +61,31 @@ def test_mismatched_attr(match):
 def test_match_nothing_exhaustive(match):
     matchable = match.Matchable(dict(a=1))
     assert not matchable(match.DictPattern({}, exhaustive=True))
+
+
+def test_wide_dict(match):
+    keys = [f"k{index}" for index in range(1000)]
+    pattern = match.DictPattern(
+        {key: getattr(match.pat, key) for key in keys}, exhaustive=True
+    )
+    assert pattern.destructure(pattern) == tuple(
+        getattr(match.pat, key) for key in reversed(keys)
+    )
+    matchable = match.Matchable({key: index for (index, key) in enumerate(keys)})
+    assert matchable(pattern)
+    assert matchable.matches["k999"] == 999
+    assert match.names(pattern) == keys
+
+
+def test_wide_attr(match):
+    names = [f"a{index}" for index in range(1000)]
+    pattern = match.AttrPattern(**{name: getattr(match.pat, name) for name in names})
+    assert pattern.destructure(pattern) == tuple(
+        getattr(match.pat, name) for name in reversed(names)
+    )
+    value = types.SimpleNamespace(**{name: name for name in names})
+    assert pattern.destructure(value) == tuple(reversed(names))
+    matchable = match.Matchable(value)
+    assert matchable(pattern)
+    assert matchable.matches["a999"] == "a999"
+    assert match.names(pattern) == names
@@ -0,0 +1,77 @@
+import pytest
+
+
+def test_names(match):
+    structure = match.Seq(match.pat.a, match.Rest(match.pat.b), match.pat.c)
+    assert match.names(structure) == ["a", "b", "c"]
+
+
+def test_only_one_rest(match):
+    with pytest.raises(ValueError):
+        match.Seq(match.Rest(), match.Rest())
+
+
+@pytest.mark.parametrize("value", [[1, 2, 3], (1, 2, 3), range(1, 4)])
+def test_exact(match, value):
+    matchable = match.Matchable(value)
+    assert matchable(match.Seq(1, match.pat.b, match.pat.c))
+    assert matchable["b", "c"] == (2, 3)
+    assert not matchable(match.Seq(match.pat.a, match.pat.b))
+    assert not matchable(match.Seq(2, match.pat.b, match.pat.c))
+
+
+def test_not_sequences(match, adt):
+    class Sum(adt.Sum):
+        Pair: adt.Ctor[int, int]  # type: ignore
+
+    assert not match.Matchable("ab")(match.Seq(match.pat.a, match.pat.b))
+    assert not match.Matchable(Sum.Pair(1, 2))(match.Seq(match.pat.a, match.pat.b))
+    assert not match.Matchable({1: 2})(match.Seq(match.pat.a))
+
+
+def test_rest_view(match):
+    items = list(range(10))
+    matchable = match.Matchable(items)
+    assert matchable(match.Seq(match.pat.head, match.Rest(match.pat.tail)))
+    tail = matchable["tail"]
+    assert isinstance(tail, match.SequenceView)
+    assert tail == list(range(1, 10))
+    items[5] = "changed"
+    assert tail[4] == "changed"
+    assert tail[1:3] == [2, 3]
+    assert tail[-1] == 9
+    with pytest.raises(IndexError):
+        assert not tail[9]
+
+
+def test_rest_in_middle(match):
+    matchable = match.Matchable((1, 2, 3, 4))
+    assert matchable(match.Seq(match.pat.a, match.Rest(match.pat.b), match.pat.c))
+    assert matchable["a", "c"] == (1, 4)
+    assert matchable["b"] == (2, 3)
+    assert matchable(match.Seq(1, 2, match.Rest(match.pat.b), 3, 4))
+    assert len(matchable["b"]) == 0
+    assert not matchable(match.Seq(1, 2, 3, match.Rest(), 3, 4))
+
+
+def test_bytes(match):
+    frame = b"\x01\x02payload"
+    matchable = match.Matchable(frame)
+    assert matchable(match.Seq(1, match.pat.length, match.Rest(match.pat.body)))
+    body = matchable["body"]
+    assert isinstance(body, memoryview)
+    assert body.obj is frame
+    assert body == b"payload"
+
+
+def test_repeated_rest_is_not_nested(match):
+    value = list(range(1000))
+    total = 0
+    structure = match.Seq(match.pat.head, match.Rest(match.pat.tail))
+    while value:
+        matchable = match.Matchable(value)
+        assert matchable(structure)
+        total += matchable["head"]
+        value = matchable["tail"]
+        assert not isinstance(getattr(value, "_sequence"), match.SequenceView)
+    assert total == sum(range(1000))
@@ -0,0 +1,70 @@
+import struct
+
+import pytest
+
+
+def test_names(match):
+    structure = match.Struct(">HBxI", 0xCAFE, match.pat.tag, match.pat.length)
+    assert match.names(structure) == ["tag", "length"]
+
+
+def test_wrong_field_count(match):
+    with pytest.raises(ValueError):
+        match.Struct(">HB", match.pat.a)
+
+
+@pytest.mark.parametrize("wrap", [bytes, bytearray, memoryview])
+def test_match(match, wrap):
+    frame = wrap(struct.pack(">HBxI", 0xCAFE, 3, 70000) + b"payload")
+    matchable = match.Matchable(frame)
+    assert matchable(match.Struct(">HBxI", 0xCAFE, match.pat.tag, match.pat.length))
+    assert matchable["tag", "length"] == (3, 70000)
+    assert not matchable(match.Struct(">HBxI", 0xBEEF, match.pat._, match.pat._))
+    assert matchable(match.Struct(">HB", 0xCAFE, 3))
+    assert not matchable(match.Struct(">HB", 0xCAFE, 4))
+
+
+def test_native_alignment(match):
+    matchable = match.Matchable(struct.pack("@bi", 1, 7))
+    assert matchable(match.Struct("@bi", 1, match.pat.value))
+    assert matchable["value"] == 7
+
+
+def test_byte_strings(match):
+    structure = match.Struct("<4s2h", b"MAGI", match.pat.x, match.pat.y)
+    matchable = match.Matchable(struct.pack("<4s2h", b"MAGI", -1, 2))
+    assert matchable(structure)
+    assert matchable["x", "y"] == (-1, 2)
+    assert not match.Matchable(struct.pack("<4s2h", b"MAGE", -1, 2))(structure)
+
+
+def test_nested(match):
+    structure = match.Struct(">BH", 1, match.pat.value[match.Bind(5, kind="five")])
+    matchable = match.Matchable(b"\x01\x00\x05")
+    assert matchable(structure)
+    assert matchable["value", "kind"] == (5, "five")
+
+
+@pytest.mark.parametrize("value", [b"\x01", "\x01\x00\x05", 1, None])
+def test_mismatch(match, value):
+    assert not match.Matchable(value)(match.Struct(">BH", 1, match.pat.value))
+    assert not match.Matchable(value)(match.Struct(">BH", 1, 5))
+
+
+def test_function(match):
+    @match.function
+    def decode(frame):
+        raise ValueError(frame)
+
+    @decode.when(frame=match.Struct(">BH", 1, match.pat.value))
+    def _decode_short(value):
+        return ("short", value)
+
+    @decode.when(frame=match.Struct(">BI", 2, match.pat.value))
+    def _decode_long(value):
+        return ("long", value)
+
+    assert decode(b"\x01\x00\x05") == ("short", 5)
+    assert decode(b"\x02\x00\x01\x00\x00") == ("long", 65536)
+    with pytest.raises(ValueError):
+        decode(b"\x03")
@@ -0,0 +1,32 @@
+import pytest
+
+
+def test_names(match):
+    assert match.names(match.InstanceOf(int, match.pat.a)) == ["a"]
+    assert match.names(match.InstanceOf(int)) == []
+
+
+def test_not_a_class(match):
+    with pytest.raises(TypeError):
+        match.InstanceOf(1)
+    with pytest.raises(TypeError):
+        match.InstanceOf((int, 1))
+
+
+def test_match(match):
+    matchable = match.Matchable(True)
+    assert matchable(match.InstanceOf(int, match.pat.value))
+    assert matchable["value"] is True
+    assert matchable(match.InstanceOf((str, bool)))
+    assert not matchable(match.InstanceOf(str))
+    assert not matchable(match.InstanceOf(int, False))
+
+
+def test_uses_actual_type(match):
+    class Impostor:
+        @property
+        def __class__(self):
+            return int
+
+    assert isinstance(Impostor(), int)
+    assert not match.Matchable(Impostor())(match.InstanceOf(int))
@@ -0,0 +1,101 @@
+import asyncio
+import inspect
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def message(adt):
+    class Message(adt.Sum):
+        Ping: adt.Ctor[int]
+        Text: adt.Ctor[str]
+        Quit: adt.Ctor
+
+    return Message
+
+
+@pytest.fixture
+def handle(match, message):
+    @match.function
+    async def handle(message):
+        return None
+
+    @handle.when(message=message.Ping(match.pat.delay))
+    async def ping(delay):
+        await asyncio.sleep(delay / 1000)
+        return delay
+
+    @handle.when(message=message.Text(match.pat.text))
+    async def text(text):
+        return text.upper()
+
+    return handle
+
+
+def test_async_dispatch(handle, message):
+    coroutine = handle(message.Text("hi"))
+    assert inspect.iscoroutine(coroutine)
+    assert asyncio.run(coroutine) == "HI"
+    assert asyncio.run(handle(message.Quit())) is None
+    if hasattr(inspect, "markcoroutinefunction"):
+        assert inspect.iscoroutinefunction(handle)
+
+
+def test_sync_implementation(handle, match):
+    with pytest.raises(TypeError):
+
+        @handle.when(message=match.pat._)
+        def sync(message):
+            pass
+
+
+def test_gather_dispatch(handle, match, message):
+    messages = [message.Ping(index % 3) for index in range(10)] + [message.Quit()]
+    expected = [index % 3 for index in range(10)] + [None]
+    assert asyncio.run(match.gather_dispatch(handle, messages)) == expected
+    assert (
+        asyncio.run(match.gather_dispatch(handle, iter(messages), limit=3)) == expected
+    )
+    assert asyncio.run(match.gather_dispatch(handle, [], limit=3)) == []
+    with pytest.raises(ValueError):
+        asyncio.run(match.gather_dispatch(handle, messages, limit=0))
+
+
+def test_gather_dispatch_bounded(match):
+    running = []
+    peak = []
+
+    async def track(item):
+        running.append(item)
+        peak.append(len(running))
+        await asyncio.sleep(0)
+        running.remove(item)
+        if item == 7:
+            raise KeyError(item)
+        return item
+
+    assert asyncio.run(match.gather_dispatch(track, range(5), limit=2)) == list(
+        range(5)
+    )
+    assert max(peak) == 2
+    with pytest.raises(KeyError):
+        asyncio.run(match.gather_dispatch(track, range(20), limit=4))
+
+
+def test_gather_dispatch_cancels(match):
+    finished = []
+
+    async def fail_first(item):
+        if item == 0:
+            raise KeyError(item)
+        await asyncio.sleep(0.01)
+        finished.append(item)
+
+    async def run(limit):
+        with pytest.raises(KeyError):
+            await match.gather_dispatch(fail_first, range(5), limit=limit)
+        await asyncio.sleep(0.02)
+
+    asyncio.run(run(None))
+    asyncio.run(run(2))
+    assert finished == []
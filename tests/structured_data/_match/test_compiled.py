@@ -0,0 +1,68 @@
+import types
+
+import pytest
+
+
+@pytest.fixture
+def compiled():
+    from structured_data._match import compiled
+
+    return compiled
+
+
+@pytest.fixture
+def shape(adt):
+    class Shape(adt.Sum):
+        Circle: adt.Ctor[int]
+        Rectangle: adt.Ctor[int, int]
+
+    return Shape
+
+
+def cases(match, shape):
+    pat = match.pat
+    return [
+        (pat.x, 1),
+        (pat._, 1),
+        (1, 1),
+        (1, 2),
+        ((pat.a, 2), (1, 2)),
+        ((pat.a, 2), (1, 3)),
+        ((pat.a, pat.b), (1, 2, 3)),
+        ((pat.a, pat.b), [1, 2]),
+        ((pat.a, pat.b), shape.Rectangle(1, 2)),
+        (shape.Rectangle(pat.w, pat.h), shape.Rectangle(1, 2)),
+        (shape.Rectangle(pat.w, 3), shape.Rectangle(1, 2)),
+        (shape.Rectangle(pat.w, pat._), shape.Circle(1)),
+        (shape.Rectangle(pat.w, pat.h), (1, 2)),
+        (pat.whole[shape.Circle(pat.r)], shape.Circle(5)),
+        (pat.whole[shape.Circle(pat.r)], shape.Rectangle(5, 5)),
+        (match.Bind(shape.Circle(pat.r), extra=1), shape.Circle(5)),
+        (match.Bind(shape.Circle(pat.r), extra=1), shape.Circle),
+        (match.AttrPattern(real=pat.r, imag=0), 3),
+        (match.AttrPattern(real=pat.r, imag=0), 3j),
+        (match.AttrPattern(missing=pat.m), 3),
+        (match.DictPattern({"a": pat.a}), {"a": 1, "b": 2}),
+        (match.DictPattern({"a": pat.a}, exhaustive=True), {"a": 1, "b": 2}),
+        (match.DictPattern({"a": pat.a}, exhaustive=True), {"a": 1}),
+        (match.DictPattern({"a": pat.a}), {"b": 1}),
+        (match.AttrPattern(a=pat.a), types.SimpleNamespace(a=(1, 2))),
+        (match.InstanceOf(int, pat.i), True),
+        (match.InstanceOf((str, bytes)), 1),
+        (pat.c[match.InstanceOf(shape, shape.Circle(pat.r))], shape.Circle(5)),
+    ]
+
+
+def test_agrees_with_match(compiled, match, shape):
+    for target, value in cases(match, shape):
+        bindings = {}
+        matched = compiled.compile_target(target)(value, bindings)
+        matchable = match.Matchable(value)(target)
+        assert matched == bool(matchable), (target, value)
+        if matched:
+            assert bindings == dict(matchable.matches), (target, value)
+
+
+def test_duplicate_names(compiled, match):
+    with pytest.raises(ValueError):
+        compiled.compile_target((match.pat.a, match.pat.a))
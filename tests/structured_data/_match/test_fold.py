@@ -0,0 +1,57 @@
+import sys
+
+import pytest
+
+
+@pytest.fixture
+def algebra(expr):
+    return {
+        expr.Lit: lambda number: number,
+        expr.Neg: lambda inner: -inner,
+        expr.Add: lambda left, right: left + right,
+        expr.Label: lambda label, inner: inner,
+    }
+
+
+def test_recursive_fields(expr):
+    from structured_data._match import fold
+
+    assert fold.recursive_fields(expr.Lit) == ()
+    assert fold.recursive_fields(expr.Add) == (0, 1)
+    assert fold.recursive_fields(expr.Label) == (1,)
+
+
+def test_fold(expr, algebra, match):
+    value = expr.Add(expr.Lit(2), expr.Label("x", expr.Neg(expr.Lit(5))))
+    assert match.fold(value, algebra) == -3
+    assert match.fold(expr.Lit(1), algebra) == 1
+
+
+def test_fold_deep(expr, algebra, match):
+    value = expr.Lit(0)
+    for number in range(sys.getrecursionlimit() * 10):
+        value = expr.Add(expr.Lit(number), expr.Neg(value))
+    assert match.fold(value, {**algebra, expr.Neg: lambda inner: inner}) == sum(
+        range(sys.getrecursionlimit() * 10)
+    )
+
+
+def test_fold_shared(expr, algebra, match):
+    calls = []
+    value = expr.Lit(1)
+    for _ in range(100):
+        value = expr.Add(value, value)
+
+    def add(left, right):
+        calls.append(None)
+        return left + right
+
+    assert match.fold(value, {**algebra, expr.Add: add}) == 2**100
+    assert len(calls) == 100
+
+
+def test_fold_errors(expr, algebra, match):
+    with pytest.raises(TypeError):
+        match.fold(1, algebra)
+    with pytest.raises(ValueError):
+        match.fold(expr.Neg(expr.Lit(1)), {expr.Neg: lambda inner: -inner})
@@ -0,0 +1,51 @@
+import pickle
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def parallel_resources():
+    import test_resources.parallel
+
+    return test_resources.parallel
+
+
+def test_pickle_by_reference(parallel_resources):
+    expr = parallel_resources.Expr
+    value = expr.Add(expr.Lit(1), expr.Neg(expr.Lit(2)))
+    assert pickle.loads(pickle.dumps(value)) == value
+    assert pickle.loads(pickle.dumps(expr.Add)) is expr.Add
+    point = parallel_resources.Point(1)
+    assert pickle.loads(pickle.dumps(point)) == point
+    evaluate = parallel_resources.evaluate
+    assert pickle.loads(pickle.dumps(evaluate)) is evaluate
+    negate = pickle.loads(pickle.dumps(parallel_resources.Evaluator.negate))
+    assert negate(expr.Lit(1)) == expr.Neg(expr.Lit(1))
+
+
+def test_pickle_local_function(match):
+    @match.function
+    def local(value):
+        pass
+
+    with pytest.raises(pickle.PicklingError):
+        pickle.dumps(local)
+
+
+def test_parallel_map(match, parallel_resources):
+    expr = parallel_resources.Expr
+    values = [expr.Add(expr.Lit(index), expr.Neg(expr.Lit(1))) for index in range(50)]
+    results = match.parallel_map(
+        parallel_resources.evaluate, values, workers=2, chunksize=7
+    )
+    assert list(results) == list(range(-1, 49))
+    unordered = match.parallel_map(
+        parallel_resources.Evaluator.negate,
+        iter(values),
+        workers=2,
+        chunksize=5,
+        ordered=False,
+    )
+    assert sorted(map(parallel_resources.evaluate, unordered)) == list(range(-48, 2))
+    with pytest.raises(ValueError):
+        next(match.parallel_map(parallel_resources.evaluate, values, chunksize=0))
@@ -0,0 +1,37 @@
+import pytest
+
+
+def test_switch(adt, match):
+    class Example(adt.Sum):
+        FirstConstructor: adt.Ctor[int, str]
+        SecondConstructor: adt.Ctor[bytes]
+        ThirdConstructor: adt.Ctor
+
+    pat = match.pat
+    switch = match.Switch(
+        [
+            (Example.FirstConstructor(0, pat._), lambda: "none"),
+            (
+                Example.FirstConstructor(pat.count, pat.string),
+                lambda count, string: string * count,
+            ),
+            (pat.bytes[Example.SecondConstructor(pat._)], lambda bytes: bytes),
+            ((pat.left, pat.right), lambda left, right: left + right),
+            (Example.ThirdConstructor(), lambda: "third"),
+            (pat.other, lambda other: other),
+        ]
+    )
+    assert switch(Example.FirstConstructor(0, "a")) == "none"
+    assert switch(Example.FirstConstructor(2, "a")) == "aa"
+    assert switch(Example.SecondConstructor(b"a")) == Example.SecondConstructor(b"a")
+    assert switch(Example.ThirdConstructor()) == "third"
+    assert switch((1, 2)) == 3
+    assert switch(5) == 5
+    assert len(switch.cases) == 6
+
+
+def test_switch_no_match(match):
+    switch = match.Switch([(1, lambda: "one")])
+    assert switch(1) == "one"
+    with pytest.raises(ValueError):
+        switch(2)
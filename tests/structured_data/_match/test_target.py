@@ -0,0 +1,65 @@
+def test_target_built_once(expr, match):
+    builds = []
+
+    def add_target():
+        builds.append(None)
+        return expr.Add(match.pat.left, match.pat.right)
+
+    def evaluate(value):
+        matchable = match.Matchable(value)
+        if matchable(match.target(lambda: add_target())):
+            return evaluate(matchable["left"]) + evaluate(matchable["right"])
+        if matchable(match.target(lambda: expr.Lit(match.pat.number))):
+            return matchable["number"]
+        raise ValueError(value)
+
+    value = expr.Add(expr.Lit(1), expr.Add(expr.Lit(2), expr.Lit(3)))
+    assert evaluate(value) == 6
+    assert evaluate(value) == 6
+    assert len(builds) == 1
+
+
+def test_target_closures(match):
+    def number_target(number):
+        return match.target(lambda: (number, match.pat.rest))
+
+    assert number_target(1) is number_target(1)
+    assert number_target(1) is not number_target(2)
+    assert match.Matchable((2, 3))(number_target(2))["rest"] == 3
+
+    def list_target(values):
+        return match.target(lambda: values)
+
+    # Unhashable closures are rebuilt.
+    assert list_target([1]) == [1]
+
+
+def test_pat_attributes_cached(match):
+    assert match.pat.name is match.pat.name
+
+
+def test_target_globals(match):
+    namespace = {"match": match}
+    exec(
+        "targets = []\n"
+        "for n in range(3):\n"
+        "    targets.append(match.target(lambda: (n, match.pat.rest)))\n",
+        namespace,
+    )
+    assert [target[0] for target in namespace["targets"]] == [0, 1, 2]
+
+
+def test_target_defaults(match):
+    targets = [match.target(lambda n=n: (n, match.pat.rest)) for n in range(3)]
+    assert [target[0] for target in targets] == [0, 1, 2]
+    targets = [match.target(lambda *, n=n: (n, match.pat.rest)) for n in range(3)]
+    assert [target[0] for target in targets] == [0, 1, 2]
+
+
+def test_target_bounded(match, monkeypatch):
+    from structured_data._match import target
+
+    monkeypatch.setattr(target, "MAXSIZE", 2)
+    for number in range(5):
+        assert match.target(lambda: (number,)) == (number,)
+    assert len(target._TARGETS) <= 2
@@ -0,0 +1,87 @@
+import sys
+
+import pytest
+
+
+@pytest.fixture
+def fold_negations(expr, match):
+    def rewrite(node):
+        matchable = match.Matchable(node)
+        if matchable(expr.Neg(expr.Neg(match.pat.inner))):
+            return matchable["inner"]
+        return node
+
+    return rewrite
+
+
+def test_bottom_up(expr, fold_negations, match):
+    unchanged = expr.Add(expr.Lit(1), expr.Lit(2))
+    value = expr.Add(unchanged, expr.Neg(expr.Neg(expr.Lit(3))))
+    result = match.transform(value, fold_negations)
+    assert result == expr.Add(unchanged, expr.Lit(3))
+    assert (
+        match.Matchable(result)(expr.Add(match.pat.left, match.pat._))["left"]
+        is unchanged
+    )
+    assert match.transform(unchanged, fold_negations) is unchanged
+
+
+def test_bottom_up_sees_rewritten_children(expr, match):
+    def simplify(node):
+        matchable = match.Matchable(node)
+        if matchable(expr.Add(expr.Lit(0), expr.Lit(0))):
+            return expr.Lit(0)
+        if matchable(expr.Neg(expr.Lit(0))):
+            return expr.Lit(0)
+        return node
+
+    value = expr.Add(expr.Neg(expr.Lit(0)), expr.Add(expr.Lit(0), expr.Lit(0)))
+    assert match.transform(value, simplify) == expr.Lit(0)
+
+
+def test_top_down(expr, match):
+    def push_negation(node):
+        matchable = match.Matchable(node)
+        if matchable(expr.Neg(expr.Add(match.pat.left, match.pat.right))):
+            return expr.Add(expr.Neg(matchable["left"]), expr.Neg(matchable["right"]))
+        return node
+
+    value = expr.Neg(expr.Add(expr.Lit(1), expr.Add(expr.Lit(2), expr.Lit(3))))
+    assert match.transform(value, push_negation, top_down=True) == expr.Add(
+        expr.Neg(expr.Lit(1)), expr.Add(expr.Neg(expr.Lit(2)), expr.Neg(expr.Lit(3)))
+    )
+
+
+def test_shared_and_deep(expr, fold_negations, match):
+    calls = []
+
+    def count(node):
+        calls.append(node)
+        return node
+
+    value = expr.Lit(1)
+    for _ in range(100):
+        value = expr.Add(value, value)
+    assert match.transform(value, count) is value
+    assert len(calls) == 101
+
+    original = value
+    for _ in range(sys.getrecursionlimit() * 10):
+        value = expr.Neg(expr.Neg(value))
+    assert match.transform(value, fold_negations) is original
+
+
+def test_products(point, expr, match):
+    def increment(node):
+        matchable = match.Matchable(node)
+        if matchable(expr.Lit(match.pat.number)):
+            return expr.Lit(matchable["number"] + 1)
+        return node
+
+    value = point(expr.Lit(1), 2)
+    assert match.transform(value, increment) == point(expr.Lit(2), 2)
+    with pytest.raises(TypeError):
+        match.transform(1, increment)
+    # Instances in other containers aren't visited.
+    value = point([expr.Lit(1)])
+    assert match.transform(value, increment) is value
@@ -43,6 +43,20 @@ def data():
     return data
 
 
+@pytest.fixture(scope="session")
+def expr():
+    import test_resources.adt_examples
+
+    return test_resources.adt_examples.Expr
+
+
+@pytest.fixture(scope="session")
+def point():
+    import test_resources.adt_examples
+
+    return test_resources.adt_examples.Point
+
+
 @pytest.fixture(scope="session")
 def adt_options():
     import test_resources.adt_options
@@ -0,0 +1,74 @@
+import gc
+
+import pytest
+
+
+@pytest.fixture
+def dispatching_expr(adt, match):
+    # Unlike the shared Expr, this needs its own dispatch methods, which start
+    # out cold in every test.
+    class Expr(adt.Sum):
+        Lit: adt.Ctor[int]
+        Neg: adt.Ctor["Expr"]  # noqa: F821
+
+        @match.function
+        def simplify(self):
+            return self
+
+        @match.function
+        @property
+        def depth(self):
+            return 0
+
+    @match.Placeholder
+    def double_negation(cls):
+        return cls.Neg(cls.Neg(match.pat.inner))
+
+    Expr.simplify.when(self=double_negation)(lambda inner: inner)
+
+    @Expr.depth.get_when(Expr.Neg(match.pat.inner))
+    def _depth_neg(inner):
+        return inner.depth + 1
+
+    return Expr
+
+
+def test_warmup_classes(dispatching_expr, structured_data):
+    expr = dispatching_expr
+    simplify = vars(expr)["simplify"]
+    depth = vars(expr)["depth"]
+    assert expr not in simplify.matchers._cache
+    structured_data.warmup(classes=[expr])
+    assert expr in simplify.matchers._cache
+    assert expr in depth.get_matchers._cache
+    assert "_call_plan" in vars(simplify)
+    assert expr in simplify._proxies
+    assert expr.Neg(expr.Neg(expr.Lit(1))).simplify() == expr.Lit(1)
+    assert expr.Neg(expr.Lit(1)).depth == 1
+
+
+def test_warmup_modules(structured_data):
+    from test_resources import parallel
+
+    structured_data.warmup(modules=["test_resources.parallel"])
+    assert None in parallel.evaluate.matchers._cache
+    assert None in vars(parallel.Evaluator)["negate"].matchers._cache
+    assert parallel.evaluate(parallel.Expr.Neg(parallel.Expr.Lit(1))) == -1
+
+
+def test_warmup_placeholders(structured_data):
+    from test_resources import parallel
+
+    structured_data.warmup(modules=["test_resources.parallel"])
+    assert parallel.Expr in parallel.simplify.matchers._cache
+    assert None not in parallel.simplify.matchers._cache
+    expr = parallel.Expr.Neg(parallel.Expr.Neg(parallel.Expr.Lit(1)))
+    assert parallel.simplify(expr) == parallel.Expr.Lit(1)
+
+
+def test_warmup_freeze(structured_data):
+    try:
+        structured_data.warmup(freeze=True)
+        assert gc.get_freeze_count() > 0
+    finally:
+        gc.unfreeze()
@@ -0,0 +1,152 @@
+import array
+import io
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def codec():
+    from structured_data import codec
+
+    return codec
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        None,
+        True,
+        False,
+        0,
+        -1,
+        2 ** 70,
+        -(2 ** 70),
+        1.5,
+        "",
+        "snowman ☃",
+        b"\x00\xff",
+        (),
+        (1, "a"),
+        [1, [2, [3]]],
+        {"a": 1, 2: [None]},
+    ],
+)
+def test_primitive_round_trip(codec, expr, value):
+    codec_ = codec.Codec(expr)
+    assert codec_.loads(codec_.dumps(value)) == value
+
+
+def test_adt_round_trip(codec, expr, point):
+    codec_ = codec.Codec(expr, point)
+    value = [expr.Add(expr.Lit(1), expr.Empty()), point(3, -4), (point(1),)]
+    assert codec_.loads(codec_.dumps(value)) == value
+
+
+def test_compact(codec, expr):
+    codec_ = codec.Codec(expr)
+    header = len(codec_.dumps(None)) - 1
+    # One byte for the tag of each node, two for each integer.
+    assert len(codec_.dumps(expr.Add(expr.Lit(1), expr.Lit(2)))) == header + 7
+
+
+def test_deep_value(codec, expr):
+    codec_ = codec.Codec(expr)
+    value = expr.Lit(0)
+    for index in range(10000):
+        value = expr.Add(expr.Lit(index), value)
+    decoded = codec_.loads(codec_.dumps(value))
+    for index in reversed(range(10000)):
+        assert decoded.__class__ is expr.Add
+        assert tuple.__getitem__(decoded, 0) == expr.Lit(index)
+        decoded = tuple.__getitem__(decoded, 1)
+    assert decoded == expr.Lit(0)
+
+
+def test_share(codec, expr):
+    codec_ = codec.Codec(expr)
+    value = expr.Lit(1)
+    for _ in range(50):
+        value = expr.Add(value, value)
+    data = codec_.dumps(value, share=True)
+    assert len(data) < 500
+    decoded = codec_.loads(data)
+    for _ in range(50):
+        assert decoded.__class__ is expr.Add
+        assert tuple.__getitem__(decoded, 0) is tuple.__getitem__(decoded, 1)
+        decoded = tuple.__getitem__(decoded, 0)
+    assert decoded == expr.Lit(1)
+
+
+def test_many_types(codec, adt):
+    namespace = {f"C{index}": adt.Ctor[int] for index in range(300)}
+    big = type("Big", (adt.Sum,), {"__annotations__": namespace})
+    codec_ = codec.Codec(big)
+    value = [big.C0(1), big.C299(2)]
+    assert codec_.loads(codec_.dumps(value)) == value
+
+
+def test_stream(codec, expr, point):
+    codec_ = codec.Codec(expr, point)
+    values = [expr.Lit(index) for index in range(10)] + [point(1, 2)]
+    file = io.BytesIO()
+    codec_.dump_iter(values, file)
+    file.seek(0)
+    assert list(codec_.load_iter(file)) == values
+
+
+def test_zero_copy(codec, expr):
+    codec_ = codec.Codec(expr)
+    data = bytearray(codec_.dumps([b"abc", "abc"]))
+    bytes_, str_ = codec_.loads(memoryview(data), zero_copy=True)
+    assert isinstance(bytes_, memoryview)
+    assert bytes_ == b"abc"
+    assert str_ == "abc"
+    data[-8] = ord("x")
+    assert bytes_ == b"xbc"
+
+
+def test_memoryview_formats(codec, expr):
+    codec_ = codec.Codec(expr)
+    ints = array.array("i", [1, 2])
+    assert codec_.loads(codec_.dumps(memoryview(ints))) == ints.tobytes()
+    strided = memoryview(b"abcdef")[::2]
+    assert codec_.loads(codec_.dumps(strided)) == b"ace"
+
+
+def test_fingerprint(codec, expr, point):
+    assert codec.Codec(expr).fingerprint == codec.Codec(expr).fingerprint
+    assert codec.Codec(expr).fingerprint != codec.Codec(point).fingerprint
+    with pytest.raises(ValueError):
+        codec.Codec(point).loads(codec.Codec(expr).dumps(None))
+
+
+def test_errors(codec, expr):
+    codec_ = codec.Codec(expr)
+    with pytest.raises(TypeError):
+        codec_.dumps(object())
+    with pytest.raises(TypeError):
+        codec.Codec(int)
+    with pytest.raises(ValueError):
+        codec_.loads(b"")
+    with pytest.raises(ValueError):
+        codec_.loads(codec_.dumps(None) + b"\x00")
+
+
+def test_corrupt(codec, expr):
+    codec_ = codec.Codec(expr)
+    data = codec_.dumps(expr.Add(expr.Lit(1), expr.Lit(300)))
+    for end in range(len(data)):
+        with pytest.raises(ValueError):
+            codec_.loads(data[:end])
+    start = codec._HEADER.size
+    header = data[:start]
+    with pytest.raises(ValueError):
+        codec_.loads(header + bytes([codec._ADT, 100]))
+    with pytest.raises(ValueError):
+        codec_.loads(header + bytes([codec._REF, 0]))
+    with pytest.raises(ValueError):
+        codec_.loads(header + bytes([codec._FLOAT, 0]))
+    # A record whose length prefix agrees with its truncated contents.
+    record = data[start:-1]
+    with pytest.raises(ValueError):
+        list(codec_.load_iter(io.BytesIO(header + bytes([len(record)]) + record)))
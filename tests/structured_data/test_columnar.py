@@ -0,0 +1,186 @@
+import array
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def columnar():
+    from structured_data import columnar
+
+    return columnar
+
+
+@pytest.fixture(scope="session")
+def point(adt):
+    class Point(adt.Product):
+        x: int
+        y: float
+        label: str = ""
+
+    return Point
+
+
+def test_specialization(columnar, point):
+    assert columnar.ProductArray[point] is columnar.ProductArray[point]
+    assert columnar.ProductArray[point].product is point
+    with pytest.raises(TypeError):
+        columnar.ProductArray()
+    with pytest.raises(TypeError):
+        assert not columnar.ProductArray[int]
+
+
+def test_columns(columnar, point):
+    points = columnar.ProductArray[point].from_iterable(
+        point(index, index / 2, str(index)) for index in range(4)
+    )
+    assert len(points) == 4
+    assert points.column("x") == array.array("q", [0, 1, 2, 3])
+    assert points.column("y") == array.array("d", [0.0, 0.5, 1.0, 1.5])
+    assert points.column("label") == ["0", "1", "2", "3"]
+    with pytest.raises(AttributeError):
+        points.column("z")
+
+
+def test_rows(columnar, point):
+    points = columnar.ProductArray[point]([point(1, 2.0), point(3, 4.0)])
+    row = points[-1]
+    assert row.x == 3
+    assert row.y == 4.0
+    assert row == point(3, 4.0)
+    assert row != points[0]
+    assert row.materialize() == point(3, 4.0)
+    assert list(points) == [point(1, 2.0), point(3, 4.0)]
+    with pytest.raises(IndexError):
+        assert not points[2]
+    with pytest.raises(TypeError):
+        points.append((1, 2.0, ""))
+
+
+def test_mixed_types(columnar, point):
+    points = columnar.ProductArray[point]([point(1, 2.0), point(True, 2**70)])
+    assert points.materialize() == [point(1, 2.0), point(True, 2**70)]
+    assert points[1].x is True
+    assert isinstance(points.column("x"), list)
+
+
+def test_overflow(columnar, adt):
+    class Wide(adt.Product):
+        y: str
+        x: int
+
+    wide = columnar.ProductArray[Wide]()
+    wide.append(Wide("a", 2**70))
+    wide.append(Wide("b", 1))
+    assert wide.materialize() == [Wide("a", 2**70), Wide("b", 1)]
+    assert isinstance(wide.column("x"), list)
+
+
+def test_filter_sort_take(columnar, point):
+    points = columnar.ProductArray[point](
+        point(index % 3, float(-index)) for index in range(6)
+    )
+    odd = points.filter(lambda x, y: x == 1 or y < -4, "x", "y")
+    assert odd.materialize() == [point(1, -1.0), point(1, -4.0), point(2, -5.0)]
+    assert points.sort("x", "y").materialize() == [
+        point(0, -3.0),
+        point(0, 0.0),
+        point(1, -4.0),
+        point(1, -1.0),
+        point(2, -5.0),
+        point(2, -2.0),
+    ]
+    assert points.sort("y", reverse=True)[:2].materialize() == [
+        point(0, 0.0),
+        point(1, -1.0),
+    ]
+    assert points.sort().column("x") == array.array("q", [0, 0, 1, 1, 2, 2])
+    assert isinstance(points.take([1]).column("x"), array.array)
+
+
+def test_numpy(columnar, point):
+    numpy = pytest.importorskip("numpy")
+    points = columnar.ProductArray[point]([point(1, 2.0)])
+    assert numpy.array_equal(points.as_numpy("x"), [1])
+
+
+@pytest.fixture(scope="session")
+def event(adt):
+    class Event(adt.Sum):
+        Click: adt.Ctor[int, int]
+        Key: adt.Ctor[str]
+        Close: adt.Ctor
+
+    return Event
+
+
+@pytest.fixture
+def events(columnar, event):
+    return columnar.SumVector[event](
+        [
+            event.Click(0, 0),
+            event.Key("a"),
+            event.Close(),
+            event.Click(1, 0),
+            event.Key("b"),
+            event.Click(1, 2),
+        ]
+    )
+
+
+def test_vector_specialization(columnar, event, point):
+    assert columnar.SumVector[event] is columnar.SumVector[event]
+    assert columnar.SumVector[event].constructors == (
+        event.Click,
+        event.Key,
+        event.Close,
+    )
+    with pytest.raises(TypeError):
+        columnar.SumVector()
+    with pytest.raises(TypeError):
+        assert not columnar.SumVector[point]
+
+
+def test_vector_access(events, event):
+    assert len(events) == 6
+    assert events[1] == event.Key("a")
+    assert events[-1] == event.Click(1, 2)
+    assert events[2:4].materialize() == [event.Close(), event.Click(1, 0)]
+    assert list(events)[0] == event.Click(0, 0)
+    assert events._tags.typecode == "B"
+    with pytest.raises(TypeError):
+        events.append(None)
+
+
+def test_vector_overflow(columnar, event):
+    events = columnar.SumVector[event]()
+    events.append(event.Click(2**70, 0))
+    events.append(event.Click(1, 2**70))
+    assert events.materialize() == [event.Click(2**70, 0), event.Click(1, 2**70)]
+    assert events.count_by_constructor()[event.Click] == 2
+
+
+def test_vector_queries(events, event):
+    assert events.count_by_constructor() == {
+        event.Click: 3,
+        event.Key: 2,
+        event.Close: 1,
+    }
+    assert events.select(event.Key).materialize() == [event.Key("a"), event.Key("b")]
+    parts = events.partition()
+    assert parts[event.Close].materialize() == [event.Close()]
+    assert len(parts[event.Click]) == 3
+    assert events.column(event.Click, 0) == array.array("q", [0, 1, 1])
+
+
+def test_vector_where(events, event, match):
+    assert events.where(event.Click(1, match.pat.y)).materialize() == [
+        event.Click(1, 0),
+        event.Click(1, 2),
+    ]
+    assert events.where(event.Click(match.pat._, 0)).materialize() == [
+        event.Click(0, 0),
+        event.Click(1, 0),
+    ]
+    assert events.where(event.Close()).materialize() == [event.Close()]
+    with pytest.raises(ValueError):
+        events.where(event.Key(match.pat.a[match.pat.b]))
@@ -0,0 +1,104 @@
+import io
+import json
+import typing
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def json_codec():
+    from structured_data import json_codec
+
+    return json_codec
+
+
+@pytest.fixture(scope="session")
+def tree(adt):
+    class Tree(adt.Sum):
+        Leaf: adt.Ctor[int]
+        Node: adt.Ctor["Tree", "Tree"]  # noqa: F821
+        Many: adt.Ctor[typing.List["Tree"]]  # noqa: F821
+        Empty: adt.Ctor
+
+    return Tree
+
+
+@pytest.fixture(scope="session")
+def record(adt, tree):
+    class Record(adt.Product):
+        name: str
+        root: tree
+        tags: typing.Tuple[str, ...] = ()
+        parent: typing.Optional[tree] = None
+        lookup: typing.Dict[str, tree] = {}
+
+    return Record
+
+
+def test_sum(json_codec, tree):
+    value = tree.Node(tree.Leaf(1), tree.Many([tree.Empty(), tree.Leaf(2)]))
+    data = json_codec.to_json(value)
+    assert data == {"Node": [{"Leaf": [1]}, {"Many": [[{"Empty": []}, {"Leaf": [2]}]]}]}
+    assert json_codec.from_json(json.loads(json.dumps(data)), tree) == value
+
+
+def test_product(json_codec, tree, record):
+    value = record("a", tree.Leaf(1), ("x", "y"), tree.Empty(), {"key": tree.Leaf(2)})
+    data = json.loads(json.dumps(json_codec.to_json(value)))
+    assert data["tags"] == ["x", "y"]
+    assert json_codec.from_json(data, record) == value
+
+
+def test_key_order(json_codec, tree, record):
+    lookup = {"b": tree.Leaf(1), "a": tree.Leaf(2)}
+    data = json_codec.to_json(record("a", tree.Leaf(1), lookup=lookup))
+    assert list(data) == ["name", "root", "tags", "parent", "lookup"]
+    assert list(data["lookup"]) == ["b", "a"]
+
+
+def test_product_defaults(json_codec, tree, record):
+    assert json_codec.from_json({"name": "a", "root": {"Leaf": [3]}}, record) == record(
+        "a", tree.Leaf(3)
+    )
+    with pytest.raises(TypeError):
+        json_codec.from_json({"name": "a"}, record)
+
+
+def test_annotation_target(json_codec, tree):
+    assert json_codec.from_json([{"Leaf": [1]}], typing.List[tree]) == [tree.Leaf(1)]
+
+
+def test_deep(json_codec, tree):
+    value = tree.Leaf(0)
+    for index in range(5000):
+        value = tree.Node(tree.Leaf(index), value)
+    data = json_codec.to_json(value)
+    decoded = json_codec.from_json(data, tree)
+    for index in reversed(range(5000)):
+        assert tuple.__getitem__(decoded, 0) == tree.Leaf(index)
+        decoded = tuple.__getitem__(decoded, 1)
+    assert decoded == tree.Leaf(0)
+
+
+def test_bad_data(json_codec, tree, record):
+    with pytest.raises(ValueError):
+        json_codec.from_json({"Missing": []}, tree)
+    with pytest.raises(ValueError):
+        json_codec.from_json({"Leaf": [1, 2]}, tree)
+    with pytest.raises(ValueError):
+        json_codec.from_json({"Leaf": 5}, tree)
+    with pytest.raises(ValueError):
+        json_codec.from_json({"Many": [5]}, tree)
+    with pytest.raises(ValueError):
+        json_codec.from_json([], tree)
+    with pytest.raises(ValueError):
+        json_codec.from_json({"name": "a", "root": {"Empty": []}, "lookup": 5}, record)
+
+
+def test_lines(json_codec, tree):
+    values = [tree.Leaf(index) for index in range(5)]
+    file = io.StringIO()
+    json_codec.dump_lines(values, file)
+    file.seek(0)
+    assert len(file.getvalue().splitlines()) == 5
+    assert list(json_codec.load_lines(file, tree)) == values
@@ -0,0 +1,140 @@
+import os
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def store_module():
+    from structured_data import store
+
+    return store
+
+
+@pytest.fixture(scope="session")
+def reading(adt):
+    class Reading(adt.Sum):
+        Temperature: adt.Ctor[int, float]
+        Offline: adt.Ctor[int]
+        Reset: adt.Ctor
+
+    return Reading
+
+
+@pytest.fixture(scope="session")
+def message(adt):
+    class Message(adt.Sum):
+        Text: adt.Ctor[int, str]
+        Blob: adt.Ctor[bytes, bool]
+
+    return Message
+
+
+@pytest.fixture(scope="session")
+def entry(adt):
+    class Entry(adt.Product):
+        key: str
+        count: int = 0
+
+    return Entry
+
+
+def test_fixed_layout(store_module, reading, tmp_path):
+    path = tmp_path / "readings"
+    values = [reading.Temperature(1, 20.5), reading.Offline(2), reading.Reset()]
+    with store_module.Store(path, reading) as store:
+        assert len(store) == 0
+        assert list(store) == []
+        store.extend(values)
+        assert len(store) == 3
+        assert store[1] == reading.Offline(2)
+    assert not os.path.exists(str(path) + ".idx")
+    # A 17-byte header, and 17-byte records: a tag, an int, and a float.
+    assert os.path.getsize(path) == 17 + 3 * 17
+    with store_module.Store(path, reading) as store:
+        assert list(store) == values
+        assert store[-1] == reading.Reset()
+        store.append(reading.Offline(3))
+        assert list(store.scan(reading.Offline)) == [
+            reading.Offline(2),
+            reading.Offline(3),
+        ]
+        with pytest.raises(IndexError):
+            assert not store[4]
+    assert os.path.getsize(path) == 17 + 4 * 17
+
+
+def test_variable_layout(store_module, message, tmp_path):
+    path = tmp_path / "messages"
+    values = [message.Text(1, "héllo"), message.Blob(b"\0\1", True)] * 3
+    with store_module.Store(path, message) as store:
+        assert list(store) == []
+        store.extend(values)
+        assert list(store) == values
+    with store_module.Store(path, message) as store:
+        assert len(store) == 6
+        assert store[3] == message.Blob(b"\0\1", True)
+        assert list(store.scan(message.Text)) == [message.Text(1, "héllo")] * 3
+        assert list(store.scan(message.Text, message.Blob)) == values
+
+
+def test_append_during_scan(store_module, message, tmp_path):
+    path = tmp_path / "messages"
+    with store_module.Store(path, message) as store:
+        store.extend([message.Text(1, "a"), message.Text(2, "b")])
+        scan = iter(store)
+        assert next(scan) == message.Text(1, "a")
+        store.append(message.Text(3, "c"))
+        assert len(store) == 3
+        assert store[2] == message.Text(3, "c")
+        assert list(scan) == [message.Text(2, "b")]
+        unfinished = iter(store)
+        assert next(unfinished) == message.Text(1, "a")
+    assert list(unfinished) == [message.Text(2, "b"), message.Text(3, "c")]
+    with store_module.Store(path, message) as store:
+        assert len(store) == 3
+
+
+def test_product(store_module, entry, tmp_path):
+    path = tmp_path / "entries"
+    with store_module.Store(path, entry) as store:
+        store.extend([entry("a", 1), entry("b")])
+        assert list(store) == [entry("a", 1), entry("b", 0)]
+
+
+def test_errors(store_module, reading, message, adt, tmp_path):
+    path = tmp_path / "readings"
+    with store_module.Store(path, reading) as store:
+        with pytest.raises(TypeError):
+            store.append(message.Text(1, ""))
+        with pytest.raises(TypeError):
+            store.append(reading.Offline(1.5))
+    with pytest.raises(ValueError):
+        store_module.Store(path, message)
+    with store_module.Store(tmp_path / "messages", message) as store:
+        with pytest.raises(TypeError):
+            store.append(message.Text(1, b""))
+    with pytest.raises(TypeError):
+        store_module.Store(tmp_path / "ints", int)
+
+    class Nested(adt.Sum):
+        Wrap: adt.Ctor[list]
+
+    with pytest.raises(TypeError):
+        store_module.Store(tmp_path / "nested", Nested)
+
+
+def test_field_types_checked(store_module, adt, tmp_path):
+    path = tmp_path / "values"
+
+    class Value(adt.Product):
+        a: int
+
+    with store_module.Store(path, Value) as store:
+        store.append(Value(1))
+
+    class Changed(adt.Product):
+        a: float
+
+    Changed.__qualname__ = Value.__qualname__
+    with pytest.raises(ValueError):
+        store_module.Store(path, Changed)
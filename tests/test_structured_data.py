@@ -1,2 +1,19 @@
+import os
+import subprocess
+import sys
+
+
 def test_main(structured_data):
     assert structured_data
+
+
+def test_lazy_warmup(structured_data):
+    code = (
+        "import sys, structured_data\n"
+        "assert 'structured_data._warmup' not in sys.modules\n"
+        "assert structured_data.warmup\n"
+        "assert 'structured_data._warmup' in sys.modules\n"
+    )
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    subprocess.run([sys.executable, "-c", code], check=True, env=env)
+    assert structured_data.warmup is structured_data._warmup.warmup